@@ -3,6 +3,8 @@
 이 설정들은 새로운 설정이 저장되기 전까지 기본값으로 사용됩니다.
 """
 
+from copy import deepcopy
+
 from core.constants import DEFAULT_COIN_SELECTION
 from .order_defaults import DEFAULT_BUY_SETTINGS, DEFAULT_SELL_SETTINGS
 
@@ -81,3 +83,12 @@ DEFAULT_SETTINGS = {
         "enabled": False
     }
 }
+
+
+def get_default_settings() -> dict:
+    """수정해도 DEFAULT_SETTINGS 에 영향이 없는 기본 설정 사본 반환
+
+    DEFAULT_SETTINGS 는 읽기 전용으로 공유한다. .copy() 는 중첩 dict 를 공유하므로
+    값을 바꿀 사본이 필요한 곳에서만 이 함수로 깊은 복사를 한다.
+    """
+    return deepcopy(DEFAULT_SETTINGS)
@@ -45,6 +45,7 @@
 """
 
 import json
+from copy import deepcopy
 from pathlib import Path
 from typing import Dict, Any
 import logging
@@ -52,6 +53,7 @@ import os
 from config.order_defaults import DEFAULT_BUY_SETTINGS, DEFAULT_SELL_SETTINGS
 from config.default_settings import DEFAULT_SETTINGS
 from config.logging_config import setup_logging
+from . import json_utils
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -118,7 +120,8 @@ class Config:
     """
     
     # 기본 설정값은 config.default_settings 모듈의 값을 사용한다.
-    DEFAULT_CONFIG = DEFAULT_SETTINGS.copy()
+    # 읽기 전용으로 공유하며, 수정할 설정은 deepcopy 로 만든다.
+    DEFAULT_CONFIG = DEFAULT_SETTINGS
     
     def __init__(self):
         """
@@ -181,9 +184,9 @@ class Config:
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                    loaded_config = json_utils.load(f)
                     # 기본값에 로드된 설정 업데이트
-                    config = self.DEFAULT_CONFIG.copy()
+                    config = deepcopy(self.DEFAULT_CONFIG)
                     config.update(loaded_config)
                     
                     # 설정 검증
@@ -191,7 +194,7 @@ class Config:
                     return config
             
             logger.warning("설정 파일이 없습니다. 기본값을 사용합니다.")
-            return self.DEFAULT_CONFIG.copy()
+            return deepcopy(self.DEFAULT_CONFIG)
             
         except json.JSONDecodeError as e:
             raise ConfigError(f"설정 파일 형식이 잘못되었습니다: {e}")
@@ -218,13 +221,8 @@ class Config:
                 - 파일 시스템 관련 오류
         """
         try:
-            # 임시 파일에 먼저 저장
-            temp_file = self.config_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            
-            # 성공적으로 저장되면 원본 파일 교체
-            temp_file.replace(self.config_file)
+            # 임시 파일에 저장 후 원본 파일 교체
+            json_utils.write_atomic(self.config_file, self.config)
             logger.info("설정이 성공적으로 저장되었습니다.")
             
         except Exception as e:
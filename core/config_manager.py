@@ -33,6 +33,7 @@
 """
 
 import json
+from copy import deepcopy
 from pathlib import Path
 from typing import Dict, Any
 import logging
@@ -40,6 +41,7 @@ from config.logging_config import setup_logging
 
 # config 모듈을 backend_config 이름으로 임포트하여 가독성을 높인다.
 from . import config as backend_config
+from . import json_utils
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -79,7 +81,8 @@ class ConfigManager:
         self.config_file = Path(__file__).parent.parent / 'config.json'
 
         # Config 모듈의 기본 설정을 그대로 사용해 두 클래스 간 일관성을 유지한다.
-        self.default_config = backend_config.Config.DEFAULT_CONFIG.copy()
+        # 읽기 전용으로 공유하고, self.config 는 깊은 복사본에서 시작한다.
+        self.default_config = backend_config.Config.DEFAULT_CONFIG
 
         # 설정 파일 로드 (없으면 기본값 사용)
         self.load_config()
@@ -89,9 +92,9 @@ class ConfigManager:
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                    loaded_config = json_utils.load(f)
                     # 기본값에 로드된 설정 업데이트 (중첩 구조만 사용)
-                    self.config = self.default_config.copy()
+                    self.config = deepcopy(self.default_config)
                     self._deep_update(self.config, self._extract_nested_config(loaded_config))
 
                     # 평면 구조 값도 함께 반영
@@ -104,11 +107,11 @@ class ConfigManager:
                         if key in loaded_config:
                             self.config[key] = loaded_config[key]
             else:
-                self.config = self.default_config.copy()
+                self.config = deepcopy(self.default_config)
                 self.save_config()
         except Exception as e:
             logger.error(f"설정 파일 로드 실패: {e}")
-            self.config = self.default_config.copy()
+            self.config = deepcopy(self.default_config)
     
     def _extract_nested_config(self, config):
         """평면 구조의 설정을 필요한 부분만 중첩 구조로 변환"""
@@ -177,13 +180,8 @@ class ConfigManager:
            - 권한 문제
         """
         try:
-            # 임시 파일에 먼저 저장
-            temp_file = self.config_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            
-            # 성공적으로 저장되면 원본 파일 교체
-            temp_file.replace(self.config_file)
+            # 임시 파일에 저장 후 원본 파일 교체
+            json_utils.write_atomic(self.config_file, self.config)
             
             # config.py의 설정값 업데이트
             backend_config.config_instance.update_config(self.config)
@@ -305,12 +303,7 @@ class ConfigManager:
                     self.config[k] = v
             
             # 설정 파일 저장
-            temp_file = self.config_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            
-            # 성공적으로 저장되면 원본 파일 교체
-            temp_file.replace(self.config_file)
+            json_utils.write_atomic(self.config_file, self.config)
             
             # 백엔드 설정 동기화
             backend_config.config_instance.update_config(self.config)
@@ -0,0 +1,93 @@
+"""
+설정 파일 JSON 읽기/쓰기 공용 함수
+
+config.json 을 읽고 쓰는 모듈(web.app, MarketAnalyzer, ConfigManager, Config)이
+같은 파서를 사용하도록 한 곳에 모아 둔다. orjson 이 설치되어 있으면 orjson 으로,
+없으면 표준 json 으로 처리한다.
+"""
+
+import json
+import os
+import tempfile
+from copy import deepcopy
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    orjson = None
+
+if orjson is not None:
+    _DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def loads(data):
+    """JSON 문자열/바이트 파싱 (오류 시 json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(f):
+    """열린 파일 객체에서 JSON 파싱"""
+    return loads(f.read())
+
+
+@lru_cache(maxsize=16)
+def _load_file(path: str, mtime_ns: int, size: int):
+    with open(path, 'rb') as f:
+        return load(f)
+
+
+def load_file_cached(path):
+    """JSON 파일을 읽어 호출자 전용 사본으로 반환
+
+    (경로, 수정 시각, 크기)가 같으면 다시 읽지 않고 앞서 파싱한 결과를 복사해 준다.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return deepcopy(_load_file(path, st.st_mtime_ns, st.st_size))
+
+
+def dumps(obj) -> str:
+    """설정 파일 저장용 JSON 문자열 (공백 없이 기록, 한글은 그대로 기록)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_DUMP_OPTIONS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps_pretty(obj) -> str:
+    """사람이 읽기 위한 들여쓰기 JSON 문자열 (설정 내보내기용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_DUMP_OPTIONS | orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=4, ensure_ascii=False)
+
+
+def write_atomic(path, obj) -> None:
+    """설정 파일을 같은 폴더의 임시 파일에 쓰고 fsync 한 뒤 os.replace 로 교체
+
+    쓰는 도중 프로세스가 종료되어도 기존 파일이 그대로 남는다.
+    """
+    write_text_atomic(path, dumps(obj))
+
+
+def write_text_atomic(path, text: str) -> None:
+    """이미 직렬화한 JSON 문자열을 write_atomic 과 같은 방식으로 기록"""
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            # mkstemp 는 0600 으로 만들므로 기존 파일 권한 유지
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -121,7 +121,7 @@ class TradingLogger:
         self.logger.info(msg)
         if self.telegram:
             try:
-                self.telegram.send_trade_alert_sync(action, market, price, volume)
+                self.telegram.send_trade_alert_sync(action, market, price, volume, profit, reason, wait=False)
             except Exception:
                 pass
         
@@ -144,7 +144,7 @@ class TradingLogger:
         self.logger.info(f"[{market}] {signal_type} 조건: {conditions_str}")
         if self.telegram:
             try:
-                self.telegram.send_message_sync(f"[{market}] {signal_type} 조건: {conditions_str}")
+                self.telegram.send_message_sync(f"[{market}] {signal_type} 조건: {conditions_str}", wait=False)
             except Exception:
                 pass
         
@@ -160,7 +160,7 @@ class TradingLogger:
         self.logger.error(error_msg, exc_info=exc_info)
         if self.telegram:
             try:
-                self.telegram.send_error_alert_sync(error_msg)
+                self.telegram.send_error_alert_sync(error_msg, wait=False)
             except Exception:
                 pass
         
@@ -183,7 +183,7 @@ class TradingLogger:
         self.logger.warning(msg)
         if self.telegram:
             try:
-                self.telegram.send_system_status_sync(msg)
+                self.telegram.send_system_status_sync(msg, wait=False)
             except Exception:
                 pass
         
@@ -204,7 +204,7 @@ class TradingLogger:
         if self.telegram:
             try:
                 message = "\n".join(f"{k}: {v}" for k, v in metrics.items())
-                self.telegram.send_system_status_sync(f"[성과 지표]\n{message}")
+                self.telegram.send_system_status_sync(f"[성과 지표]\n{message}", wait=False)
             except Exception:
                 pass
         
@@ -226,6 +226,6 @@ class TradingLogger:
         if self.telegram:
             try:
                 message = "\n".join(f"{k}: {v}" for k, v in risk_metrics.items())
-                self.telegram.send_system_status_sync(f"[위험 관리]\n{message}")
+                self.telegram.send_system_status_sync(f"[위험 관리]\n{message}", wait=False)
             except Exception:
                 pass
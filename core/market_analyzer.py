@@ -23,6 +23,7 @@ import numpy as np
 from datetime import datetime, timedelta
 import json
 import os
+from copy import deepcopy
 import requests
 from typing import Dict, Tuple, List, Optional, Any
 import pandas as pd
@@ -36,24 +37,42 @@ from urllib.parse import urlencode
 from dotenv import load_dotenv
 import threading
 import time
-from collections import deque
+from bisect import bisect_right
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from .constants import DEFAULT_COIN_SELECTION, MIN_HOLDING_VALUE
-import math
+from . import json_utils
 from config.default_settings import (
     DEFAULT_SETTINGS,
     DEFAULT_BUY_SETTINGS,
     DEFAULT_SELL_SETTINGS,
+    get_default_settings,
 )
-from .order_manager import OrderManager
+from .order_manager import OrderManager, TICK_SIZE_BOUNDS, TICK_SIZES, get_tick_size, pre_sell_target_price
 from .upbit_api import UpbitAPI
 from . import monitoring_coin
+from trading.indicators.technical import calculate_score_indicators, calculate_trade_strength, StreamingMACD
 
 # 환경변수 로드
 dotenv_path = Path(__file__).resolve().parents[1] / '.env'
 load_dotenv(dotenv_path)
 logger = logging.getLogger(__name__)
 
+# 모니터링 코인 선정 시 캔들 동시 조회 수 (업비트 공개 API 요청 제한 고려)
+MONITOR_FETCH_WORKERS = 8
+# 보유 코인/잔고 조회가 연달아 일어날 때 계좌 조회 결과를 재사용하는 시간 (초)
+ACCOUNTS_CACHE_TTL = 2.0
+# 모니터링 코인 목록 재사용 시간 (초). 동시에 들어온 요청은 한 번의 조회 결과를 함께 사용한다
+MONITORED_COINS_CACHE_TTL = 5.0
+# 공개 GET 응답 재사용 시간 (초). 마켓 목록은 거의 바뀌지 않고, 현재가는 1초 안의 중복 조회만 합친다.
+# 캔들/호가/체결은 매번 새로 조회한다.
+RESPONSE_CACHE_TTLS = {
+    '/v1/market/all': 3600.0,
+    '/v1/ticker': 1.0,
+}
+RESPONSE_CACHE_MAXSIZE = 512
+
 def safe_float(value: Any, default: float = 0.0) -> float:
     """Safely convert a value to float, returning a default for None or invalid values."""
     try:
@@ -61,23 +80,58 @@ def safe_float(value: Any, default: float = 0.0) -> float:
     except (ValueError, TypeError):
         return default
 
-def rate_limit(seconds: int = 1):
-    """API 호출 레이트 리미팅을 위한 데코레이터"""
+# 보유 코인 수익률(%) 구간별 상태 표시 (bisect_right 로 구간 인덱스를 찾는다)
+_HOLDING_STATUS_BOUNDS = (-2.0, 2.0, 5.0)
+_HOLDING_STATUS_LABELS = ('손실', '소폭 손실', '수익', '높은 수익')
+
+# 호가 단위 표(order_manager.TICK_SIZES)의 배열 버전 (여러 가격을 한 번에 조회할 때 사용)
+_TICK_SIZES_ARRAY = np.array(TICK_SIZES, dtype=np.float64)
+
+# 업비트 캔들 필드 -> 분석용 DataFrame 열 이름
+_CANDLE_COLUMNS = (
+    ('opening_price', 'open'),
+    ('high_price', 'high'),
+    ('low_price', 'low'),
+    ('trade_price', 'close'),
+    ('candle_acc_trade_volume', 'volume'),
+)
+
+CandleArrays = namedtuple('CandleArrays', [column for _, column in _CANDLE_COLUMNS])
+
+
+def candle_values(candles: List[Dict], key: str) -> np.ndarray:
+    """캔들 목록의 한 필드를 float64 배열로 변환 (값이 없으면 NaN)"""
+    return np.fromiter((candle.get(key) for candle in candles), dtype=np.float64, count=len(candles))
+
+
+def candles_to_arrays(candles: List[Dict]) -> CandleArrays:
+    """캔들 목록을 open/high/low/close/volume float64 배열로 한 번에 변환"""
+    return CandleArrays(*(candle_values(candles, key) for key, _ in _CANDLE_COLUMNS))
+
+
+def get_holding_status(profit_rate: float) -> str:
+    """보유 코인 수익률(%)에 따른 상태 문자열 반환"""
+    return _HOLDING_STATUS_LABELS[bisect_right(_HOLDING_STATUS_BOUNDS, profit_rate)]
+
+def rate_limit(seconds: float = 1):
+    """API 호출 레이트 리미팅을 위한 데코레이터
+
+    여러 스레드가 동시에 호출해도 호출 간격이 seconds 이상이 되도록, 락 안에서 다음 호출 시각을
+    예약하고 락 밖에서 그 시각까지 기다린다.
+    """
     def decorator(func):
-        last_called = {}
-        
+        lock = threading.Lock()
+        next_slot = [0.0]  # 다음 호출이 가능한 시각 (monotonic)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            current_time = time.time()
-            if func.__name__ not in last_called or \
-               current_time - last_called[func.__name__] >= seconds:
-                last_called[func.__name__] = current_time
-                return func(*args, **kwargs)
-            else:
-                wait_time = seconds - (current_time - last_called[func.__name__])
-                time.sleep(wait_time)
-                last_called[func.__name__] = time.time()
-                return func(*args, **kwargs)
+            with lock:
+                now = time.monotonic()
+                slot = max(now, next_slot[0])
+                next_slot[0] = slot + seconds
+            if slot > now:
+                time.sleep(slot - now)
+            return func(*args, **kwargs)
         return wrapper
     return decorator
 
@@ -124,6 +178,17 @@ class MarketAnalyzer:
         
         # 거래 중지 등으로 조회 실패한 마켓 기록
         self.invalid_markets = set()
+        # 계좌 조회 결과 캐시 (조회 시각, 계좌 목록)
+        self._accounts_cache = None
+        # 모니터링 코인 목록 캐시 (조회 시각, 코인 목록)와 동시 조회 방지용 락
+        self._monitored_cache = None
+        self._monitored_lock = threading.Lock()
+        # 공개 GET 응답 캐시 {(endpoint, 파라미터): (만료 시각(monotonic), 응답)}
+        self._response_cache = {}
+        # 선매도 계산용 (매도 설정 dict, (TP_PCT, MINIMUM_TICKS)) 캐시
+        self._sell_params_cache = None
+        # 모니터링 마켓별 MACD 누적 상태 (새로 확정된 1분봉만 반영)
+        self._macd_states: Dict[str, StreamingMACD] = {}
         # 자동 매매로 이미 매수한 코인 추적
         self.auto_bought = set()
         # 매수 가격별 선매도 주문 관리용 리스트
@@ -175,10 +240,12 @@ class MarketAnalyzer:
                 return src
 
             self.config = deep_merge(self.config, new_config)
+            # 코인 선정 기준이 바뀌었을 수 있으므로 모니터링 목록을 다시 계산한다
+            self._monitored_cache = None
+            self._sell_params_cache = None
 
             # 설정 파일 저장
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            json_utils.write_atomic(self.config_path, self.config)
                 
             logger.info("설정 업데이트 완료")
             
@@ -264,12 +331,11 @@ class MarketAnalyzer:
                 return self._create_default_config()
                 
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config = json_utils.load(f)
 
             if 'buy_score' not in config:
-                config['buy_score'] = DEFAULT_SETTINGS.get('buy_score', {}).copy()
-                with open(self.config_path, 'w', encoding='utf-8') as wf:
-                    json.dump(config, wf, indent=4, ensure_ascii=False)
+                config['buy_score'] = deepcopy(DEFAULT_SETTINGS.get('buy_score', {}))
+                json_utils.write_atomic(self.config_path, config)
 
             return config
         except Exception as e:
@@ -278,10 +344,9 @@ class MarketAnalyzer:
             
     def _create_default_config(self) -> Dict:
         """기본 설정 생성"""
-        config = DEFAULT_SETTINGS.copy()
+        config = get_default_settings()
 
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        json_utils.write_atomic(self.config_path, config)
 
         return config
         
@@ -315,8 +380,29 @@ class MarketAnalyzer:
             logger.error(f"JWT 토큰 생성 실패: {str(e)}")
             return None
             
-    @rate_limit(0.1)
     def _send_request(self, method: str, endpoint: str, params: dict = None) -> Any:
+        """API 요청 전송
+
+        RESPONSE_CACHE_TTLS 에 있는 공개 GET 요청은 같은 파라미터의 성공 응답을 정해진 시간 동안
+        재사용한다 (반환된 목록은 캐시와 공유되므로 수정하지 말 것). 실패(None)는 보관하지 않는다.
+        """
+        ttl = RESPONSE_CACHE_TTLS.get(endpoint) if method == 'GET' else None
+        if ttl is None:
+            return self._send_request_uncached(method, endpoint, params)
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        cached = self._response_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        data = self._send_request_uncached(method, endpoint, params)
+        if data is not None:
+            if len(self._response_cache) >= RESPONSE_CACHE_MAXSIZE:
+                self._response_cache = {k: v for k, v in self._response_cache.items() if v[0] > now}
+            self._response_cache[key] = (now + ttl, data)
+        return data
+
+    @rate_limit(0.1)
+    def _send_request_uncached(self, method: str, endpoint: str, params: dict = None) -> Any:
         """API 요청 전송 (레이트 리미팅 적용)"""
         try:
             url = f"{self.server_url}{endpoint}"
@@ -345,6 +431,8 @@ class MarketAnalyzer:
                     timeout=self.request_timeout
                 )
             elif method == 'POST':
+                # 주문 등으로 잔고가 바뀌므로 계좌 조회 캐시를 비운다
+                self._accounts_cache = None
                 # POST 요청의 경우 JSON 형식으로 전달
                 response = requests.post(
                     url,
@@ -357,7 +445,7 @@ class MarketAnalyzer:
                 
             if response.status_code == 429:  # Too Many Requests
                 time.sleep(1)  # 1초 대기 후 재시도
-                return self._send_request(method, endpoint, params)
+                return self._send_request_uncached(method, endpoint, params)
                 
             response.raise_for_status()  # 4xx, 5xx 에러 체크
             
@@ -411,6 +499,32 @@ class MarketAnalyzer:
             logger.error(f"시장 정보 조회 실패: {str(e)}")
             return None
             
+    def get_market_infos(self, markets: List[str]) -> Dict[str, Dict]:
+        """여러 마켓의 시장 정보를 한 번의 요청으로 조회 (마켓 코드별 dict)"""
+        try:
+            markets = [m for m in markets if m not in self.invalid_markets]
+            if not markets:
+                return {}
+            known_invalid = set(self.invalid_markets)
+            data = self._send_request('GET', '/v1/ticker', {'markets': ','.join(markets)})
+            if isinstance(data, list):
+                return {item['market']: item for item in data}
+            if len(markets) == 1:
+                return {}
+
+            # 존재하지 않는 마켓이 하나라도 섞이면 요청 전체가 실패하고 모든 마켓이
+            # invalid_markets 에 기록되므로, 기록을 되돌린 뒤 마켓별로 다시 조회한다
+            self.invalid_markets.intersection_update(known_invalid)
+            infos = {}
+            for market in markets:
+                info = self.get_market_info(market)
+                if info:
+                    infos[market] = info
+            return infos
+        except Exception as e:
+            logger.error(f"시장 정보 일괄 조회 실패: {str(e)}")
+            return {}
+
     def get_monitored_markets(self) -> List[str]:
         """모니터링 중인 마켓 목록 조회"""
         try:
@@ -425,23 +539,11 @@ class MarketAnalyzer:
 
     def _get_tick_size(self, price: float) -> float:
         """업비트 가격대별 호가 단위 계산"""
-        if price < 10:
-            return 0.01
-        if price < 100:
-            return 0.1
-        if price < 1000:
-            return 0.1
-        if price < 10000:
-            return 5
-        if price < 100000:
-            return 10
-        if price < 500000:
-            return 50
-        if price < 1000000:
-            return 100
-        if price < 2000000:
-            return 500
-        return 1000
+        return get_tick_size(price)
+
+    def _get_tick_sizes(self, prices: np.ndarray) -> np.ndarray:
+        """여러 가격의 호가 단위를 한 번에 계산 (_get_tick_size 의 배열 버전)"""
+        return _TICK_SIZES_ARRAY[np.searchsorted(TICK_SIZE_BOUNDS, prices, side='right')]
             
     def analyze_market_condition(self) -> Tuple[str, float]:
         """시장 상태 분석"""
@@ -514,13 +616,20 @@ class MarketAnalyzer:
     def calculate_market_score(self, trend_strength: float, volatility: float, 
                              volume_ratio: float, market_dominance: float) -> float:
         """시장 점수 계산"""
+        return float(self.calculate_market_scores(trend_strength, volatility, volume_ratio, market_dominance))
+
+    def calculate_market_scores(self, trend_strength, volatility, volume_ratio, market_dominance) -> np.ndarray:
+        """여러 코인의 시장 점수를 배열 연산 한 번으로 계산
+
+        인자는 코인별 값의 배열(또는 스칼라)이며 calculate_market_score 와 같은 식을 사용한다.
+        """
         try:
             weights = self.config['market_analysis']['weights']
             
             # 각 지표별 점수 계산
             trend_score = np.clip(trend_strength, -1, 1)
             vol_score = np.clip(volatility, 0, 1)
-            volume_score = np.clip(volume_ratio / 2, 0, 1)  # 최대 200% 기준
+            volume_score = np.clip(np.asarray(volume_ratio) / 2, 0, 1)  # 최대 200% 기준
             dominance_score = np.clip(market_dominance, 0, 1)
             
             # 가중 평균 계산
@@ -534,17 +643,29 @@ class MarketAnalyzer:
             return np.clip(score, 0, 1)
         except Exception as e:
             logger.error(f"시장 점수 계산 실패: {str(e)}")
-            return 0.5
+            return np.full(np.shape(trend_strength), 0.5)
+
+    def _get_accounts(self):
+        """계좌 목록 조회 (ACCOUNTS_CACHE_TTL 안에 다시 호출되면 직전 결과 재사용)"""
+        cached = getattr(self, '_accounts_cache', None)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ACCOUNTS_CACHE_TTL:
+            return cached[1]
+        accounts = self._send_request('GET', '/v1/accounts')
+        if accounts:
+            self._accounts_cache = (now, accounts)
+        return accounts
 
     def get_holdings(self) -> Dict:
         """보유 코인 정보 조회"""
         try:
-            accounts = self._send_request('GET', '/v1/accounts')
+            accounts = self._get_accounts()
             if not accounts:
                 logger.error("계좌 정보 조회 실패")
                 return {}
             
-            holdings = {}
+            # 현재가를 조회한 보유 코인만 모아 열(column) 단위 배열로 한 번에 계산
+            rows = []
             for account in accounts:
                 if account['currency'] != 'KRW' and float(account['balance']) > 0:
                     market = f"KRW-{account['currency']}"
@@ -553,29 +674,47 @@ class MarketAnalyzer:
                     # 현재가 조회
                     ticker = self.get_market_info(market)
                     if ticker:
-                        current_price = float(ticker['trade_price'])
-                        avg_price = float(account['avg_buy_price'])
-                        balance = float(account['balance'])
-                        total_value = balance * current_price
-                        min_value = getattr(self, 'min_holding_value', MIN_HOLDING_VALUE)
-
-                        if total_value < min_value:
-                            continue
-
-                        holdings[market] = {
-                            'market': market,
-                            'currency': account['currency'],
-                            'balance': balance,
-                            'avg_price': avg_price,
-                            'current_price': current_price,
-                            'total_value': total_value,
-                            'profit_loss': ((current_price - avg_price) / avg_price) * 100,
-                            'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
+                        rows.append((
+                            market,
+                            account['currency'],
+                            float(account['balance']),
+                            float(account['avg_buy_price']),
+                            float(ticker['trade_price']),
+                        ))
                 elif account['currency'] == 'KRW':
                     # KRW 잔고 정보도 포함
                     self.krw_balance = float(account['balance'])
                     logger.info(f"KRW 잔고: {self.krw_balance:,.0f}원")
+
+            holdings = {}
+            if rows:
+                markets, currencies, balances, avg_prices, current_prices = zip(*rows)
+                balances = np.array(balances)
+                avg_prices = np.array(avg_prices)
+                current_prices = np.array(current_prices)
+
+                total_values = balances * current_prices
+                # 평균 매수가가 0 인 코인(에어드랍 등)은 수익률 0 으로 표시
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    profit_losses = np.where(
+                        avg_prices > 0, (current_prices - avg_prices) / avg_prices * 100, 0.0
+                    )
+                status_idx = np.searchsorted(_HOLDING_STATUS_BOUNDS, profit_losses, side='right')
+                min_value = getattr(self, 'min_holding_value', MIN_HOLDING_VALUE)
+                last_update = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+                for i in np.flatnonzero(total_values >= min_value):
+                    holdings[markets[i]] = {
+                        'market': markets[i],
+                        'currency': currencies[i],
+                        'balance': float(balances[i]),
+                        'avg_price': float(avg_prices[i]),
+                        'current_price': float(current_prices[i]),
+                        'total_value': float(total_values[i]),
+                        'profit_loss': float(profit_losses[i]),
+                        'status': _HOLDING_STATUS_LABELS[status_idx[i]],
+                        'last_update': last_update
+                    }
             
             logger.info(f"보유 코인 조회 완료: {len(holdings)}개")
             try:
@@ -591,25 +730,24 @@ class MarketAnalyzer:
     def get_balance(self) -> Dict:
         """계좌 잔고 정보 조회"""
         try:
-            accounts = self._send_request('GET', '/v1/accounts')
+            accounts = self._get_accounts()
             if not accounts:
                 return {'krw': 0, 'total_asset': 0}
 
-            krw_balance = 0
+            # 통화 코드로 바로 찾을 수 있도록 계좌 목록을 dict 로 변환
+            accounts_by_currency = {account['currency']: account for account in accounts}
+            krw_account = accounts_by_currency.pop('KRW', None)
+            krw_balance = float(krw_account['balance']) if krw_account else 0
             total_asset = 0
 
-            for account in accounts:
-                if account['currency'] == 'KRW':
-                    krw_balance = float(account['balance'])
-                else:
-                    market = f"KRW-{account['currency']}"
-                    if market in self.invalid_markets:
-                        continue
-                    ticker = self.get_market_info(market)
-                    if ticker:
-                        balance = float(account['balance'])
-                        current_price = float(ticker['trade_price'])
-                        total_asset += balance * current_price
+            # 보유 코인 현재가는 한 번의 요청으로 조회
+            tickers = self.get_market_infos([f"KRW-{currency}" for currency in accounts_by_currency])
+            for currency, account in accounts_by_currency.items():
+                ticker = tickers.get(f"KRW-{currency}")
+                if ticker:
+                    balance = float(account['balance'])
+                    current_price = float(ticker['trade_price'])
+                    total_asset += balance * current_price
 
             total_asset += krw_balance
             
@@ -798,7 +936,22 @@ class MarketAnalyzer:
         return memory_usage
 
     def get_monitored_coins(self) -> List[Dict]:
-        """모니터링 중인 코인 목록과 신호 조회"""
+        """모니터링 중인 코인 목록과 신호 조회
+
+        여러 클라이언트와 백그라운드 루프가 동시에 요청해도 업비트 조회는 한 번만 하도록,
+        진행 중인 조회가 끝나기를 기다렸다가 그 결과를 MONITORED_COINS_CACHE_TTL 동안 함께 쓴다.
+        """
+        with self._monitored_lock:
+            cached = self._monitored_cache
+            if cached is not None and time.monotonic() - cached[0] < MONITORED_COINS_CACHE_TTL:
+                return list(cached[1])
+            coins = self._fetch_monitored_coins()
+            if coins:
+                self._monitored_cache = (time.monotonic(), coins)
+            return list(coins)
+
+    def _fetch_monitored_coins(self) -> List[Dict]:
+        """업비트에서 코인 선정 기준과 매수 점수를 계산해 모니터링 코인 목록 생성"""
         try:
             # 설정에서 필터링 기준 가져오기
             trading = self.config.get('trading', {})
@@ -852,102 +1005,133 @@ class MarketAnalyzer:
                 logger.error("현재가 정보 조회 실패")
                 return []
                 
-            # 거래량 정보 수집 및 필터링
-            market_info = []
-            for ticker in tickers:
-                try:
-                    market = next((m for m in krw_markets if m['market'] == ticker['market']), None)
-                    if not market:
-                        continue
+            # 현재가 정보만으로 판단할 수 있는 기준을 먼저 적용해 캔들 조회 대상을 줄인다
+            markets_by_code = {m['market']: m for m in krw_markets}
+            matched = [
+                (ticker, markets_by_code[ticker.get('market')])
+                for ticker in tickers
+                if ticker.get('market') in markets_by_code
+            ]
+            candidates = []
+            if matched:
+                prices = np.array([safe_float(t.get('trade_price')) for t, _ in matched])
+                volumes_24h = np.array([safe_float(t.get('acc_trade_price_24h')) for t, _ in matched])
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    tick_ratios = self._get_tick_sizes(prices) / prices * 100
+                passed = (
+                    (prices > 0)
+                    & (prices >= min_price) & (prices <= max_price)
+                    & (volumes_24h >= min_volume_24h)
+                    & (tick_ratios >= min_tick_ratio)
+                )
+                candidates = [matched[i] for i in np.flatnonzero(passed)]
+            logger.debug(f"현재가 기준 통과 마켓 수: {len(candidates)}")
+
+            # 1시간 거래대금/변동폭 확인 (캔들 조회는 I/O 대기이므로 마켓별로 동시에 요청)
+            with ThreadPoolExecutor(max_workers=MONITOR_FETCH_WORKERS) as executor:
+                screened = executor.map(
+                    lambda c: self._screen_market(c[0], c[1], min_volume_1h),
+                    candidates,
+                )
+                selected_markets = [info for info in screened if info]
 
-                    current_price = safe_float(ticker.get('trade_price'))
-                    trade_volume = safe_float(ticker.get('acc_trade_price_24h'))
-                    if not (min_price <= current_price <= max_price):
-                        continue
-                    if trade_volume < min_volume_24h:
-                        continue
+                logger.info(f"선정 기준 통과 마켓 수: {len(selected_markets)}")
 
-                    candles_1h = self.get_candles(market['market'], interval='minute1', count=60)
-                    if not candles_1h:
-                        continue
-                    avg_volume = sum(safe_float(c.get('candle_acc_trade_price')) for c in candles_1h) / len(candles_1h)
-                    if avg_volume < min_volume_1h:
-                        continue
-                    high_price = max(safe_float(c.get('high_price')) for c in candles_1h)
-                    low_price = min(safe_float(c.get('low_price')) for c in candles_1h)
-                    if high_price < low_price * 1.002:
-                        continue
-                    tick_ratio = self._get_tick_size(current_price) / current_price * 100
-                    if tick_ratio < min_tick_ratio:
-                        continue
+                # 선정된 코인 분석
+                threshold = self.config.get('buy_score', {}).get('score_threshold', 0)
+                analyzed = executor.map(
+                    lambda m: self._analyze_monitored_market(m, threshold),
+                    selected_markets,
+                )
+                monitored_coins = [coin for coin in analyzed if coin]
 
-                    change_rate = safe_float(ticker.get('signed_change_rate')) * 100
+            # 선정에서 빠진 마켓의 MACD 상태는 버린다
+            selected_codes = {m['market'] for m in selected_markets}
+            for code in list(self._macd_states):
+                if code not in selected_codes:
+                    self._macd_states.pop(code, None)
 
-                    market_info.append({
-                        'market': market['market'],
-                        'name': market.get('korean_name', market['market']),
-                        'current_price': current_price,
-                        'trade_volume': trade_volume,
-                        'change_rate': change_rate,
-                        'tick_ratio': tick_ratio
-                    })
-                except Exception as e:
-                    logger.error(f"{ticker['market']} 정보 처리 중 오류: {str(e)}")
-                    continue
+            monitored_coins.sort(key=lambda x: x['score'], reverse=True)
 
-            selected_markets = market_info
-            
-            logger.info(f"선정 기준 통과 마켓 수: {len(selected_markets)}")
+            logger.info(f"모니터링 대상 코인 {len(monitored_coins)}개 선택됨")
+            return monitored_coins
             
-            # 선정된 코인 분석
-            monitored_coins = []
-            threshold = self.config.get('buy_score', {}).get('score_threshold', 0)
-            for market in selected_markets:
-                try:
-                    market_code = market['market']
-                    logger.debug(f"{market_code} 분석 시작")
+        except Exception as e:
+            logger.error(f"모니터링 코인 목록 조회 실패: {str(e)}")
+            return []
 
-                    candles_1m = self.get_candles(market_code, interval='minute1', count=30)
-                    if not candles_1m:
-                        continue
+    def _screen_market(self, ticker: Dict, market: Dict, min_volume_1h: float) -> Optional[Dict]:
+        """최근 1분봉 60개로 코인 선정 기준 검사 (통과하지 못하면 None)
 
-                    df_1m = self.prepare_dataframe(candles_1m)
-                    score, formula = self.calculate_buy_score(market_code, df_1m)
+        가격, 24시간 거래대금, 틱 비율 기준은 호출 측에서 현재가 정보로 미리 거른다.
+        """
+        try:
+            current_price = safe_float(ticker.get('trade_price'))
+            trade_volume = safe_float(ticker.get('acc_trade_price_24h'))
 
-                    cmp = '>' if score >= threshold else '<'
-                    msg = (
-                        f"[{market_code}] buy_score = {score:.2f} ( {cmp} score_threshold = {threshold} | {formula} )"
-                    )
-                    if score >= threshold:
-                        msg += " ◆◆◆ score_threshold OVER"
-                    logger.info(msg)
-
-                    coin_data = {
-                        'market': market_code,
-                        'name': market['name'],
-                        'current_price': market['current_price'],
-                        'change_rate': market['change_rate'],
-                        'trade_volume': market['trade_volume'],
-                        'score': score,
-                        'threshold': threshold,
-                        'status': '매수 가능' if score >= threshold else '모니터링',
-                        'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
+            candles_1h = self.get_candles(market['market'], interval='minute1', count=60)
+            if not candles_1h:
+                return None
+            avg_volume = sum(safe_float(c.get('candle_acc_trade_price')) for c in candles_1h) / len(candles_1h)
+            if avg_volume < min_volume_1h:
+                return None
+            high_price = max(safe_float(c.get('high_price')) for c in candles_1h)
+            low_price = min(safe_float(c.get('low_price')) for c in candles_1h)
+            if high_price < low_price * 1.002:
+                return None
+            tick_ratio = self._get_tick_size(current_price) / current_price * 100
 
-                    monitored_coins.append(coin_data)
+            change_rate = safe_float(ticker.get('signed_change_rate')) * 100
 
-                except Exception as e:
-                    logger.error(f"{market_code} 분석 중 오류 발생: {str(e)}")
-                    continue
+            return {
+                'market': market['market'],
+                'name': market.get('korean_name', market['market']),
+                'current_price': current_price,
+                'trade_volume': trade_volume,
+                'change_rate': change_rate,
+                'tick_ratio': tick_ratio
+            }
+        except Exception as e:
+            logger.error(f"{ticker['market']} 정보 처리 중 오류: {str(e)}")
+            return None
 
-            monitored_coins.sort(key=lambda x: x['score'], reverse=True)
+    def _analyze_monitored_market(self, market: Dict, threshold: float) -> Optional[Dict]:
+        """선정된 코인의 매수 점수 계산 (실패 시 None)"""
+        market_code = market['market']
+        try:
+            logger.debug(f"{market_code} 분석 시작")
 
-            logger.info(f"모니터링 대상 코인 {len(monitored_coins)}개 선택됨")
-            return monitored_coins
-            
+            candles_1m = self.get_candles(market_code, interval='minute1', count=30)
+            if not candles_1m:
+                return None
+
+            df_1m = self.prepare_dataframe(candles_1m)
+            # 봉 시작 시각(UTC 문자열)은 사전순이 곧 시간순이므로 그대로 MACD 상태 위치 검색에 쓴다
+            timestamps = np.array([c.get('candle_date_time_utc') or '' for c in candles_1m])
+            score, formula = self.calculate_buy_score(market_code, df_1m, timestamps)
+
+            cmp = '>' if score >= threshold else '<'
+            msg = (
+                f"[{market_code}] buy_score = {score:.2f} ( {cmp} score_threshold = {threshold} | {formula} )"
+            )
+            if score >= threshold:
+                msg += " ◆◆◆ score_threshold OVER"
+            logger.info(msg)
+
+            return {
+                'market': market_code,
+                'name': market['name'],
+                'current_price': market['current_price'],
+                'change_rate': market['change_rate'],
+                'trade_volume': market['trade_volume'],
+                'score': score,
+                'threshold': threshold,
+                'status': '매수 가능' if score >= threshold else '모니터링',
+                'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
         except Exception as e:
-            logger.error(f"모니터링 코인 목록 조회 실패: {str(e)}")
-            return []
+            logger.error(f"{market_code} 분석 중 오류 발생: {str(e)}")
+            return None
 
     def save_settings(self, settings: dict) -> bool:
         """
@@ -965,9 +1149,6 @@ class MarketAnalyzer:
                 logger.error("유효하지 않은 설정값이 포함되어 있습니다.")
                 return False
 
-            # 임시 파일에 먼저 저장
-            temp_path = f"{self.config_path}.temp"
-            
             # 새로운 설정 구성
             new_config = {
                 'trading': self._prepare_trading_settings(settings),
@@ -977,16 +1158,13 @@ class MarketAnalyzer:
                 'sell_settings': settings.get('sell_settings', {})
             }
 
-            # 임시 파일에 저장
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(new_config, f, indent=4, ensure_ascii=False)
-
-            # 파일 교체 (atomic operation)
-            import os
-            os.replace(temp_path, self.config_path)
+            # 임시 파일에 저장 후 교체 (atomic operation)
+            json_utils.write_atomic(self.config_path, new_config)
             
             # 메모리 상의 설정 업데이트
             self.config = new_config
+            self._monitored_cache = None
+            self._sell_params_cache = None
             
             logger.info("설정이 성공적으로 저장되었습니다.")
             return True
@@ -1214,18 +1392,20 @@ class MarketAnalyzer:
             holdings = self.get_holdings()
             results = {}
             success = True
-            for market, info in holdings.items():
-                volume = info['balance']
-                order = self.api.sell_market_order(market, volume)
-                if order:
-                    results[market] = order
-                    try:
-                        monitoring_coin.remove_market(market)
-                    except Exception:
-                        pass
-                    self.open_positions = [p for p in self.open_positions if p['market'] != market]
-                else:
-                    success = False
+            # 매도한 코인들의 모니터링 파일 갱신은 끝날 때 한 번만 기록
+            with monitoring_coin.batch():
+                for market, info in holdings.items():
+                    volume = info['balance']
+                    order = self.api.sell_market_order(market, volume)
+                    if order:
+                        results[market] = order
+                        try:
+                            monitoring_coin.remove_market(market)
+                        except Exception:
+                            pass
+                        self.open_positions = [p for p in self.open_positions if p['market'] != market]
+                    else:
+                        success = False
             return {'success': success, 'data': results} if success else {'success': False, 'error': '매도 실패', 'data': results}
         except Exception as e:
             logger.error(f"전체 시장가 매도 중 오류 발생: {str(e)}")
@@ -1249,16 +1429,10 @@ class MarketAnalyzer:
                 avg_price = total_cost / executed_volume
             else:
                 avg_price = float(buy_order['price'])
-            settings = self.get_sell_settings() or DEFAULT_SELL_SETTINGS.copy()
-            tp_pct = float(settings.get('TP_PCT', 0))
-            min_ticks = int(settings.get('MINIMUM_TICKS', 2))
+            tp_pct, min_ticks = self._get_pre_sell_params()
 
             tick = self._get_tick_size(avg_price)
-            target_price = avg_price * (1 + tp_pct / 100)
-            target_price = math.ceil(target_price / tick) * tick
-            if target_price - avg_price < tick * min_ticks:
-                target_price = avg_price + tick * min_ticks
-                target_price = math.ceil(target_price / tick) * tick
+            target_price = pre_sell_target_price(avg_price, tick, tp_pct, min_ticks)
 
             logger.info(
                 f"{market} 선매도 계산: avg_price={avg_price}, tick={tick}, target={target_price}"
@@ -1298,46 +1472,63 @@ class MarketAnalyzer:
         except Exception as e:
             logger.error(f"선매도 주문 처리 중 오류 발생: {str(e)}")
 
+    def _get_pre_sell_params(self) -> Tuple[float, int]:
+        """선매도 계산용 (TP_PCT, MINIMUM_TICKS)
+
+        매도 설정이 바뀌기 전까지는 변환해 둔 값을 재사용한다.
+        """
+        settings = self.get_sell_settings() or DEFAULT_SELL_SETTINGS
+        cached = getattr(self, '_sell_params_cache', None)
+        if cached is not None and cached[0] is settings:
+            return cached[1]
+        params = (float(settings.get('TP_PCT', 0)), int(settings.get('MINIMUM_TICKS', 2)))
+        self._sell_params_cache = (settings, params)
+        return params
+
     def place_pre_sell(self, market: str, buy_order: Dict) -> None:
         """매수 후 선매도 주문을 실행하는 공개 메서드"""
         self._place_pre_sell(market, buy_order)
 
     def _verify_open_positions(self, holdings: Dict) -> None:
         """보유 코인 대비 선매도 주문 상태 확인"""
-        for pos in list(self.open_positions):
-            market = pos['market']
-            volume = pos['volume']
-            uuid = pos.get('sell_uuid')
-
-            holding = holdings.get(market)
-            if not holding or holding['balance'] < volume - 1e-8:
-                # 보유 수량이 부족하면 포지션 제거
-                self.open_positions.remove(pos)
-                continue
-
-            order_info = self.api.get_order_info(uuid) if uuid else None
-            if not order_info or order_info.get('state') != 'wait':
-                fake_order = {
-                    'price': pos['entry_price'],
-                    'avg_price': pos['entry_price'],
-                    'executed_volume': volume,
-                }
-                self._place_pre_sell(market, fake_order)
+        # 여러 코인의 선매도 기록은 끝날 때 한 번만 파일에 기록
+        with monitoring_coin.batch():
+            for pos in list(self.open_positions):
+                market = pos['market']
+                volume = pos['volume']
+                uuid = pos.get('sell_uuid')
+
+                holding = holdings.get(market)
+                if not holding or holding['balance'] < volume - 1e-8:
+                    # 보유 수량이 부족하면 포지션 제거
+                    self.open_positions.remove(pos)
+                    continue
+
+                order_info = self.api.get_order_info(uuid) if uuid else None
+                if not order_info or order_info.get('state') != 'wait':
+                    fake_order = {
+                        'price': pos['entry_price'],
+                        'avg_price': pos['entry_price'],
+                        'executed_volume': volume,
+                    }
+                    self._place_pre_sell(market, fake_order)
 
     def _verify_monitoring_pre_sell(self, holdings: Dict) -> None:
         """Check monitoring file and place pre-sell if missing."""
-        for market, info in monitoring_coin.get_monitoring_coins().items():
-            if info.get('pre_sell'):
-                continue
-            holding = holdings.get(market)
-            if not holding:
-                continue
-            fake_order = {
-                'price': holding['avg_price'],
-                'avg_price': holding['avg_price'],
-                'executed_volume': holding['balance'],
-            }
-            self._place_pre_sell(market, fake_order)
+        # 여러 코인의 선매도 기록은 끝날 때 한 번만 파일에 기록
+        with monitoring_coin.batch():
+            for market, info in monitoring_coin.get_monitoring_coins().items():
+                if info.get('pre_sell'):
+                    continue
+                holding = holdings.get(market)
+                if not holding:
+                    continue
+                fake_order = {
+                    'price': holding['avg_price'],
+                    'avg_price': holding['avg_price'],
+                    'executed_volume': holding['balance'],
+                }
+                self._place_pre_sell(market, fake_order)
 
     def get_candles(self, market: str, interval: str = 'minute15', count: int = 100) -> List[Dict]:
         """캔들 데이터 조회"""
@@ -1385,24 +1576,11 @@ class MarketAnalyzer:
             return []
 
     def prepare_dataframe(self, candles: List[Dict]) -> pd.DataFrame:
-        """캔들 데이터를 분석용 DataFrame으로 변환"""
+        """캔들 데이터를 분석용 DataFrame으로 변환 (open/high/low/close/volume 열)"""
         try:
-            df = pd.DataFrame(candles)
-            rename_map = {
-                'opening_price': 'open',
-                'high_price': 'high',
-                'low_price': 'low',
-                'trade_price': 'close',
-                'candle_acc_trade_volume': 'volume'
-            }
-            df = df.rename(columns=rename_map)
-
-            numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-
-            return df
+            # dict 목록 전체를 DataFrame 으로 만든 뒤 이름을 바꾸지 않고
+            # 분석에 쓰는 열만 float64 배열로 바로 만든다 (값이 없으면 NaN)
+            return pd.DataFrame(candles_to_arrays(candles)._asdict())
         except Exception as e:
             logger.error(f"데이터프레임 변환 오류: {str(e)}")
             return pd.DataFrame()
@@ -1413,13 +1591,8 @@ class MarketAnalyzer:
             if len(candles) < period:
                 return None
                 
-            prices = [float(candle['trade_price']) for candle in candles]
-            ma = []
-            
-            for i in range(len(prices) - period + 1):
-                ma.append(sum(prices[i:i+period]) / period)
-                
-            return ma
+            prices = candle_values(candles, 'trade_price')
+            return (np.convolve(prices, np.ones(period), mode='valid') / period).tolist()
             
         except Exception as e:
             logger.error(f"이동평균선 계산 중 오류: {str(e)}")
@@ -1431,13 +1604,18 @@ class MarketAnalyzer:
             if len(candles) < period:
                 return None
                 
-            prices = np.array([float(candle['trade_price']) for candle in candles])
+            prices = candle_values(candles, 'trade_price')
             
-            # 이동평균 계산
-            ma = np.convolve(prices, np.ones(period)/period, mode='valid')
-            
-            # 표준편차 계산
-            std = np.array([np.std(prices[i:i+period]) for i in range(len(prices)-period+1)])
+            # 구간 합/제곱합을 누적합 차이로 구해 이동평균과 표준편차(np.std 와 같은 모표준편차)를 계산
+            # 큰 가격에서 제곱합의 자릿수 손실을 줄이기 위해 전체 평균을 빼고 계산한다
+            offset = prices.mean()
+            centered = prices - offset
+            csum = np.concatenate(([0.0], np.cumsum(centered)))
+            csq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+            mean = (csum[period:] - csum[:-period]) / period
+            var = (csq[period:] - csq[:-period]) / period - mean * mean
+            ma = mean + offset
+            std = np.sqrt(np.maximum(var, 0.0))
             
             # 밴드 계산
             upper = ma + (k * std)
@@ -1485,23 +1663,37 @@ class MarketAnalyzer:
             logger.error(f"호가 조회 실패: {str(e)}")
             return None
 
-    def calculate_buy_score(self, market: str, df_1m: pd.DataFrame) -> Tuple[float, str]:
+    def calculate_buy_score(
+        self, market: str, df_1m: pd.DataFrame, timestamps: Optional[np.ndarray] = None
+    ) -> Tuple[float, str]:
         """점수 기반 매수 스코어 계산
 
+        timestamps(df_1m 각 봉의 시각)를 주면 MACD 는 마켓별 StreamingMACD 로 새로 확정된 봉만
+        반영해 계산하고, 없으면 df_1m 구간 전체로 다시 계산한다.
+
         Returns:
             Tuple[float, str]: 계산된 점수와 계산식 문자열
         """
         conf = self.config.get('buy_score', {})
         score = 0.0
         parts = []
+        # 라벨 인덱싱 대신 필요한 열을 한 번만 ndarray 로 꺼내 위치로 참조
+        close = df_1m['close'].to_numpy(dtype=np.float64)
+        volume = df_1m['volume'].to_numpy(dtype=np.float64)
+
+        # 단기 급락이면 점수가 0 이므로 체결/호가 등 네트워크 조회 전에 먼저 판정
+        momentum_threshold = conf.get('momentum_threshold', 0.3)
+        use_momentum = conf.get('momentum_weight', 0) > 0 and len(df_1m) > 4
+        if use_momentum:
+            change = (close[-1] / close[-4] - 1) * 100
+            if change < momentum_threshold and change <= -momentum_threshold:
+                return 0.0, "momentum_penalty"
 
         # 1. 체결강도
         if conf.get('strength_weight', 0) > 0:
             trades = self.get_recent_trades(market, count=100)
             if trades:
-                buy_vol = sum(t['trade_volume'] for t in trades if t['ask_bid'] == 'BID')
-                sell_vol = sum(t['trade_volume'] for t in trades if t['ask_bid'] == 'ASK')
-                strength = (buy_vol / sell_vol * 100) if sell_vol else 0
+                strength = calculate_trade_strength(trades)
                 if strength >= conf.get('strength_threshold', 130):
                     score += conf['strength_weight']
                     parts.append(f"strength({conf['strength_weight']})")
@@ -1512,8 +1704,8 @@ class MarketAnalyzer:
 
         # 2. 실시간 거래량 급증
         if conf.get('volume_spike_weight', 0) > 0 and len(df_1m) > 5:
-            recent_vol = df_1m['volume'].iloc[-1]
-            avg_vol = df_1m['volume'].iloc[-6:-1].mean()
+            recent_vol = volume[-1]
+            avg_vol = volume[-6:-1].mean()
             if avg_vol:
                 if recent_vol >= avg_vol * (conf.get('volume_spike_threshold', 200) / 100):
                     score += conf['volume_spike_weight']
@@ -1533,62 +1725,61 @@ class MarketAnalyzer:
                     score += conf['orderbook_weight']
                     parts.append(f"orderbook({conf['orderbook_weight']})")
 
-        # 4. 단기 등락률
-        if conf.get('momentum_weight', 0) > 0 and len(df_1m) > 4:
-            change = (df_1m['close'].iloc[-1] / df_1m['close'].iloc[-4] - 1) * 100
-            if change >= conf.get('momentum_threshold', 0.3):
-                score += conf['momentum_weight']
-                parts.append(f"momentum({conf['momentum_weight']})")
-            elif change <= -conf.get('momentum_threshold', 0.3):
-                parts.append("momentum_penalty")
-                return 0.0, " + ".join(parts)
+        # 4. 단기 등락률 (급락 감점은 위에서 먼저 처리)
+        if use_momentum and change >= momentum_threshold:
+            score += conf['momentum_weight']
+            parts.append(f"momentum({conf['momentum_weight']})")
 
         # 5. 전고점 근접 여부
         if conf.get('near_high_weight', 0) > 0:
             daily = self.get_candles(market, interval='day', count=2)
             if daily and len(daily) >= 2:
                 prev_high = max(safe_float(daily[-1].get('high_price')), safe_float(daily[-2].get('high_price')))
-                price = df_1m['close'].iloc[-1]
+                price = close[-1]
                 if prev_high and abs(price - prev_high) / prev_high <= abs(conf.get('near_high_threshold', -1)) / 100:
                     score += conf['near_high_weight']
                     parts.append(f"near_high({conf['near_high_weight']})")
 
         # 6. 추세 전환 징후
         if conf.get('trend_reversal_weight', 0) > 0 and len(df_1m) > 16:
-            past_15 = df_1m['close'].iloc[-16]
-            past_5 = df_1m['close'].iloc[-6]
-            current = df_1m['close'].iloc[-1]
+            past_15 = close[-16]
+            past_5 = close[-6]
+            current = close[-1]
             if past_15 > current and current > past_5:
                 score += conf['trend_reversal_weight']
                 parts.append(f"trend_rev({conf['trend_reversal_weight']})")
 
-        # 7. Williams %R
-        if conf.get('williams_weight', 0) > 0 and conf.get('williams_enabled', True) and len(df_1m) >= 14:
-            hh = df_1m['high'].iloc[-14:].max()
-            ll = df_1m['low'].iloc[-14:].min()
-            if hh != ll:
-                wr = (hh - df_1m['close'].iloc[-1]) / (hh - ll) * -100
-                if wr <= -80:
-                    score += conf['williams_weight']
-                    parts.append(f"williams({conf['williams_weight']})")
+        # 7~9. 보조지표는 사용하는 항목이 있을 때만 한 번에 계산해 공유한다
+        use_williams = conf.get('williams_weight', 0) > 0 and conf.get('williams_enabled', True) and len(df_1m) >= 14
+        use_stochastic = conf.get('stochastic_weight', 0) > 0 and conf.get('stochastic_enabled', True) and len(df_1m) >= 14
+        use_macd = conf.get('macd_weight', 0) > 0 and conf.get('macd_enabled', True)
+        streaming_macd = use_macd and timestamps is not None and len(timestamps) == len(close)
+        if use_williams or use_stochastic or use_macd:
+            ind = calculate_score_indicators(
+                df_1m['high'].to_numpy(dtype=np.float64),
+                df_1m['low'].to_numpy(dtype=np.float64),
+                close,
+                macd=use_macd and not streaming_macd,
+            )
+            if streaming_macd:
+                state = self._macd_states.setdefault(market, StreamingMACD())
+                ind.update(state.update(timestamps, close))
+
+        # 7. Williams %R (고가 == 저가이면 nan 이므로 조건 불충족)
+        if use_williams:
+            if ind['williams_r'] <= -80:
+                score += conf['williams_weight']
+                parts.append(f"williams({conf['williams_weight']})")
 
         # 8. Stochastic
-        if conf.get('stochastic_weight', 0) > 0 and conf.get('stochastic_enabled', True) and len(df_1m) >= 14:
-            lowest = df_1m['low'].rolling(14).min()
-            highest = df_1m['high'].rolling(14).max()
-            k = (df_1m['close'] - lowest) / (highest - lowest) * 100
-            d = k.rolling(3).mean()
-            if k.iloc[-1] < 20 and d.iloc[-1] < 20:
+        if use_stochastic:
+            if ind['stoch_k'] < 20 and ind['stoch_d'] < 20:
                 score += conf['stochastic_weight']
                 parts.append(f"stochastic({conf['stochastic_weight']})")
 
         # 9. MACD
-        if conf.get('macd_weight', 0) > 0 and conf.get('macd_enabled', True):
-            ema12 = df_1m['close'].ewm(span=12).mean()
-            ema26 = df_1m['close'].ewm(span=26).mean()
-            macd = ema12 - ema26
-            signal = macd.ewm(span=9).mean()
-            if macd.iloc[-1] > signal.iloc[-1] and macd.iloc[-2] <= signal.iloc[-2]:
+        if use_macd:
+            if ind['macd'] > ind['macd_signal'] and ind['macd_prev'] <= ind['macd_signal_prev']:
                 score += conf['macd_weight']
                 parts.append(f"macd({conf['macd_weight']})")
 
@@ -1608,8 +1799,7 @@ class MarketAnalyzer:
         """매수 주문 설정 저장"""
         try:
             self.config['buy_settings'] = settings
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            json_utils.write_atomic(self.config_path, self.config)
             return True
         except Exception as e:
             logger.error(f"매수 설정 저장 실패: {e}")
@@ -1619,8 +1809,8 @@ class MarketAnalyzer:
         """매도 주문 설정 저장"""
         try:
             self.config['sell_settings'] = settings
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            self._sell_params_cache = None
+            json_utils.write_atomic(self.config_path, self.config)
             return True
         except Exception as e:
             logger.error(f"매도 설정 저장 실패: {e}")
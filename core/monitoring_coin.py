@@ -1,26 +1,145 @@
-import json
+import atexit
+import logging
 import os
-from typing import Dict
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
 
+from . import json_utils
 from .constants import DEFAULT_COIN_SELECTION
 
+logger = logging.getLogger(__name__)
+
 FILE_PATH = os.path.join(os.path.dirname(__file__), 'monitoring_coin.json')
 EXCLUDED = set(DEFAULT_COIN_SELECTION.get('excluded_coins', []))
 
+# batch() 블록 안에서는 파일 대신 이 스레드의 메모리 사본을 읽고 쓴다
+_batch = threading.local()
 
-def _load() -> Dict[str, Dict]:
+# 파일 쓰기(fsync 포함)는 백그라운드 스레드가 맡는다. 쓰기가 밀리면 마지막 상태만 기록하고,
+# 파일에 반영될 때까지 읽기는 _pending_raw 를 본다.
+_writer_cond = threading.Condition()
+_pending_raw: Optional[str] = None
+_writer_thread: Optional[threading.Thread] = None
+# 마지막으로 파일에 쓴 내용과 그 직후의 수정 시각. 같은 내용이면 다시 쓰지 않는다.
+_last_written: Optional[Tuple[str, Optional[int]]] = None
+
+
+def _read() -> Dict[str, Dict]:
     if os.path.exists(FILE_PATH):
         try:
-            with open(FILE_PATH, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(FILE_PATH, 'rb') as f:
+                return json_utils.load(f)
         except Exception:
             return {}
     return {}
 
 
+def _current() -> Dict[str, Dict]:
+    with _writer_cond:
+        raw = _pending_raw
+    if raw is not None:
+        return json_utils.loads(raw)
+    return _read()
+
+
+def _load() -> Dict[str, Dict]:
+    if getattr(_batch, 'depth', 0):
+        return _batch.data
+    return _current()
+
+
 def _save(data: Dict[str, Dict]) -> None:
-    with open(FILE_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if getattr(_batch, 'depth', 0):
+        _batch.data = data
+        _batch.dirty = True
+        return
+    _enqueue(data)
+
+
+def _write_raw(raw: str) -> None:
+    json_utils.write_text_atomic(FILE_PATH, raw)
+
+
+def _file_mtime() -> Optional[int]:
+    try:
+        return os.stat(FILE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _unchanged(raw: str) -> bool:
+    """기록 대기 중이거나 이미 파일에 있는 내용과 같으면 True (호출 측이 _writer_cond 보유)"""
+    if _pending_raw is not None:
+        return raw == _pending_raw
+    # 다른 곳에서 파일을 고치거나 지웠다면 수정 시각이 달라지므로 다시 쓴다
+    return (_last_written is not None and _last_written[0] == raw
+            and _last_written[1] == _file_mtime())
+
+
+def _enqueue(data: Dict[str, Dict]) -> None:
+    global _pending_raw, _writer_thread
+    raw = json_utils.dumps(data)
+    with _writer_cond:
+        if _unchanged(raw):
+            return
+        _pending_raw = raw
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name='monitoring-coin-writer', daemon=True
+            )
+            _writer_thread.start()
+        _writer_cond.notify_all()
+
+
+def _writer_loop() -> None:
+    global _pending_raw, _last_written
+    while True:
+        with _writer_cond:
+            while _pending_raw is None:
+                _writer_cond.wait()
+            raw = _pending_raw
+        try:
+            _write_raw(raw)
+            written = (raw, _file_mtime())
+        except Exception as e:
+            logger.error(f"모니터링 파일 저장 실패: {str(e)}")
+            written = None
+        with _writer_cond:
+            _last_written = written
+            # 쓰는 동안 새 상태가 들어왔다면 다음 차례에 기록한다
+            if _pending_raw is raw:
+                _pending_raw = None
+            _writer_cond.notify_all()
+
+
+def flush() -> None:
+    """Block until every queued change has been written to the file."""
+    with _writer_cond:
+        while _pending_raw is not None:
+            _writer_cond.wait()
+
+
+atexit.register(flush)
+
+
+@contextmanager
+def batch():
+    """Collect changes in memory and write the file once when the block exits."""
+    depth = getattr(_batch, 'depth', 0)
+    if depth == 0:
+        _batch.data = _current()
+        _batch.dirty = False
+    _batch.depth = depth + 1
+    try:
+        yield
+    finally:
+        _batch.depth = depth
+        if depth == 0:
+            data, dirty = _batch.data, _batch.dirty
+            _batch.data = None
+            if dirty:
+                _enqueue(data)
 
 
 def record_trade(market: str, buy_price: float, sell_price: float) -> None:
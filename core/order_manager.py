@@ -3,7 +3,9 @@
 매수/매도 주문의 실행과 모니터링을 담당합니다.
 """
 
+import math
 import time
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 import logging
@@ -12,6 +14,30 @@ from .upbit_api import UpbitAPI
 
 logger = logging.getLogger(__name__)
 
+# 업비트 가격대별 호가 단위: price < TICK_SIZE_BOUNDS[i] 인 첫 구간의 TICK_SIZES[i]
+# (MarketAnalyzer, TradingBot 이 함께 쓰는 유일한 표)
+TICK_SIZE_BOUNDS = (10, 100, 1000, 10000, 100000, 500000, 1000000, 2000000)
+TICK_SIZES = (0.01, 0.1, 0.1, 5, 10, 50, 100, 500, 1000)
+
+def get_tick_size(price: float) -> float:
+    """가격에 맞는 업비트 호가 단위"""
+    return TICK_SIZES[bisect_right(TICK_SIZE_BOUNDS, price)]
+
+def round_up_to_tick(price: float, tick: float) -> float:
+    """가격을 호가 단위 배수로 올림"""
+    return math.ceil(price / tick) * tick
+
+def pre_sell_target_price(avg_price: float, tick: float, tp_pct: float, min_ticks: int) -> float:
+    """선매도 지정가 계산
+
+    평균 매수가에 목표 수익률(tp_pct, %)을 더해 호가 단위로 올리고,
+    매수가와의 차이가 min_ticks 호가보다 작으면 min_ticks 호가 위로 맞춘다.
+    """
+    target_price = round_up_to_tick(avg_price * (1 + tp_pct / 100), tick)
+    if target_price - avg_price < tick * min_ticks:
+        target_price = round_up_to_tick(avg_price + tick * min_ticks, tick)
+    return target_price
+
 class OrderManager:
     def __init__(self, api: UpbitAPI):
         self.api = api
@@ -13,8 +13,14 @@ import pandas as pd
 import numpy as np
 import logging
 import os
+import csv
 from config.logging_config import setup_logging
 
+try:
+    import pyarrow
+except ImportError:  # pyarrow 미설치 시 parquet 저장은 사용할 수 없다
+    pyarrow = None
+
 setup_logging()
 
 class TradingError(Exception):
@@ -33,6 +39,15 @@ class PerformanceMetrics:
     - 일별 성과 분석 및 리포트 생성
     - 최대 손실폭(MDD) 모니터링
     """
+
+    # 고정된 속성만 사용하므로 인스턴스 __dict__ 생성을 생략한다
+    __slots__ = (
+        'total_trades', 'winning_trades', 'losing_trades',
+        'total_profit', 'total_profit_percent', '_max_drawdown', 'win_rate',
+        'trades_history', 'daily_profits',
+        '_profits', '_profit_percents', '_n',
+        '_csv_path', '_csv_offset', '_csv_fields',
+    )
     
     def __init__(self):
         """
@@ -46,13 +61,24 @@ class PerformanceMetrics:
         # === 수익/손실 관련 변수 ===
         self.total_profit = 0.0        # 총 순수익 (원화)
         self.total_profit_percent = 0.0  # 총 수익률 (%)
-        self.max_drawdown = 0.0        # 최대 손실폭 (%)
+        self._max_drawdown = 0.0       # 최대 손실폭 (%), None 이면 다시 계산 필요
         self.win_rate = 0.0           # 승률 (0~1 사이 값)
         
         # === 거래 기록 저장소 ===
         self.trades_history = []       # 전체 거래 기록 리스트
         self.daily_profits = {}        # 일별 수익 기록 딕셔너리
 
+        # === 지표 계산용 열(column) 배열 ===
+        # 거래마다 dict 를 다시 훑지 않도록 손익/손익률을 float64 배열에 이어 붙인다
+        self._profits = np.empty(64, dtype=np.float64)
+        self._profit_percents = np.empty(64, dtype=np.float64)
+        self._n = 0                    # 배열에 기록된 거래 수
+
+        # === CSV 증분 저장 상태 ===
+        self._csv_path = None          # 마지막으로 저장한 파일 경로
+        self._csv_offset = 0           # 이미 파일에 기록된 거래 수
+        self._csv_fields = None        # CSV 헤더(컬럼) 목록
+
     def update(self, trade: Dict):
         """
         새로운 거래 결과를 기록하고 모든 지표를 업데이트
@@ -92,14 +118,37 @@ class PerformanceMetrics:
         # 거래 기록에 타임스탬프 추가
         trade['timestamp'] = datetime.now()
         self.trades_history.append(trade)
+        self._append_columns(profit, profit_percent)
         
         # 일별 수익 업데이트
         date_str = trade['timestamp'].strftime('%Y-%m-%d')
         self.daily_profits[date_str] = self.daily_profits.get(date_str, 0) + profit
         
-        # 최대 손실폭 재계산
-        self._calculate_drawdown()
+        # 최대 손실폭은 조회할 때 계산한다
+        # 누적 수익률이 줄어드는 손실 거래에서만 MDD가 커질 수 있으므로
+        # 수익률이 0 이상인 거래에서는 이전 값을 그대로 쓴다
+        if profit_percent < 0:
+            self._max_drawdown = None
+
+    @property
+    def max_drawdown(self) -> float:
+        """최대 손실폭 (%) - 손실 거래가 추가된 뒤 처음 조회할 때 한 번만 계산"""
+        if self._max_drawdown is None:
+            self._calculate_drawdown()
+        return self._max_drawdown
         
+    def _append_columns(self, profit: float, profit_percent: float):
+        """손익/손익률 배열에 거래 추가 (가득 차면 두 배로 늘림)"""
+        if self._n == len(self._profits):
+            capacity = len(self._profits) * 2
+            for name in ('_profits', '_profit_percents'):
+                grown = np.empty(capacity, dtype=np.float64)
+                grown[:self._n] = getattr(self, name)
+                setattr(self, name, grown)
+        self._profits[self._n] = profit
+        self._profit_percents[self._n] = profit_percent
+        self._n += 1
+
     def _calculate_drawdown(self):
         """
         최대 손실폭(MDD, Maximum Drawdown) 계산
@@ -109,17 +158,18 @@ class PerformanceMetrics:
         2. 각 시점까지의 최고점을 추적
         3. 현재 지점과 최고점의 차이 중 최대값을 MDD로 기록
         """
-        if not self.trades_history:
+        if not self._n:
+            self._max_drawdown = 0.0
             return
             
         # 수익률의 누적합 계산
-        cumulative = np.cumsum([t['profit_percent'] for t in self.trades_history])
+        cumulative = np.cumsum(self._profit_percents[:self._n])
         # 각 시점까지의 최고점 계산
         peak = np.maximum.accumulate(cumulative)
         # 고점 대비 현재 손실폭 계산
         drawdown = peak - cumulative
         # 최대 손실폭 저장
-        self.max_drawdown = np.max(drawdown)
+        self._max_drawdown = float(np.max(drawdown))
         
     def get_daily_summary(self) -> pd.DataFrame:
         """
@@ -135,9 +185,12 @@ class PerformanceMetrics:
         if not self.trades_history:
             return pd.DataFrame()
             
-        # 거래 기록을 DataFrame으로 변환
-        df = pd.DataFrame(self.trades_history)
-        df['date'] = df['timestamp'].dt.date
+        # 집계에 필요한 열만으로 DataFrame 구성
+        df = pd.DataFrame({
+            'date': [t['timestamp'].date() for t in self.trades_history],
+            'profit': self._profits[:self._n],
+            'profit_percent': self._profit_percents[:self._n],
+        })
         
         # 일별로 그룹화하여 통계 계산
         daily = df.groupby('date').agg({
@@ -159,6 +212,9 @@ class PerformanceMetrics:
                 - 최대 손실폭 (MDD)
                 - 수익요인 (총 수익 / 총 손실의 비율)
         """
+        profits = self._profits[:self._n]
+        gross_profit = profits[profits > 0].sum()
+        gross_loss = profits[profits < 0].sum()
         return {
             'total_trades': self.total_trades,        # 총 거래 횟수
             'winning_trades': self.winning_trades,    # 수익 거래 수
@@ -168,9 +224,7 @@ class PerformanceMetrics:
             'total_profit_percent': round(self.total_profit_percent, 2),  # 총 수익률
             'max_drawdown': round(self.max_drawdown, 2),  # 최대 손실폭
             # 수익요인 = 총수익금액 / 총손실금액 (절대값)
-            'profit_factor': round(abs(sum(t['profit'] for t in self.trades_history if t['profit'] > 0) / 
-                                    sum(t['profit'] for t in self.trades_history if t['profit'] < 0))
-                                if sum(t['profit'] for t in self.trades_history if t['profit'] < 0) != 0 else float('inf'), 2)
+            'profit_factor': round(float(abs(gross_profit / gross_loss)), 2) if gross_loss != 0 else float('inf')
         }
         
     def save_to_csv(self, filename: str = 'logs/performance.csv'):
@@ -187,10 +241,80 @@ class PerformanceMetrics:
         - 매수/매도 가격
         - 거래량
         - 수익/손실 금액과 비율
+
+        같은 파일에 반복 저장하는 경우 이전 저장 이후 추가된 거래만
+        이어서 기록하므로 전체 기록을 매번 다시 쓰지 않습니다.
+        파일이 없거나 비어 있으면(삭제/로테이션) 헤더와 전체 기록을 다시 쓰고,
+        새 거래에 처음 보는 항목이 있으면 열을 추가해 전체를 다시 씁니다.
         """
-        if self.trades_history:
-            df = pd.DataFrame(self.trades_history)
-            df.to_csv(filename, index=False)
+        if not self.trades_history:
+            return
+
+        rewrite = (
+            filename != self._csv_path
+            or not os.path.exists(filename)
+            or os.path.getsize(filename) == 0
+        )
+        if rewrite:
+            self._csv_fields = []
+            self._csv_offset = 0
+
+        # 거래마다 항목이 다를 수 있으므로 처음 나온 순서대로 모든 열을 모은다
+        fields = self._csv_fields
+        known = set(fields)
+        new_trades = self.trades_history[self._csv_offset:]
+        for trade in new_trades:
+            for key in trade:
+                if key not in known:
+                    known.add(key)
+                    fields.append(key)
+                    # 이미 기록한 헤더에 없는 열이 생기면 헤더부터 다시 써야 한다
+                    rewrite = True
+
+        if rewrite:
+            new_trades = self.trades_history
+        elif not new_trades:
+            return
+
+        with open(filename, 'w' if rewrite else 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            if rewrite:
+                writer.writeheader()
+            writer.writerows(new_trades)
+
+        self._csv_path = filename
+        self._csv_offset = len(self.trades_history)
+
+    def save_to_npz(self, filename: str = 'logs/performance.npz'):
+        """
+        지표 계산용 열(시각, 마켓, 손익, 손익률)을 압축 NumPy 파일로 저장
+
+        CSV 와 달리 텍스트 파싱 없이 np.load 로 바로 배열을 읽을 수 있어
+        대시보드 등에서 기록을 다시 불러올 때 빠릅니다.
+        """
+        if not self._n:
+            return
+
+        np.savez_compressed(
+            filename,
+            timestamp=np.array([t['timestamp'] for t in self.trades_history], dtype='datetime64[us]'),
+            market=np.array([t.get('market', '') for t in self.trades_history], dtype=str),
+            profit=self._profits[:self._n],
+            profit_percent=self._profit_percents[:self._n],
+        )
+
+    def save_to_parquet(self, filename: str = 'logs/performance.parquet'):
+        """
+        전체 거래 기록을 parquet 파일로 저장 (pyarrow 필요)
+
+        열 단위 이진 형식이라 pd.read_parquet 로 CSV 보다 빠르게 읽을 수 있습니다.
+        """
+        if not self.trades_history:
+            return
+        if pyarrow is None:
+            raise ImportError("parquet 저장에는 pyarrow 패키지가 필요합니다.")
+
+        pd.DataFrame(self.trades_history).to_parquet(filename, engine='pyarrow', index=False)
 
 def validate_config(config):
     if config['stop_loss'] >= config['take_profit']:
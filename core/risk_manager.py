@@ -11,9 +11,10 @@
 
 from datetime import datetime, timedelta
 from typing import Dict, Optional
-import json
 import os
 
+from . import json_utils
+
 class RiskManager:
     """
     위험 관리를 담당하는 클래스
@@ -21,6 +22,12 @@ class RiskManager:
     설정 파일(config.json)에서 위험 관리 규칙을 로드하고,
     거래 시스템의 안전성을 위한 다양한 제한사항을 관리합니다.
     """
+
+    # 고정된 속성만 사용하므로 인스턴스 __dict__ 생성을 생략한다
+    __slots__ = (
+        'config', 'risk_config', 'consecutive_losses', 'last_loss_time',
+        'daily_loss', 'last_reset_day',
+    )
     
     def __init__(self, config_path: str = 'config.json'):
         """
@@ -34,8 +41,7 @@ class RiskManager:
         - 시스템 위험 관리 규칙 (일일 손실 한도, 연속 손실 제한 등)
         - 포지션 위험 관리 규칙 (익절, 손절 등)
         """
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = json_utils.load_file_cached(config_path)
             
         self.risk_config = self.config['risk_management']
         self.consecutive_losses = 0         # 연속 손실 횟수
@@ -28,6 +28,7 @@ class TelegramLogHandler(logging.Handler):
             if last_time and now - last_time < self.cooldown:
                 return
             self._last_sent[key] = now
-            self.notifier.send_message_sync(msg)
+            # 로그를 남긴 스레드가 텔레그램 응답을 기다리지 않도록 백그라운드로 전송
+            self.notifier.send_message_sync(msg, wait=False)
         except Exception:
             pass
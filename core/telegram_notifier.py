@@ -11,15 +11,31 @@
 """
 
 import os
+import time
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Dict
-from telegram import Bot
-from telegram.error import TelegramError
+import aiohttp
 from dotenv import load_dotenv
 from pathlib import Path
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 requests 의 json 직렬화 사용
+    orjson = None
+
+try:
+    import psutil
+    # 상태 알림마다 프로세스 핸들을 새로 만들지 않도록 한 번만 생성
+    _PROC = psutil.Process()
+    psutil.cpu_percent(interval=None)  # 비블로킹 측정의 기준점 설정
+except ImportError:  # psutil 미설치 환경에서는 리소스 정보를 생략
+    psutil = None
+    _PROC = None
 
 dotenv_path = Path(__file__).resolve().parents[1] / '.env'
 if dotenv_path.exists():
@@ -29,6 +45,64 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# 동기 전송에서 HTTPS 연결을 재사용하기 위한 공용 세션
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 동기 코드가 비동기 전송을 맡기는 공용 이벤트 루프 (첫 사용 시 데몬 스레드에서 시작)
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """공용 백그라운드 이벤트 루프 반환 (없으면 생성)"""
+    global _BG_LOOP
+    if _BG_LOOP is None:
+        with _BG_LOCK:
+            if _BG_LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="telegram-loop", daemon=True).start()
+                _BG_LOOP = loop
+    return _BG_LOOP
+
+
+class _TokenBucket:
+    """
+    비동기 토큰 버킷 레이트 리미터
+
+    토큰이 부족하면 부족분을 미리 예약(음수 잔량)하고 그만큼만 대기하므로
+    락 없이도 단일 이벤트 루프 안에서 호출 순서대로 간격이 벌어진다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+# 텔레그램 제한: 봇 전체 초당 30건, 채팅당 초당 1건 (여유를 두고 25건으로 제한)
+_GLOBAL_BUCKET = _TokenBucket(rate=25, capacity=25)
+
+# 수익/손실 표시 이모지
+_EMOJI_UP = "📈"
+_EMOJI_DN = "📉"
+
+# 영문 거래 유형을 알림 표기로 변환
+_TRADE_ACTIONS = {"buy": "매수", "sell": "매도"}
+
+# notify_position_update 의 포지션별 메시지 형식
+_POS_TMPL = "{market}:\n- 평가손익: {emoji} {pct:.2f}%\n- 보유량: {vol:.8f}\n"
+
 class TelegramNotifier:
     """
     텔레그램 알림을 담당하는 클래스
@@ -36,6 +110,9 @@ class TelegramNotifier:
     거래 시스템의 주요 이벤트를 텔레그램으로 전송하여
     실시간으로 거래 상황을 모니터링할 수 있게 합니다.
     """
+
+    MONITOR_INTERVAL = 300      # 모니터링 주기 (초)
+    STATUS_REPORT_TICKS = 6     # 활동 중에도 이 주기 수마다 상태 알림 (30분)
     
     def __init__(self, config: dict = None):
         """
@@ -51,22 +128,53 @@ class TelegramNotifier:
         if not self.bot_token or not self.chat_id:
             logger.error("텔레그램 API 키가 설정되지 않았습니다. .env 파일을 확인해주세요.")
             raise ValueError("텔레그램 설정이 없습니다.")
+
+        # 상태 알림마다 파싱하지 않도록 거래 시간을 미리 변환해 둔다
+        self._has_trading_cfg = 'trading' in self.config
+        if self._has_trading_cfg:
+            trading_hours = self.config['trading'].get('trading_hours', {})
+            self._trading_start = datetime.strptime(trading_hours.get('start', '09:00'), '%H:%M').time()
+            self._trading_end = datetime.strptime(trading_hours.get('end', '23:00'), '%H:%M').time()
             
-        self.bot = Bot(token=self.bot_token)
-        self.last_heartbeat = datetime.now()
-        self.last_activity = datetime.now()
+        self._send_url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        # 비동기 전송용 HTTP 세션 (첫 전송 시 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+        # 전송 대기열과 채팅별 전송 속도 제한 (start_monitoring 에서 워커 시작)
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._sender_task = None
+        # 대기열과 워커가 속한 이벤트 루프 (다른 스레드의 루프에서는 이 루프로 넘겨서 넣는다)
+        self._sender_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._chat_bucket = _TokenBucket(rate=1, capacity=1)
+        # 동시에 진행되는 HTTP 요청 수를 커넥션 풀 크기 이하로 제한
+        self._send_sem = asyncio.Semaphore(4)
+        # 하트비트/활동 시각은 time.monotonic() 기준 초 단위로 보관
+        self.last_heartbeat = time.monotonic()
+        self.last_activity = self.last_heartbeat
         self.last_activity_type = "시스템 시작"
         self.system_running = False
         self.monitoring_task = None
-        self.activity_check_task = None
         
     async def start_monitoring(self):
-        """시스템 상태 모니터링 시작"""
+        """
+        시스템 상태 모니터링 시작
+
+        모니터링 루프와 전송 워커가 모두 이 이벤트 루프에서 동작하므로, 이 메서드를
+        실행하는 진입점에서는 asyncio.run 전에 uvloop 을 설치해 두는 것을 권장한다.
+
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
+        """
         self.system_running = True
-        self.last_heartbeat = datetime.now()
-        self.last_activity = datetime.now()
+        self.last_heartbeat = time.monotonic()
+        self.last_activity = self.last_heartbeat
+        self._send_queue = asyncio.Queue(maxsize=1000)
+        self._sender_loop = asyncio.get_running_loop()
+        self._sender_task = asyncio.create_task(self._sender_worker())
         self.monitoring_task = asyncio.create_task(self._monitor_system_status())
-        self.activity_check_task = asyncio.create_task(self._check_activity_status())
         await self.notify_system_start()
         
     async def stop_monitoring(self, reason: str = "정상 종료"):
@@ -79,13 +187,49 @@ class TelegramNotifier:
         self.system_running = False
         if self.monitoring_task:
             self.monitoring_task.cancel()
-        if self.activity_check_task:
-            self.activity_check_task.cancel()
         await self.notify_system_stop(reason)
+        await self._stop_sender()
+        await self.close()
+
+    async def _stop_sender(self, timeout: float = 10):
+        """대기열에 남은 메시지를 최대 timeout 초 동안 전송한 뒤 워커 종료"""
+        if self._sender_task is None:
+            return
+        try:
+            await asyncio.wait_for(self._send_queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"텔레그램 대기열 미전송 메시지 {self._send_queue.qsize()}건 폐기")
+        self._sender_task.cancel()
+        self._sender_task = None
+        self._send_queue = None
+        self._sender_loop = None
+
+    async def close(self):
+        """비동기 전송용 HTTP 세션 종료"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        현재 이벤트 루프에서 사용할 HTTP 세션 반환
+
+        세션은 생성된 이벤트 루프에 묶이므로 루프가 바뀐 경우에만 새로 만들고,
+        그 외에는 같은 세션의 keep-alive 연결을 재사용한다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._session_loop = loop
+        return self._session
         
     async def update_heartbeat(self):
         """시스템 활성 상태 업데이트"""
-        self.last_heartbeat = datetime.now()
+        self.last_heartbeat = time.monotonic()
         
     async def update_activity(self, activity_type: str):
         """
@@ -94,31 +238,36 @@ class TelegramNotifier:
         Args:
             activity_type (str): 활동 유형 (예: "매수", "매도", "모니터링" 등)
         """
-        self.last_activity = datetime.now()
-        self.last_activity_type = activity_type
-        # 활동이 발생하면 하트비트도 함께 갱신하여
+        # 활동이 발생하면 하트비트도 같은 시각으로 갱신하여
         # 모니터링 루프가 비정상 종료로 오인하지 않도록 한다
-        self.last_heartbeat = datetime.now()
+        now = time.monotonic()
+        self.last_activity = now
+        self.last_activity_type = activity_type
+        self.last_heartbeat = now
         
     async def _monitor_system_status(self):
-        """시스템 상태 주기적 모니터링 (5분 간격)"""
+        """
+        시스템 상태 주기적 모니터링 (5분 간격)
+
+        한 번 깨어날 때 하트비트와 활동 상태를 함께 확인한다. 활동 상태 알림은
+        마지막 활동 후 한 주기 이상 지났거나 STATUS_REPORT_TICKS 주기마다만 보낸다.
+        상태 알림 전송도 하트비트를 갱신하므로 두 주기 동안 갱신이 없을 때 비정상으로 본다.
+        """
+        tick = 0
         while self.system_running:
-            await asyncio.sleep(300)  # 5분 간격
-            if datetime.now() - self.last_heartbeat > timedelta(minutes=5):
+            await asyncio.sleep(self.MONITOR_INTERVAL)
+            tick += 1
+            now = time.monotonic()
+
+            if now - self.last_heartbeat > self.MONITOR_INTERVAL * 2:
                 await self.notify_system_stop("비정상 종료 감지 - 하트비트 없음")
                 self.system_running = False
                 break
-        
-    async def _check_activity_status(self):
-        """시스템 활동 상태 체크 (5분 간격)"""
-        while self.system_running:
-            await asyncio.sleep(300)  # 5분 간격
-            
+
             # 마지막 활동으로부터 경과 시간
-            elapsed_time = datetime.now() - self.last_activity
-            
-            # 현재 시스템 상태 요약
-            await self.notify_activity_status(elapsed_time)
+            idle = now - self.last_activity
+            if idle >= self.MONITOR_INTERVAL or tick % self.STATUS_REPORT_TICKS == 0:
+                await self.notify_activity_status(timedelta(seconds=idle))
             
     async def notify_activity_status(self, elapsed_time: timedelta):
         """
@@ -129,70 +278,140 @@ class TelegramNotifier:
         """
         minutes = elapsed_time.total_seconds() / 60
         
-        message = "🔄 <b>시스템 상태 체크</b>\n\n"
-        message += f"⏱ 마지막 활동: {minutes:.1f}분 전\n"
-        message += f"📝 활동 내용: {self.last_activity_type}\n"
+        parts = ["🔄 <b>시스템 상태 체크</b>\n\n"]
+        parts.append(f"⏱ 마지막 활동: {minutes:.1f}분 전\n")
+        parts.append(f"📝 활동 내용: {self.last_activity_type}\n")
         
         # 현재 시간이 거래 시간인지 확인
-        current_time = datetime.now().time()
-        if self.config and 'trading' in self.config:
-            trading_hours = self.config['trading'].get('trading_hours', {})
-            start_time = datetime.strptime(trading_hours.get('start', '09:00'), '%H:%M').time()
-            end_time = datetime.strptime(trading_hours.get('end', '23:00'), '%H:%M').time()
-            
-            if start_time <= current_time <= end_time:
-                message += "⏰ 거래 시간 중\n"
+        if self._has_trading_cfg:
+            if self._trading_start <= datetime.now().time() <= self._trading_end:
+                parts.append("⏰ 거래 시간 중\n")
             else:
-                message += "💤 거래 시간 외\n"
+                parts.append("💤 거래 시간 외\n")
                 
         # 시스템 리소스 사용량 추가
-        try:
-            import psutil
-            cpu_percent = psutil.cpu_percent()
-            memory_percent = psutil.Process().memory_percent()
-            message += f"\n🖥 시스템 리소스:\n"
-            message += f"- CPU: {cpu_percent:.1f}%\n"
-            message += f"- 메모리: {memory_percent:.1f}%"
-        except ImportError:
-            pass
+        if _PROC is not None:
+            # interval=None 은 직전 호출 이후의 사용률을 즉시 반환 (블로킹 없음)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            memory_percent = _PROC.memory_percent()
+            parts.append(f"\n🖥 시스템 리소스:\n")
+            parts.append(f"- CPU: {cpu_percent:.1f}%\n")
+            parts.append(f"- 메모리: {memory_percent:.1f}%")
             
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def send_message(self, message: str):
         """
         텔레그램으로 메시지 전송
 
+        전송 워커가 실행 중이면 대기열에 넣고 바로 반환하며, 대기열이 가득 차면
+        가장 오래된 메시지를 버린다. 워커가 없으면 속도 제한을 지켜 직접 전송한다.
+        asyncio.Queue 는 스레드 안전하지 않으므로, 워커와 다른 루프(예: 동기 코드가 쓰는
+        백그라운드 루프)에서 호출되면 call_soon_threadsafe 로 워커 루프에 넣기를 맡긴다.
+
         Args:
             message (str): 전송할 메시지
         """
+        task, loop = self._sender_task, self._sender_loop
+        if task is None or task.done() or loop is None:
+            await self._deliver(message)
+            return
+        if loop is asyncio.get_running_loop():
+            self._enqueue(message)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, message)
+
+    def _enqueue(self, message: str):
+        """전송 대기열에 메시지 추가 (워커 루프에서만 호출)"""
+        queue = self._send_queue
+        if queue is None:
+            # 넘기는 사이 워커가 종료되었으면 이 루프에서 직접 전송한다
+            asyncio.ensure_future(self._deliver(message))
+            return
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            dropped = queue.get_nowait()
+            queue.task_done()
+            logger.warning(f"텔레그램 대기열 초과로 메시지 폐기: {dropped[:50]}...")
+            queue.put_nowait(message)
+
+    async def _sender_worker(self):
+        """대기열의 메시지를 속도 제한에 맞춰 순서대로 전송"""
+        while True:
+            message = await self._send_queue.get()
+            try:
+                await self._deliver(message)
+            except Exception as e:
+                logger.error(f"텔레그램 전송 워커 오류: {str(e)}")
+            finally:
+                self._send_queue.task_done()
+
+    async def _deliver(self, message: str):
+        """
+        토큰 버킷을 통과한 뒤 전송
+
+        429(flood control) 응답이면 retry_after 에 여유 0.5초를 더해 기다린 뒤
+        한 번만 재시도한다. 대기 중에는 세마포어를 놓아 다른 전송을 막지 않는다.
+        """
+        await _GLOBAL_BUCKET.acquire()
+        await self._chat_bucket.acquire()
+        async with self._send_sem:
+            retry_after = await self._post_message(message)
+        if retry_after is None:
+            return
+        logger.warning(f"텔레그램 전송 제한: {retry_after}초 후 재시도")
+        await asyncio.sleep(retry_after + 0.5)
+        async with self._send_sem:
+            retry_after = await self._post_message(message)
+        if retry_after is not None:
+            logger.error(f"텔레그램 메시지 전송 실패: 재시도 후에도 전송 제한 ({retry_after}초)")
+
+    async def _post_message(self, message: str) -> Optional[float]:
+        """
+        sendMessage API 호출
+
+        Returns:
+            Optional[float]: 429 응답일 때 텔레그램이 지정한 대기 시간(초), 그 외 None
+        """
         try:
             logger.debug(f"텔레그램 메시지 전송 시도: {message}")
-            msg = await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode='HTML'
-            )
+            session = self._get_session()
+            async with session.post(
+                self._send_url,
+                json={
+                    "chat_id": self.chat_id,
+                    "text": message,
+                    "parse_mode": "HTML",
+                }
+            ) as response:
+                result = await response.json(content_type=None)
+            if response.status == 429:
+                return result.get('parameters', {}).get('retry_after', 1)
+            if response.status != 200 or not result.get('ok'):
+                logger.error(f"텔레그램 메시지 전송 실패: {result.get('description', response.status)}")
+                return None
             logger.info(f"텔레그램 메시지 전송 성공: {message[:50]}...")
-            logger.debug(f"텔레그램 응답: {msg}")
-        except TelegramError as e:
+            logger.debug(f"텔레그램 응답: {result}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
             logger.error(f"텔레그램 메시지 전송 실패: {str(e)}")
         finally:
             # 메시지를 전송할 때마다 하트비트를 갱신하여
             # 주기적인 모니터링에서 정상 동작으로 판단하게 한다
-            self.last_heartbeat = datetime.now()
+            self.last_heartbeat = time.monotonic()
             
     async def notify_system_start(self):
         """시스템 시작 알림"""
-        message = "🟢 <b>자동매매 시스템 시작</b>\n\n"
+        parts = ["🟢 <b>자동매매 시스템 시작</b>\n\n"]
         
         if self.config:
-            message += "📋 시스템 설정:\n"
-            message += f"- 기본 주문금액: {self.config['trading']['base_order_amount']:,}원\n"
-            message += f"- 최대 포지션: {self.config['trading']['max_positions']}개\n"
-            message += f"- 일일 손실한도: {self.config['risk_management']['system']['max_daily_loss']:,}원\n"
+            parts.append("📋 시스템 설정:\n")
+            parts.append(f"- 기본 주문금액: {self.config['trading']['base_order_amount']:,}원\n")
+            parts.append(f"- 최대 포지션: {self.config['trading']['max_positions']}개\n")
+            parts.append(f"- 일일 손실한도: {self.config['risk_management']['system']['max_daily_loss']:,}원\n")
             
-        message += f"\n⏰ 시작 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        await self.send_message(message)
+        parts.append(f"\n⏰ 시작 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        await self.send_message("".join(parts))
         
     async def notify_system_stop(self, reason: str):
         """
@@ -201,10 +420,10 @@ class TelegramNotifier:
         Args:
             reason (str): 종료 사유
         """
-        message = "🔴 <b>자동매매 시스템 종료</b>\n\n"
-        message += f"📝 종료 사유: {reason}\n"
-        message += f"⏰ 종료 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        await self.send_message(message)
+        parts = ["🔴 <b>자동매매 시스템 종료</b>\n\n"]
+        parts.append(f"📝 종료 사유: {reason}\n")
+        parts.append(f"⏰ 종료 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        await self.send_message("".join(parts))
             
     async def notify_trade(self, action: str, market: str, price: float, 
                          volume: float, profit: Optional[float] = None,
@@ -221,22 +440,28 @@ class TelegramNotifier:
             reason (str, optional): 거래 사유
         """
         await self.update_activity(f"{action} - {market}")
-        
+        await self.send_message(self._format_trade(action, market, price, volume, profit, reason))
+
+    @staticmethod
+    def _format_trade(action: str, market: str, price: float, volume: float,
+                      profit: Optional[float] = None, reason: str = None) -> str:
+        """거래 알림 메시지 생성 (비동기/동기 거래 알림 공용)"""
+        action = _TRADE_ACTIONS.get(action, action)
         emoji = "🔵" if action == "매수" else "🔴"
-        message = f"{emoji} <b>{action}</b>\n"
-        message += f"마켓: {market}\n"
-        message += f"가격: {price:,.0f}원\n"
-        message += f"수량: {volume:.8f}\n"
-        message += f"금액: {(price * volume):,.0f}원\n"
+        parts = [f"{emoji} <b>{action}</b>\n"]
+        parts.append(f"마켓: {market}\n")
+        parts.append(f"가격: {price:,.0f}원\n")
+        parts.append(f"수량: {volume:.8f}\n")
+        parts.append(f"금액: {(price * volume):,.0f}원\n")
         
         if profit is not None:
-            emoji = "📈" if profit > 0 else "📉"
-            message += f"수익률: {emoji} {profit:.2f}%\n"
+            emoji = _EMOJI_UP if profit > 0 else _EMOJI_DN
+            parts.append(f"수익률: {emoji} {profit:.2f}%\n")
             
         if reason:
-            message += f"사유: {reason}"
+            parts.append(f"사유: {reason}")
             
-        await self.send_message(message)
+        return "".join(parts)
         
     async def notify_error(self, error_msg: str, critical: bool = False):
         """
@@ -257,32 +482,32 @@ class TelegramNotifier:
         Args:
             metrics (dict): 성과 지표 정보를 담은 딕셔너리
         """
-        message = "📊 <b>일일 거래 성과</b>\n\n"
+        parts = ["📊 <b>일일 거래 성과</b>\n\n"]
         
         # 주요 지표 추가
         if 'total_profit' in metrics:
             profit = metrics['total_profit']
-            emoji = "📈" if profit > 0 else "📉"
-            message += f"총 수익: {emoji} {profit:,.0f}원\n"
+            emoji = _EMOJI_UP if profit > 0 else _EMOJI_DN
+            parts.append(f"총 수익: {emoji} {profit:,.0f}원\n")
             
         if 'win_rate' in metrics:
-            message += f"승률: {metrics['win_rate']:.1f}%\n"
+            parts.append(f"승률: {metrics['win_rate']:.1f}%\n")
             
         if 'total_trades' in metrics:
-            message += f"총 거래: {metrics['total_trades']}회\n"
+            parts.append(f"총 거래: {metrics['total_trades']}회\n")
             
         if 'max_drawdown' in metrics:
-            message += f"최대 손실폭: {metrics['max_drawdown']:.1f}%\n"
+            parts.append(f"최대 손실폭: {metrics['max_drawdown']:.1f}%\n")
             
         if 'profit_factor' in metrics:
-            message += f"수익 팩터: {metrics['profit_factor']:.2f}\n"
+            parts.append(f"수익 팩터: {metrics['profit_factor']:.2f}\n")
             
         if 'average_profit' in metrics:
             avg_profit = metrics['average_profit']
-            emoji = "📈" if avg_profit > 0 else "📉"
-            message += f"평균 수익: {emoji} {avg_profit:,.0f}원\n"
+            emoji = _EMOJI_UP if avg_profit > 0 else _EMOJI_DN
+            parts.append(f"평균 수익: {emoji} {avg_profit:,.0f}원\n")
             
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def notify_risk_alert(self, risk_type: str, details: str, level: str = "주의"):
         """
@@ -300,12 +525,12 @@ class TelegramNotifier:
         }
         emoji = emoji_map.get(level, "⚠️")
         
-        message = f"{emoji} <b>위험 관리 알림</b>\n"
-        message += f"수준: {level}\n"
-        message += f"유형: {risk_type}\n"
-        message += f"내용: {details}"
+        parts = [f"{emoji} <b>위험 관리 알림</b>\n"]
+        parts.append(f"수준: {level}\n")
+        parts.append(f"유형: {risk_type}\n")
+        parts.append(f"내용: {details}")
         
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def notify_market_status(self, market_data: Dict):
         """
@@ -314,22 +539,22 @@ class TelegramNotifier:
         Args:
             market_data (Dict): 시장 데이터 정보
         """
-        message = "🌐 <b>시장 상태 업데이트</b>\n\n"
+        parts = ["🌐 <b>시장 상태 업데이트</b>\n\n"]
         
         # 거래량 상위 코인
         if 'top_volume' in market_data:
-            message += "📊 거래량 상위:\n"
+            parts.append("📊 거래량 상위:\n")
             for coin in market_data['top_volume'][:5]:
-                message += f"- {coin['market']}: {coin['volume']:,.0f}원\n"
+                parts.append(f"- {coin['market']}: {coin['volume']:,.0f}원\n")
                 
         # 가격 변동 큰 코인
         if 'price_change' in market_data:
-            message += "\n📈 가격 변동 상위:\n"
+            parts.append("\n📈 가격 변동 상위:\n")
             for coin in market_data['price_change'][:5]:
                 emoji = "🔺" if coin['change'] > 0 else "🔻"
-                message += f"- {coin['market']}: {emoji}{abs(coin['change']):.2f}%\n"
+                parts.append(f"- {coin['market']}: {emoji}{abs(coin['change']):.2f}%\n")
                 
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def notify_position_update(self, positions: Dict):
         """
@@ -341,19 +566,22 @@ class TelegramNotifier:
         if not positions:
             return
             
-        message = "📍 <b>포지션 현황</b>\n\n"
+        parts = ["📍 <b>포지션 현황</b>\n\n"]
         
         total_profit = 0
+        fmt = _POS_TMPL.format
         for market, pos in positions.items():
             profit_percent = pos.get('profit_percent', 0)
-            emoji = "📈" if profit_percent > 0 else "📉"
-            message += f"{market}:\n"
-            message += f"- 평가손익: {emoji} {profit_percent:.2f}%\n"
-            message += f"- 보유량: {pos['volume']:.8f}\n"
+            parts.append(fmt(
+                market=market,
+                emoji=_EMOJI_UP if profit_percent > 0 else _EMOJI_DN,
+                pct=profit_percent,
+                vol=pos['volume'],
+            ))
             total_profit += pos.get('unrealized_profit', 0)
             
-        message += f"\n총 평가손익: {'📈' if total_profit > 0 else '📉'} {total_profit:,.0f}원"
-        await self.send_message(message)
+        parts.append(f"\n총 평가손익: {_EMOJI_UP if total_profit > 0 else _EMOJI_DN} {total_profit:,.0f}원")
+        await self.send_message("".join(parts))
         
     async def notify_system_metrics(self, metrics: Dict):
         """
@@ -362,18 +590,18 @@ class TelegramNotifier:
         Args:
             metrics (Dict): 시스템 성능 지표
         """
-        message = "🔧 <b>시스템 상태</b>\n\n"
+        parts = ["🔧 <b>시스템 상태</b>\n\n"]
         
         if 'cpu_usage' in metrics:
-            message += f"CPU 사용률: {metrics['cpu_usage']:.1f}%\n"
+            parts.append(f"CPU 사용률: {metrics['cpu_usage']:.1f}%\n")
         if 'memory_usage' in metrics:
-            message += f"메모리 사용률: {metrics['memory_usage']:.1f}%\n"
+            parts.append(f"메모리 사용률: {metrics['memory_usage']:.1f}%\n")
         if 'api_calls' in metrics:
-            message += f"API 호출 수: {metrics['api_calls']}회\n"
+            parts.append(f"API 호출 수: {metrics['api_calls']}회\n")
         if 'response_time' in metrics:
-            message += f"평균 응답시간: {metrics['response_time']:.2f}ms\n"
+            parts.append(f"평균 응답시간: {metrics['response_time']:.2f}ms\n")
             
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def notify_market_analysis(self, market: str, analysis: Dict):
         """
@@ -385,29 +613,29 @@ class TelegramNotifier:
         """
         await self.update_activity(f"시장 분석 - {market}")
         
-        message = f"📊 <b>{market} 시장 분석</b>\n\n"
+        parts = [f"📊 <b>{market} 시장 분석</b>\n\n"]
         
         # 기술적 지표
         if 'indicators' in analysis:
-            message += "📈 기술적 지표:\n"
+            parts.append("📈 기술적 지표:\n")
             indicators = analysis['indicators']
             if 'rsi' in indicators:
-                message += f"- RSI: {indicators['rsi']:.2f}\n"
+                parts.append(f"- RSI: {indicators['rsi']:.2f}\n")
             if 'macd' in indicators:
-                message += f"- MACD: {indicators['macd']:.2f}\n"
+                parts.append(f"- MACD: {indicators['macd']:.2f}\n")
             if 'volume_ma' in indicators:
-                message += f"- 거래량 MA: {indicators['volume_ma']:,.0f}\n"
+                parts.append(f"- 거래량 MA: {indicators['volume_ma']:,.0f}\n")
                 
         # 추세 분석
         if 'trend' in analysis:
             trend = analysis['trend']
-            emoji = "📈" if trend['direction'] == "상승" else "📉"
-            message += f"\n{emoji} 추세:\n"
-            message += f"- 방향: {trend['direction']}\n"
-            message += f"- 강도: {trend['strength']}\n"
+            emoji = _EMOJI_UP if trend['direction'] == "상승" else _EMOJI_DN
+            parts.append(f"\n{emoji} 추세:\n")
+            parts.append(f"- 방향: {trend['direction']}\n")
+            parts.append(f"- 강도: {trend['strength']}\n")
             
                 
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def notify_risk_status(self, risk_metrics: Dict):
         """
@@ -418,7 +646,7 @@ class TelegramNotifier:
         """
         await self.update_activity("위험 관리 상태 체크")
         
-        message = "⚠️ <b>위험 관리 상태</b>\n\n"
+        parts = ["⚠️ <b>위험 관리 상태</b>\n\n"]
         
         # 일일 손실 현황
         if 'daily_loss' in risk_metrics:
@@ -426,32 +654,26 @@ class TelegramNotifier:
             max_daily_loss = risk_metrics.get('max_daily_loss', 0)
             loss_percentage = (daily_loss / max_daily_loss * 100) if max_daily_loss else 0
             
-            message += "💰 일일 손실 현황:\n"
-            message += f"- 현재 손실: {daily_loss:,.0f}원\n"
-            message += f"- 한도 대비: {loss_percentage:.1f}%\n"
+            parts.append("💰 일일 손실 현황:\n")
+            parts.append(f"- 현재 손실: {daily_loss:,.0f}원\n")
+            parts.append(f"- 한도 대비: {loss_percentage:.1f}%\n")
             
         # 연속 손실
         if 'consecutive_losses' in risk_metrics:
-            message += f"\n📉 연속 손실: {risk_metrics['consecutive_losses']}회\n"
+            parts.append(f"\n📉 연속 손실: {risk_metrics['consecutive_losses']}회\n")
             
         # 포지션 위험도
         if 'position_risk' in risk_metrics:
             pos_risk = risk_metrics['position_risk']
-            message += f"\n📊 포지션 위험도:\n"
-            message += f"- 총 노출도: {pos_risk.get('exposure', 0):.1f}%\n"
-            message += f"- 최대 손실 위험: {pos_risk.get('max_loss_risk', 0):.1f}%\n"
+            parts.append(f"\n📊 포지션 위험도:\n")
+            parts.append(f"- 총 노출도: {pos_risk.get('exposure', 0):.1f}%\n")
+            parts.append(f"- 최대 손실 위험: {pos_risk.get('max_loss_risk', 0):.1f}%\n")
             
-        await self.send_message(message)
+        await self.send_message("".join(parts))
         
     async def send_trade_alert(self, trade_type, coin, price, amount):
-        """거래 알림을 전송합니다."""
-        message = f"🔔 <b>거래 알림</b>\n"
-        message += f"유형: {'매수' if trade_type == 'buy' else '매도'}\n"
-        message += f"코인: {coin}\n"
-        message += f"가격: {price:,} KRW\n"
-        message += f"수량: {amount:.8f}"
-        
-        await self.send_message(message)
+        """거래 알림을 전송합니다. (notify_trade 와 같은 경로 사용)"""
+        await self.notify_trade(trade_type, coin, price, amount)
         
     async def send_error_alert(self, error_message):
         """에러 알림을 전송합니다."""
@@ -467,19 +689,43 @@ class TelegramNotifier:
         """텔레그램 알림 활성화 여부 확인"""
         return bool(self.bot_token and self.chat_id)
 
-    def send_message_sync(self, message: str):
-        """동기 방식으로 메시지 전송"""
+    def send_message_nowait(self, message: str):
+        """
+        공용 백그라운드 이벤트 루프에 전송을 맡기고 바로 반환
+
+        호출마다 이벤트 루프나 HTTP 세션을 새로 만들지 않고, 한 루프에서 aiohttp 세션과
+        전송 속도 제한을 공유한다.
+
+        Returns:
+            concurrent.futures.Future: 전송 완료를 기다려야 할 때 사용할 Future
+        """
+        return asyncio.run_coroutine_threadsafe(self.send_message(message), _background_loop())
+
+    def send_message_sync(self, message: str, wait: bool = True):
+        """
+        동기 방식으로 메시지 전송
+
+        Args:
+            message (str): 전송할 메시지
+            wait (bool): False 이면 send_message_nowait 로 넘기고 전송 결과를 기다리지 않는다
+        """
+        if not wait:
+            self.send_message_nowait(message)
+            return True
         try:
             logger.debug(f"텔레그램 메시지 동기 전송 시도: {message}")
-            response = requests.post(
-                f"https://api.telegram.org/bot{self.bot_token}/sendMessage",
-                data={
-                    "chat_id": self.chat_id,
-                    "text": message,
-                    "parse_mode": "HTML",
-                },
-                timeout=10,
-            )
+            payload = {
+                "chat_id": self.chat_id,
+                "text": message,
+                "parse_mode": "HTML",
+            }
+            # 폼 URL 인코딩 대신 JSON 본문으로 전송 (orjson 이 있으면 바이트로 직접 직렬화)
+            if orjson is not None:
+                response = _SESSION.post(
+                    self._send_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=10
+                )
+            else:
+                response = _SESSION.post(self._send_url, json=payload, timeout=10)
             response.raise_for_status()
             logger.info(f"텔레그램 메시지 전송 성공: {message[:50]}...")
             logger.debug(f"텔레그램 응답 코드: {response.status_code}, 본문: {response.text}")
@@ -490,22 +736,19 @@ class TelegramNotifier:
                 logger.debug(f"응답 본문: {e.response.text}")
             return False
 
-    def send_trade_alert_sync(self, trade_type: str, coin: str, price: float, amount: float):
-        """동기 방식으로 거래 알림 전송"""
-        message = f"💰 <b>거래 알림</b>\n\n"
-        message += f"유형: {trade_type}\n"
-        message += f"코인: {coin}\n"
-        message += f"가격: {price:,.0f}원\n"
-        message += f"수량: {amount:.8f}\n"
-        message += f"시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        return self.send_message_sync(message)
-
-    def send_error_alert_sync(self, error_message: str):
+    def send_trade_alert_sync(self, trade_type: str, coin: str, price: float, amount: float,
+                              profit: Optional[float] = None, reason: str = None, wait: bool = True):
+        """동기 방식으로 거래 알림 전송 (notify_trade 와 같은 메시지 형식)"""
+        return self.send_message_sync(
+            self._format_trade(trade_type, coin, price, amount, profit, reason), wait=wait
+        )
+
+    def send_error_alert_sync(self, error_message: str, wait: bool = True):
         """동기 방식으로 에러 알림 전송"""
         message = f"⚠️ <b>에러 발생</b>\n\n{error_message}"
-        return self.send_message_sync(message)
+        return self.send_message_sync(message, wait=wait)
 
-    def send_system_status_sync(self, status_message: str):
+    def send_system_status_sync(self, status_message: str, wait: bool = True):
         """동기 방식으로 시스템 상태 알림 전송"""
         message = f"ℹ️ <b>시스템 상태</b>\n\n{status_message}"
-        return self.send_message_sync(message) 
+        return self.send_message_sync(message, wait=wait) 
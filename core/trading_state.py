@@ -11,13 +11,19 @@
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from dataclasses import dataclass
-import json
+from dataclasses import dataclass, replace
+import time
+import numpy as np
 
-@dataclass
+from . import json_utils
+
+@dataclass(slots=True, frozen=True)
 class Position:
     """
     거래 포지션 정보를 담는 데이터 클래스
+
+    TradingState 의 열 배열과 값이 항상 같도록 변경할 수 없게 두며,
+    추가 매수나 수수료 누적은 TradingState.adjust_position 으로 반영한다.
     
     Attributes:
         market (str): 거래 마켓 코드
@@ -49,8 +55,7 @@ class TradingState:
                 기본값: 'config.json'
         """
         # 설정 파일 로드
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = json_utils.load_file_cached(config_path)
             
         # 거래 설정 로드
         self.trading_config = self.config['trading']
@@ -58,7 +63,17 @@ class TradingState:
         # 상태 변수 초기화
         self.active_positions: Dict[str, Position] = {}  # 활성 포지션
         self.pending_orders: Dict[str, dict] = {}       # 대기 중인 주문
-        self.market_cooldowns: Dict[str, datetime] = {} # 마켓별 거래 제한
+        self.market_cooldowns: Dict[str, float] = {}    # 마켓별 거래 제한 해제 시각 (time.monotonic 기준)
+
+        # 포트폴리오 일괄 계산용 열 배열 (슬롯 i 는 self._markets[i] 의 포지션)
+        capacity = self.trading_config['max_positions']
+        self._markets: List[str] = []
+        self._market_idx: Dict[str, int] = {}
+        self._entry_price = np.zeros(capacity)
+        self._volume = np.zeros(capacity)
+        self._fee = np.zeros(capacity)
+        # update_position 이 매번 새 dict 를 만들지 않도록 포지션별로 재사용하는 결과 dict
+        self._position_views: Dict[str, dict] = {}
         
     def can_open_position(self, market: str) -> tuple[bool, str]:
         """
@@ -84,10 +99,12 @@ class TradingState:
             return False, "최대 포지션 수 초과"
 
         # 거래 제한 체크
-        if market in self.market_cooldowns:
-            cooldown_end = self.market_cooldowns[market]
-            if datetime.now() < cooldown_end:
-                return False, f"거래 제한 중 (해제: {cooldown_end.strftime('%H:%M:%S')})"
+        cooldown_end = self.market_cooldowns.get(market)
+        if cooldown_end is not None:
+            remaining = cooldown_end - time.monotonic()
+            if remaining > 0:
+                release = datetime.now() + timedelta(seconds=remaining)
+                return False, f"거래 제한 중 (해제: {release.strftime('%H:%M:%S')})"
             
         return True, ""
         
@@ -121,8 +138,61 @@ class TradingState:
         )
         
         self.active_positions[market] = position
+
+        # 열 배열의 다음 슬롯에 기록 (설정보다 많아지면 배열 확장)
+        slot = len(self._markets)
+        if slot == len(self._volume):
+            size = max(1, slot * 2)
+            self._entry_price = np.resize(self._entry_price, size)
+            self._volume = np.resize(self._volume, size)
+            self._fee = np.resize(self._fee, size)
+        self._markets.append(market)
+        self._market_idx[market] = slot
+        self._entry_price[slot] = price
+        self._volume[slot] = volume
+        self._fee[slot] = fee
+        self._position_views[market] = {
+            'unrealized_profit': 0.0,
+            'profit_percent': 0.0,
+            'holding_time': timedelta(0)
+        }
         return position
         
+    def adjust_position(self, market: str, price: Optional[float] = None,
+                        volume: Optional[float] = None, fee: float = 0.0) -> Position:
+        """
+        보유 포지션의 진입가/수량 변경 및 수수료 누적
+
+        Position 은 변경할 수 없으므로 새 객체로 교체하고 열 배열도 함께 갱신한다.
+
+        Args:
+            market (str): 거래 마켓 코드
+            price (float, optional): 새 진입 가격 (None 이면 유지)
+            volume (float, optional): 새 보유 수량 (None 이면 유지)
+            fee (float, optional): 누적 수수료에 더할 금액
+                기본값: 0.0
+
+        Returns:
+            Position: 변경된 포지션 객체
+
+        Raises:
+            KeyError: 보유 중인 포지션이 없는 경우
+        """
+        position = self.active_positions[market]
+        position = replace(
+            position,
+            entry_price=position.entry_price if price is None else price,
+            volume=position.volume if volume is None else volume,
+            total_fee=position.total_fee + fee,
+        )
+        self.active_positions[market] = position
+
+        slot = self._market_idx[market]
+        self._entry_price[slot] = position.entry_price
+        self._volume[slot] = position.volume
+        self._fee[slot] = position.total_fee
+        return position
+
     def remove_position(self, market: str) -> Optional[Position]:
         """
         포지션 종료 및 제거
@@ -133,7 +203,53 @@ class TradingState:
         Returns:
             Optional[Position]: 제거된 포지션 객체 (없으면 None)
         """
-        return self.active_positions.pop(market, None)
+        position = self.active_positions.pop(market, None)
+        if position is not None:
+            self._position_views.pop(market, None)
+            # 마지막 슬롯을 빈 자리로 옮겨 배열을 빈틈없이 유지
+            slot = self._market_idx.pop(market)
+            last = len(self._markets) - 1
+            if slot != last:
+                moved = self._markets[last]
+                self._markets[slot] = moved
+                self._market_idx[moved] = slot
+                self._entry_price[slot] = self._entry_price[last]
+                self._volume[slot] = self._volume[last]
+                self._fee[slot] = self._fee[last]
+            self._markets.pop()
+        return position
+
+    @property
+    def position_markets(self) -> List[str]:
+        """update_all 에 넘길 현재가 배열의 마켓 순서"""
+        return list(self._markets)
+
+    def update_all(self, current_prices: np.ndarray) -> Dict[str, dict]:
+        """
+        전체 포지션의 미실현 손익을 한 번에 계산
+
+        Args:
+            current_prices (np.ndarray): position_markets 순서의 현재가 배열
+
+        Returns:
+            Dict[str, dict]: 마켓별 unrealized_profit, profit_percent, volume
+                (notify_position_update 에 그대로 전달 가능)
+        """
+        n = len(self._markets)
+        prices = np.asarray(current_prices, dtype=np.float64)
+        entry = self._entry_price[:n]
+        volume = self._volume[:n]
+        unrealized = volume * (prices - entry) - self._fee[:n]
+        profit_percent = (prices / entry - 1) * 100
+        return {
+            market: {
+                'unrealized_profit': u,
+                'profit_percent': p,
+                'volume': v,
+            }
+            for market, u, p, v in zip(self._markets, unrealized.tolist(),
+                                       profit_percent.tolist(), volume.tolist())
+        }
         
     def update_position(self, market: str, current_price: float) -> dict:
         """
@@ -144,7 +260,7 @@ class TradingState:
             current_price (float): 현재 가격
             
         Returns:
-            dict: 업데이트된 포지션 정보
+            dict: 업데이트된 포지션 정보 (포지션별로 재사용되는 dict 이므로 읽기 전용으로 사용)
                 - unrealized_profit: 미실현 손익
                 - profit_percent: 수익률
                 - holding_time: 보유 시간
@@ -164,11 +280,11 @@ class TradingState:
         # 보유 시간 계산
         holding_time = datetime.now() - position.entry_time
         
-        return {
-            'unrealized_profit': unrealized_profit,
-            'profit_percent': profit_percent,
-            'holding_time': holding_time
-        }
+        view = self._position_views[market]
+        view['unrealized_profit'] = unrealized_profit
+        view['profit_percent'] = profit_percent
+        view['holding_time'] = holding_time
+        return view
         
     def set_market_cooldown(self, market: str, minutes: int):
         """
@@ -178,7 +294,7 @@ class TradingState:
             market (str): 거래 마켓 코드
             minutes (int): 제한 시간 (분)
         """
-        self.market_cooldowns[market] = datetime.now() + timedelta(minutes=minutes)
+        self.market_cooldowns[market] = time.monotonic() + minutes * 60
         
     def get_state_summary(self) -> Dict:
         """
@@ -190,9 +306,9 @@ class TradingState:
                 - pending_orders: 대기 주문 수
                 - restricted_markets: 거래 제한 마켓 수
         """
+        now = time.monotonic()
         return {
             'active_positions': len(self.active_positions),
             'pending_orders': len(self.pending_orders),
-            'restricted_markets': len([m for m, t in self.market_cooldowns.items()
-                                    if datetime.now() < t])
+            'restricted_markets': sum(1 for t in self.market_cooldowns.values() if now < t)
         } 
\ No newline at end of file
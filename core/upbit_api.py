@@ -12,71 +12,246 @@ Last Updated: 2024-03-21
 """
 
 import os
-import jwt
+import json
+import hmac
+import base64
 import uuid
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import numpy as np
+import threading
 import time
+from functools import lru_cache, wraps
 from urllib.parse import urlencode
 from dotenv import load_dotenv
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 requests 의 json 파싱 사용
+    orjson = None
+
+try:
+    import pyupbit
+except ImportError:  # pyupbit 미설치 시 pyupbit 기반 조회/주문 기능은 비활성화
+    pyupbit = None
+
+from .upbit_async import REQUESTS_PER_SECOND, run_fetch_many
+
+# 마켓 목록은 거의 바뀌지 않으므로 1시간 동안 재사용
+MARKETS_CACHE_TTL = 3600
+# 시세 조회 결과 재사용 시간(초). 일봉은 변화가 느려 길게 유지한다.
+QUOTE_CACHE_TTL = 1.0
+# 호가는 시세보다 빨리 바뀌므로 더 짧게 유지한다
+ORDERBOOK_CACHE_TTL = 0.5
+DAY_OHLCV_CACHE_TTL = 30.0
+QUOTE_CACHE_MAXSIZE = 2048
+
+_DOTENV_LOADED = False
+
+
+def _load_env_once():
+    """프로젝트 루트의 .env 를 프로세스당 한 번만 로드"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(Path(__file__).resolve().parents[1] / '.env')
+        _DOTENV_LOADED = True
+
+
+def _ttl_cached(ttl: float):
+    """메서드 결과를 인스턴스의 _quote_cache 에 ttl 초 동안 보관 (None 은 보관하지 않음)"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (func.__name__, args, tuple(kwargs.items()))
+            value = self._cache_get(key)
+            if value is None:
+                value = func(self, *args, **kwargs)
+                self._cache_put(key, value, ttl)
+            return value
+        return wrapper
+    return decorator
+
+
+def _key_mentions(key, market: str) -> bool:
+    """캐시 키(중첩 tuple)에 마켓 코드가 인자로 들어 있는지 확인"""
+    for part in key:
+        if part == market or (isinstance(part, tuple) and _key_mentions(part, market)):
+            return True
+    return False
+
+
+def _parse(response: requests.Response):
+    """응답 본문 JSON 파싱 (orjson 이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+_JWT_HEADER = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def _jwt_from_body(body: bytes, mac) -> str:
+    """직렬화된 payload 와 키가 설정된(아직 갱신하지 않은) HMAC-SHA256 객체로 HS256 JWT 생성
+
+    PyJWT 의 알고리즘 조회/헤더 직렬화 과정을 생략한다.
+    """
+    message = _JWT_HEADER + b'.' + _b64url(body)
+    mac.update(message)
+    return (message + b'.' + _b64url(mac.digest())).decode('ascii')
+
+
+@lru_cache(maxsize=512)
+def _query_hash(items: tuple) -> str:
+    """쿼리 항목(순서 포함)의 SHA512 해시
+
+    nonce 는 요청마다 새로 발급해야 하므로(재사용 시 nonce_used 오류)
+    완성된 JWT 가 아닌 쿼리 해시만 캐시한다. 리스트 값은 _freeze_query 로
+    튜플로 바꿔 넘기며, requests 와 같이 키를 반복해 인코딩한다(states[]=a&states[]=b).
+    """
+    # urlencode 결과는 퍼센트 인코딩된 ASCII 문자열
+    return hashlib.sha512(urlencode(items, doseq=True).encode('ascii')).hexdigest()
+
+
+def _freeze_query(query: dict) -> tuple:
+    """lru_cache 키로 쓸 수 있도록 쿼리 항목의 리스트 값을 튜플로 변환"""
+    return tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in query.items())
+
+
 class UpbitAPI:
     def __init__(self, access_key: str = None, secret_key: str = None):
         """UpbitAPI 클래스 초기화"""
-        dotenv_path = Path(__file__).resolve().parents[1] / '.env'
-        load_dotenv(dotenv_path)
+        _load_env_once()
         self.logger = logging.getLogger('UpbitAPI')
         self.access_key = access_key or os.getenv('UPBIT_ACCESS_KEY')
         self.secret_key = secret_key or os.getenv('UPBIT_SECRET_KEY')
         self.server_url = 'https://api.upbit.com'
+        self.session = self._create_session()
+        self._markets_cache = ([], 0.0)  # (KRW 마켓 목록, 조회 시각(monotonic))
+        self._quote_cache = {}  # {키: (만료 시각(monotonic), 값)}
+        # 여러 스레드가 시세를 조회하고 주문 직후 캐시를 지우므로 모든 접근을 락으로 보호한다
+        self._quote_lock = threading.Lock()
 
         if not self.access_key or not self.secret_key:
             self.logger.error("업비트 API 키가 설정되지 않았습니다. .env 파일을 확인해주세요.")
             self.upbit = None
+        elif pyupbit is None:
+            self.logger.error("pyupbit 가 설치되지 않아 잔고/시장가 주문 기능을 사용할 수 없습니다.")
+            self.upbit = None
         else:
-            import pyupbit
             self.upbit = pyupbit.Upbit(self.access_key, self.secret_key)
 
-        # 시장 분석을 위한 가중치 설정
-        self.WEIGHTS = {
-            'trend': 0.3,        # 추세 강도 (30%)
-            'volatility': 0.3,   # 변동성 (30%)
-            'volume': 0.2,       # 거래량 (20%)
-            'market_dominance': 0.2  # 시장 지배력 (20%)
-        }
+        if self.access_key and self.secret_key:
+            self._get_token = self._make_signer()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """커넥션 풀과 재시도 정책이 설정된 HTTP 세션 생성
+
+        주문(POST) 중복을 막기 위해 재시도는 GET 요청에만 적용한다.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _make_signer(self):
+        """키가 바인딩된 JWT 서명 함수 생성
+
+        키는 생성 후 바뀌지 않으므로 속성 조회를 클로저로 미리 묶어 두고,
+        요청마다 nonce 와 (있으면) query_hash 만 채운다.
+        """
+        access_key = self.access_key
+        logger = self.logger
+        # 키 패딩 계산이 끝난 HMAC 객체를 복사해 쓰면 요청마다 키를 다시 처리하지 않는다
+        base_mac = hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256)
+        # 쿼리가 없는 토큰은 nonce 만 다르므로 JSON 앞부분을 미리 직렬화해 둔다.
+        # 토큰 자체는 재사용하지 않는다(업비트는 같은 nonce 를 nonce_used 로 거부).
+        keyless_prefix = _dumps({'access_key': access_key})[:-1] + b',"nonce":"'
+
+        def sign(query=None):
+            try:
+                nonce = uuid.uuid4().hex
+                if query:
+                    body = _dumps({
+                        'access_key': access_key,
+                        'nonce': nonce,
+                        'query_hash': _query_hash(_freeze_query(query)),
+                        'query_hash_alg': 'SHA512',
+                    })
+                else:
+                    body = keyless_prefix + nonce.encode('ascii') + b'"}'
+                return {'Authorization': 'Bearer ' + _jwt_from_body(body, base_mac.copy())}
+            except Exception as e:
+                logger.error("JWT 토큰 생성 실패: %s", e)
+                return None
+
+        return sign
 
     def _get_token(self, query=None):
-        """JWT 토큰 생성"""
+        """JWT 토큰 생성 (키가 설정된 경우 __init__ 에서 _make_signer() 결과로 대체됨)"""
+        if not self.access_key or not self.secret_key:
+            self.logger.error("JWT 토큰 생성 실패: API 키가 설정되지 않았습니다")
+            return None
+        return self._make_signer()(query)
+
+    def _cache_get(self, key):
+        with self._quote_lock:
+            entry = self._quote_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key, value, ttl: float) -> None:
+        if value is None:
+            return
+        now = time.monotonic()
+        with self._quote_lock:
+            if len(self._quote_cache) >= QUOTE_CACHE_MAXSIZE:
+                self._quote_cache = {k: v for k, v in self._quote_cache.items() if v[0] > now}
+                if len(self._quote_cache) >= QUOTE_CACHE_MAXSIZE:
+                    self._quote_cache.clear()
+            self._quote_cache[key] = (now + ttl, value)
+
+    def clear_caches(self) -> None:
+        """시세/마켓 목록 캐시 초기화"""
+        with self._quote_lock:
+            self._quote_cache.clear()
+        self._markets_cache = ([], 0.0)
+
+    def invalidate_market(self, market: str) -> None:
+        """한 마켓의 시세/호가 캐시만 제거 (주문 직후 다음 조회가 새 값을 받도록)
+
+        주문이 끝난 뒤 호출되므로 예외를 밖으로 내보내지 않는다 (캐시 정리 실패가 주문 결과를 바꾸면 안 됨).
+        """
         try:
-            payload = {
-                'access_key': self.access_key,
-                'nonce': str(uuid.uuid4())
-            }
-            
-            if query:
-                query_string = urlencode(query).encode()
-                m = hashlib.sha512()
-                m.update(query_string)
-                query_hash = m.hexdigest()
-                payload['query_hash'] = query_hash
-                payload['query_hash_alg'] = 'SHA512'
-
-            jwt_token = jwt.encode(
-                payload=payload,
-                key=self.secret_key,
-                algorithm='HS256'
-            )
-            
-            if isinstance(jwt_token, bytes):
-                jwt_token = jwt_token.decode('utf-8')
-            
-            return {'Authorization': f'Bearer {jwt_token}'}
+            with self._quote_lock:
+                self._quote_cache = {
+                    k: v for k, v in self._quote_cache.items() if not _key_mentions(k, market)
+                }
         except Exception as e:
-            self.logger.error(f"JWT 토큰 생성 실패: {str(e)}")
-            return None
+            self.logger.error("시세 캐시 정리 실패: %s", e)
 
     def get_account(self):
         """계좌 정보 조회"""
@@ -87,39 +262,103 @@ class UpbitAPI:
             if not headers:
                 raise Exception("인증 토큰 생성 실패")
                 
-            response = requests.get(url, headers=headers)
-            self.logger.info(f"계좌 정보 조회: {response.status_code}")
+            response = self.session.get(url, headers=headers)
+            self.logger.info("계좌 정보 조회: %s", response.status_code)
             
             if not response.ok:
-                self.logger.error(f"API 오류: {response.status_code} - {response.text}")
+                self.logger.error("API 오류: %s - %s", response.status_code, response.text)
                 return None
                 
-            return response.json()
+            return _parse(response)
         except Exception as e:
-            self.logger.error(f"계좌 정보 조회 실패: {str(e)}")
+            self.logger.error("계좌 정보 조회 실패: %s", e)
             return None
 
+    @_ttl_cached(QUOTE_CACHE_TTL)
     def get_market_info(self, market):
         """시장 정보 조회"""
         try:
             url = f"{self.server_url}/v1/ticker"
             params = {'markets': market}
-            response = requests.get(url, params=params)
-            self.logger.info(f"시장 정보 조회: {response.status_code}")
-            return response.json()[0] if response.ok else None
+            response = self.session.get(url, params=params)
+            self.logger.info("시장 정보 조회: %s", response.status_code)
+            return _parse(response)[0] if response.ok else None
         except Exception as e:
-            self.logger.error(f"시장 정보 조회 실패: {str(e)}")
+            self.logger.error("시장 정보 조회 실패: %s", e)
             return None
 
-    def get_monitored_markets(self):
-        """모니터링 중인 마켓 정보 조회"""
+    def get_market_infos(self, markets):
+        """여러 마켓의 시세 정보를 한 번의 요청으로 조회
+
+        Args:
+            markets (Iterable[str]): 마켓 코드 목록
+
+        Returns:
+            Dict[str, dict]: 마켓 코드별 시세 정보 (실패 시 빈 dict)
+        """
+        markets = list(markets)
+        if not markets:
+            return {}
+        try:
+            url = f"{self.server_url}/v1/ticker"
+            params = {'markets': ','.join(markets)}
+            response = self.session.get(url, params=params)
+            self.logger.info("시장 정보 일괄 조회: %s", response.status_code)
+            if response.ok:
+                infos = {item['market']: item for item in _parse(response)}
+                # 직후의 마켓별 get_market_info 호출이 다시 요청하지 않도록 같은 키로 캐시해 둔다
+                for market, info in infos.items():
+                    self._cache_put(('get_market_info', (market,), ()), info, QUOTE_CACHE_TTL)
+                return infos
+            # 존재하지 않는 마켓이 섞이면(404 Code not found) 전체 요청이 실패하므로 개별 조회로 대체.
+            # 429/5xx 등 다른 오류에서 개별 조회로 요청을 늘리면 요청 제한에 더 걸리기만 한다.
+            if response.status_code == 404 and "Code not found" in response.text and len(markets) > 1:
+                return self._get_market_infos_each(markets)
+            self.logger.error("시장 정보 일괄 조회 실패: %s - %s", response.status_code, response.text)
+            return {}
+        except Exception as e:
+            self.logger.error("시장 정보 일괄 조회 실패: %s", e)
+            return {}
+
+    def _get_market_infos_each(self, markets):
+        """마켓별 개별 시세 조회 (가능하면 비동기로 동시에 요청, 초당 REQUESTS_PER_SECOND 회로 제한)"""
+        urls = [f"{self.server_url}/v1/ticker?markets={market}" for market in markets]
+        try:
+            results = run_fetch_many(urls)
+        except RuntimeError:
+            # 이벤트 루프 안에서 호출된 경우 순차 조회
+            results = [None] * len(markets)
+            for i, market in enumerate(markets):
+                if i:
+                    time.sleep(1 / REQUESTS_PER_SECOND)
+                info = self.get_market_info(market)
+                results[i] = [info] if info else None
+        return {
+            market: result[0]
+            for market, result in zip(markets, results)
+            if result
+        }
+
+    def get_monitored_markets(self, force_refresh: bool = False):
+        """모니터링 중인 마켓 정보 조회
+
+        Args:
+            force_refresh (bool): True 이면 캐시를 무시하고 다시 조회
+        """
+        markets, fetched_at = self._markets_cache
+        if markets and not force_refresh and time.monotonic() - fetched_at < MARKETS_CACHE_TTL:
+            return markets
         try:
             url = f"{self.server_url}/v1/market/all"
-            response = requests.get(url)
-            self.logger.info(f"모니터링 마켓 조회: {response.status_code}")
-            return [item for item in response.json() if item['market'].startswith('KRW-')] if response.ok else []
+            response = self.session.get(url)
+            self.logger.info("모니터링 마켓 조회: %s", response.status_code)
+            if not response.ok:
+                return []
+            markets = [item for item in _parse(response) if item['market'].startswith('KRW-')]
+            self._markets_cache = (markets, time.monotonic())
+            return markets
         except Exception as e:
-            self.logger.error(f"모니터링 마켓 조회 실패: {str(e)}")
+            self.logger.error("모니터링 마켓 조회 실패: %s", e)
             return []
 
     def get_market_status(self):
@@ -128,17 +367,14 @@ class UpbitAPI:
             markets = self.get_monitored_markets()
             market_codes = [market['market'] for market in markets[:10]]  # Top 10 마켓만 분석
             
-            total_change = 0
-            valid_markets = 0
-            
-            for market in market_codes:
-                info = self.get_market_info(market)
-                if info:
-                    total_change += info['signed_change_rate']
-                    valid_markets += 1
+            infos = self.get_market_infos(market_codes)
+            changes = np.array(
+                [infos[market]['signed_change_rate'] for market in market_codes if infos.get(market)],
+                dtype=float,
+            )
             
-            if valid_markets > 0:
-                average_change = total_change / valid_markets
+            if changes.size > 0:
+                average_change = float(changes.mean())
                 
                 # 시장 상태 판단
                 if average_change > 0.02:
@@ -151,12 +387,12 @@ class UpbitAPI:
                     status = 'NEUTRAL'
                     confidence = 0.5
                 
-                self.logger.info(f"시장 상태 분석 완료: {status} ({confidence:.2%})")
+                self.logger.info("시장 상태 분석 완료: %s (%.2f%%)", status, confidence * 100)
                 return {'condition': status, 'confidence': confidence}
             
             return {'condition': 'NEUTRAL', 'confidence': 0.5}
         except Exception as e:
-            self.logger.error(f"시장 상태 분석 실패: {str(e)}")
+            self.logger.error("시장 상태 분석 실패: %s", e)
             return {'condition': 'NEUTRAL', 'confidence': 0.5}
 
     def calculate_total_assets(self):
@@ -166,34 +402,45 @@ class UpbitAPI:
             if not accounts:
                 return {'total_assets': 0, 'total_profit': 0, 'profit_rate': 0}
 
-            total_assets = 0
-            total_invested = 0
+            # 통화 코드로 바로 찾을 수 있도록 계좌 목록을 dict 로 변환
+            accounts_by_currency = {account['currency']: account for account in accounts}
+            krw_account = accounts_by_currency.pop('KRW', None)
+            krw_balance = float(krw_account['balance']) if krw_account else 0.0
 
-            for account in accounts:
-                if account['currency'] == 'KRW':
-                    total_assets += float(account['balance'])
-                else:
-                    market = f"KRW-{account['currency']}"
-                    market_info = self.get_market_info(market)
-                    if market_info:
-                        current_price = float(market_info['trade_price'])
-                        balance = float(account['balance'])
-                        avg_buy_price = float(account['avg_buy_price'])
-                        
-                        total_assets += current_price * balance
-                        total_invested += avg_buy_price * balance
+            # 보유 코인 시세를 한 번에 조회
+            infos = self.get_market_infos(f"KRW-{currency}" for currency in accounts_by_currency)
+            price_by_market = {
+                market: float(info['trade_price']) for market, info in infos.items()
+            }
+
+            # 시세를 조회하지 못한 코인은 평가/투자금액 모두에서 제외
+            coins = [
+                account for currency, account in accounts_by_currency.items()
+                if f"KRW-{currency}" in price_by_market
+            ]
+            n = len(coins)
+            balances = np.fromiter((float(a['balance']) for a in coins), dtype=np.float64, count=n)
+            avg_prices = np.fromiter((float(a['avg_buy_price']) for a in coins), dtype=np.float64, count=n)
+            prices = np.fromiter(
+                (price_by_market[f"KRW-{a['currency']}"] for a in coins), dtype=np.float64, count=n
+            )
+
+            total_assets = krw_balance + float(prices @ balances)
+            total_invested = float(avg_prices @ balances)
 
             total_profit = total_assets - total_invested
             profit_rate = (total_profit / total_invested * 100) if total_invested > 0 else 0
 
-            self.logger.info(f"총 자산 계산 완료: {total_assets:,.0f}원 (수익률: {profit_rate:.2f}%)")
+            if self.logger.isEnabledFor(logging.INFO):
+                # 천 단위 구분 기호는 % 포맷으로 표현할 수 없어 출력될 때만 f-string 생성
+                self.logger.info(f"총 자산 계산 완료: {total_assets:,.0f}원 (수익률: {profit_rate:.2f}%)")
             return {
                 'total_assets': total_assets,
                 'total_profit': total_profit,
                 'profit_rate': profit_rate
             }
         except Exception as e:
-            self.logger.error(f"총 자산 계산 실패: {str(e)}")
+            self.logger.error("총 자산 계산 실패: %s", e)
             return {'total_assets': 0, 'total_profit': 0, 'profit_rate': 0}
 
     def place_order(self, market, side, volume=None, price=None, ord_type='limit'):
@@ -238,28 +485,32 @@ class UpbitAPI:
             if not headers:
                 raise Exception("인증 토큰 생성 실패")
 
-            self.logger.info(f"주문 요청 데이터: {data}")
+            self.logger.info("주문 요청 데이터: %s", data)
 
-            response = requests.post(url, json=data, headers=headers)
-            self.logger.info(f"주문 실행: {response.status_code}")
-            self.logger.info(f"주문 응답: {response.text}")
+            response = self.session.post(url, json=data, headers=headers)
+            self.logger.info("주문 실행: %s", response.status_code)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("주문 응답: %s", response.text)
 
             if not response.ok:
                 try:
-                    err_json = response.json()
+                    err_json = _parse(response)
                     error_detail = err_json.get('error', {}).get('message', response.text)
                 except Exception:
                     error_detail = response.text
-                self.logger.error(f"API 오류: {response.status_code} - {error_detail}")
+                self.logger.error("API 오류: %s - %s", response.status_code, error_detail)
                 return {'error': error_detail, 'status': response.status_code}
 
-            result = response.json()
+            result = _parse(response)
             if isinstance(result, dict) and 'error' in result:
-                self.logger.error(f"주문 실패: {result['error'].get('message', '')}")
-            return result
+                self.logger.error("주문 실패: %s", result['error'].get('message', ''))
+                return result
         except Exception as e:
-            self.logger.error(f"주문 실행 실패: {str(e)}")
+            self.logger.error("주문 실행 실패: %s", e)
             return {'error': str(e)}
+        # 주문은 이미 접수되었으므로 캐시 정리는 주문 try 밖에서 한다
+        self.invalidate_market(market)
+        return result
 
     def get_order_status(self, uuid):
         """주문 상태 조회"""
@@ -271,16 +522,16 @@ class UpbitAPI:
             if not headers:
                 raise Exception("인증 토큰 생성 실패")
                 
-            response = requests.get(url, params=params, headers=headers)
-            self.logger.info(f"주문 상태 조회: {response.status_code}")
+            response = self.session.get(url, params=params, headers=headers)
+            self.logger.info("주문 상태 조회: %s", response.status_code)
             
             if not response.ok:
-                self.logger.error(f"API 오류: {response.status_code} - {response.text}")
+                self.logger.error("API 오류: %s - %s", response.status_code, response.text)
                 return None
                 
-            return response.json()
+            return _parse(response)
         except Exception as e:
-            self.logger.error(f"주문 상태 조회 실패: {str(e)}")
+            self.logger.error("주문 상태 조회 실패: %s", e)
             return None
 
     def cancel_order(self, uuid):
@@ -293,16 +544,16 @@ class UpbitAPI:
             if not headers:
                 raise Exception("인증 토큰 생성 실패")
                 
-            response = requests.delete(url, json=data, headers=headers)
-            self.logger.info(f"주문 취소: {response.status_code}")
+            response = self.session.delete(url, json=data, headers=headers)
+            self.logger.info("주문 취소: %s", response.status_code)
             
             if not response.ok:
-                self.logger.error(f"API 오류: {response.status_code} - {response.text}")
+                self.logger.error("API 오류: %s - %s", response.status_code, response.text)
                 return False
                 
             return True
         except Exception as e:
-            self.logger.error(f"주문 취소 실패: {str(e)}")
+            self.logger.error("주문 취소 실패: %s", e)
             return False
 
     # ===== 추가된 편의 기능들 =====
@@ -315,29 +566,35 @@ class UpbitAPI:
             balance = self.upbit.get_balance(ticker)
             return float(balance) if balance else 0.0
         except Exception as e:
-            self.logger.error(f"잔고 조회 실패: {str(e)}")
+            self.logger.error("잔고 조회 실패: %s", e)
             return 0.0
 
+    @_ttl_cached(QUOTE_CACHE_TTL)
     def get_current_price(self, market: str):
         """현재가 조회"""
         try:
-            import pyupbit
             price = pyupbit.get_current_price(market)
             return float(price) if price else None
         except Exception as e:
-            self.logger.error(f"현재가 조회 실패: {str(e)}")
+            self.logger.error("현재가 조회 실패: %s", e)
             return None
 
     def get_ohlcv(self, market: str, interval: str, count: int):
-        """OHLCV 데이터 조회"""
+        """OHLCV 데이터 조회 (반환된 DataFrame 은 캐시와 공유되므로 수정하지 말 것)"""
+        key = ('get_ohlcv', market, interval, count)
+        df = self._cache_get(key)
+        if df is not None:
+            return df
         try:
-            import pyupbit
             df = pyupbit.get_ohlcv(market, interval=interval, count=count)
+            ttl = DAY_OHLCV_CACHE_TTL if interval == 'day' else QUOTE_CACHE_TTL
+            self._cache_put(key, df, ttl)
             return df
         except Exception as e:
-            self.logger.error(f"OHLCV 조회 실패: {str(e)}")
+            self.logger.error("OHLCV 조회 실패: %s", e)
             return None
 
+    @_ttl_cached(ORDERBOOK_CACHE_TTL)
     def get_orderbook(self, market: str, retries: int = 3, delay: float = 0.1):
         """호가 정보 조회
 
@@ -352,7 +609,6 @@ class UpbitAPI:
         last_error = None
         for attempt in range(1, retries + 1):
             try:
-                import pyupbit
                 orderbook = pyupbit.get_orderbook(ticker=market)
                 if orderbook:
                     # pyupbit returns dict when a single ticker is given,
@@ -362,12 +618,12 @@ class UpbitAPI:
                     return orderbook
                 last_error = ValueError("orderbook empty")
                 self.logger.error(
-                    f"호가 조회 실패: 결과 없음 (attempt {attempt}/{retries})"
+                    "호가 조회 실패: 결과 없음 (attempt %s/%s)", attempt, retries
                 )
             except Exception as e:
                 last_error = e
                 self.logger.error(
-                    f"호가 조회 실패: {e!r} (attempt {attempt}/{retries})"
+                    "호가 조회 실패: %r (attempt %s/%s)", e, attempt, retries
                 )
 
             if attempt < retries:
@@ -375,18 +631,17 @@ class UpbitAPI:
 
         if last_error:
             self.logger.error(
-                f"호가 조회 실패: 재시도 {retries}회 후 포기 - {last_error!r}"
+                "호가 조회 실패: 재시도 %s회 후 포기 - %r", retries, last_error
             )
         return None
 
     def get_recent_trades(self, market: str, count: int = 100):
         """최근 체결 내역 조회"""
         try:
-            import pyupbit
             trades = pyupbit.get_recent_trades(market, count=count)
             return trades
         except Exception as e:
-            self.logger.error(f"최근 체결 조회 실패: {str(e)}")
+            self.logger.error("최근 체결 조회 실패: %s", e)
             return []
 
     def buy_market_order(self, market: str, price: float):
@@ -395,13 +650,14 @@ class UpbitAPI:
             return None
         try:
             order = self.upbit.buy_market_order(market, price)
-            if order and 'error' not in order:
-                return order
-            self.logger.error(f"시장가 매수 실패: {order.get('error', {}).get('message', '')}")
-            return None
+            if not order or 'error' in order:
+                self.logger.error("시장가 매수 실패: %s", (order or {}).get('error', {}).get('message', ''))
+                return None
         except Exception as e:
-            self.logger.error(f"시장가 매수 실패: {str(e)}")
+            self.logger.error("시장가 매수 실패: %s", e)
             return None
+        self.invalidate_market(market)
+        return order
 
     def sell_market_order(self, market: str, volume: float):
         """시장가 매도"""
@@ -409,13 +665,14 @@ class UpbitAPI:
             return None
         try:
             order = self.upbit.sell_market_order(market, volume)
-            if order and 'error' not in order:
-                return order
-            self.logger.error(f"시장가 매도 실패: {order.get('error', {}).get('message', '')}")
-            return None
+            if not order or 'error' in order:
+                self.logger.error("시장가 매도 실패: %s", (order or {}).get('error', {}).get('message', ''))
+                return None
         except Exception as e:
-            self.logger.error(f"시장가 매도 실패: {str(e)}")
+            self.logger.error("시장가 매도 실패: %s", e)
             return None
+        self.invalidate_market(market)
+        return order
 
     def get_order_info(self, uuid: str):
         """주문 정보 조회"""
@@ -424,7 +681,7 @@ class UpbitAPI:
         try:
             return self.upbit.get_order(uuid)
         except Exception as e:
-            self.logger.error(f"주문 정보 조회 실패: {str(e)}")
+            self.logger.error("주문 정보 조회 실패: %s", e)
             return None
 
     def get_open_orders(self, market: str, state: str = 'wait'):
@@ -433,43 +690,38 @@ class UpbitAPI:
             params = {'market': market, 'state': state}
             return self.send_request('GET', f'{self.server_url}/v1/orders', params)
         except Exception as e:
-            self.logger.error(f"미체결 주문 조회 실패: {str(e)}")
+            self.logger.error("미체결 주문 조회 실패: %s", e)
             return None
 
     def get_top_volume_tickers(self, base: str = "KRW", count: int = 100):
-        """거래량 상위 티커 조회"""
+        """거래량 상위 티커 조회 (24시간 누적 거래대금 기준)"""
         try:
-            import pyupbit
             tickers = pyupbit.get_tickers(fiat=base)
-            volumes = []
-            for ticker in tickers:
-                current_price = self.get_current_price(ticker)
-                if not current_price:
-                    continue
-                daily = self.get_ohlcv(ticker, "day", 1)
-                if daily is None or daily.empty:
-                    continue
-                volume = daily['volume'].iloc[-1] * current_price
-                volumes.append((ticker, volume))
+            infos = self.get_market_infos(tickers)
+            volumes = [
+                (ticker, float(infos[ticker]['acc_trade_price_24h']))
+                for ticker in tickers
+                if ticker in infos
+            ]
             volumes.sort(key=lambda x: x[1], reverse=True)
             return [v[0] for v in volumes[:count]]
         except Exception as e:
-            self.logger.error(f"거래량 상위 티커 조회 실패: {str(e)}")
+            self.logger.error("거래량 상위 티커 조회 실패: %s", e)
             return []
 
     def get_investable_tickers(self, min_price: float, max_price: float):
         """투자 가능한 티커 조회"""
         try:
-            import pyupbit
             tickers = pyupbit.get_tickers(fiat="KRW")
+            infos = self.get_market_infos(tickers)
             investable = []
             for ticker in tickers:
-                price = self.get_current_price(ticker)
-                if price and min_price <= price <= max_price:
+                info = infos.get(ticker)
+                if info and min_price <= float(info['trade_price']) <= max_price:
                     investable.append(ticker)
             return investable
         except Exception as e:
-            self.logger.error(f"투자 가능 티커 조회 실패: {str(e)}")
+            self.logger.error("투자 가능 티커 조회 실패: %s", e)
             return []
 
     def send_request(self, method: str, url: str, params: dict = None):
@@ -478,15 +730,15 @@ class UpbitAPI:
             method = method.upper()
             headers = self._get_token(params)
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=params)
+                response = self.session.get(url, headers=headers, params=params)
             elif method == 'POST':
-                response = requests.post(url, headers=headers, json=params)
+                response = self.session.post(url, headers=headers, json=params)
             elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, json=params)
+                response = self.session.delete(url, headers=headers, json=params)
             else:
                 return None
             response.raise_for_status()
-            return response.json()
+            return _parse(response)
         except Exception as e:
-            self.logger.error(f"API 요청 실패: {str(e)}")
+            self.logger.error("API 요청 실패: %s", e)
             return None
@@ -0,0 +1,83 @@
+"""
+업비트 공개 API 비동기 일괄 조회
+
+여러 마켓을 개별 요청으로 조회해야 할 때 aiohttp 로 동시에 요청한다.
+스레드 없이 한 이벤트 루프에서 처리하며, 요청 시작 간격과 동시 요청 수를 함께 제한한다.
+"""
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Sequence
+
+import aiohttp
+
+logger = logging.getLogger('UpbitAPI')
+
+# 업비트 시세 조회 API 요청 제한(초당 10회)에 여유를 두고 초당 8회로 요청 시작 간격을 둔다.
+# 동시 요청 수 제한만으로는 초당 요청 수가 제한되지 않으므로 두 값을 함께 적용한다.
+REQUESTS_PER_SECOND = 8
+MAX_CONCURRENCY = 8
+REQUEST_TIMEOUT = 10
+
+
+class _Pacer:
+    """요청 시작 시각을 최소 interval 간격으로 예약 (한 이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def _fetch(session: aiohttp.ClientSession, sem: asyncio.Semaphore, pacer: _Pacer,
+                 url: str) -> Optional[Any]:
+    async with sem:
+        await pacer.wait()
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    logger.error("비동기 조회 실패: %s - %s", response.status, url)
+                    return None
+                return await response.json()
+        except Exception as e:
+            logger.error("비동기 조회 실패: %s - %s", url, e)
+            return None
+
+
+async def fetch_many(session: aiohttp.ClientSession, urls: Sequence[str],
+                     limit: int = MAX_CONCURRENCY,
+                     rate: float = REQUESTS_PER_SECOND) -> List[Optional[Any]]:
+    """여러 URL 을 동시에 GET 요청 (초당 rate 회, 최대 limit 개 동시 요청)
+
+    Returns:
+        List[Optional[Any]]: urls 와 같은 순서의 JSON 응답 (실패한 요청은 None)
+    """
+    sem = asyncio.Semaphore(limit)
+    pacer = _Pacer(1 / rate)
+    return await asyncio.gather(*(_fetch(session, sem, pacer, url) for url in urls))
+
+
+async def _fetch_many_with_session(urls: Sequence[str], limit: int, rate: float) -> List[Optional[Any]]:
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await fetch_many(session, urls, limit, rate)
+
+
+def run_fetch_many(urls: Sequence[str], limit: int = MAX_CONCURRENCY,
+                   rate: float = REQUESTS_PER_SECOND) -> List[Optional[Any]]:
+    """fetch_many 의 동기 래퍼
+
+    이미 이벤트 루프가 실행 중인 스레드에서는 asyncio.run 을 쓸 수 없으므로
+    RuntimeError 가 발생한다. 이 경우 호출 측에서 순차 조회로 대체한다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_fetch_many_with_session(urls, limit, rate))
+    raise RuntimeError("이벤트 루프가 실행 중인 스레드에서는 run_fetch_many 를 사용할 수 없습니다")
@@ -386,6 +386,14 @@ socket.on('settings_updated', (settings) => {
     loadSettings();
 });
 
+// 서버는 바뀐 항목만 보내므로 현재 설정에 병합해서 반영
+socket.on('settings_patch', (patch) => {
+    console.log('Settings patch from server');
+    currentSettings = mergeDeep(currentSettings, patch);
+    updateFormValues(currentSettings);
+    updateExcludedCoinsList(currentSettings.trading?.coin_selection?.excluded_coins || []);
+});
+
 socket.on('settings_error', (data) => {
     showNotification(data.message, 'error');
 });
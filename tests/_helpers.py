@@ -0,0 +1,133 @@
+"""테스트 공용 도우미"""
+
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, create_autospec, patch
+
+from core import json_utils, monitoring_coin
+from core.market_analyzer import MarketAnalyzer
+from core.order_manager import OrderManager
+from core.upbit_api import UpbitAPI
+
+SELL_SETTINGS = {'TP_PCT': 0.18, 'MINIMUM_TICKS': 2}
+
+# create_autospec 는 만들 때 비용이 크므로 모듈에서 한 번만 만들고 테스트마다 초기화해 재사용한다.
+# spec 이 있어 실제 클래스에 없는 메서드나 잘못된 인자로 호출하면 테스트가 실패한다.
+_API_MOCK = create_autospec(UpbitAPI, instance=True)
+_ORDER_MANAGER_MOCK = create_autospec(OrderManager, instance=True)
+
+
+def fresh_api():
+    """호출 기록과 반환값을 초기화한 UpbitAPI mock"""
+    _API_MOCK.reset_mock(return_value=True, side_effect=True)
+    return _API_MOCK
+
+
+def fresh_order_manager():
+    """호출 기록과 반환값을 초기화한 OrderManager mock"""
+    _ORDER_MANAGER_MOCK.reset_mock(return_value=True, side_effect=True)
+    return _ORDER_MANAGER_MOCK
+
+
+def bare_analyzer(**attrs):
+    """__init__ 없이 만든 MarketAnalyzer 에 테스트에 필요한 속성만 채워 돌려준다
+
+    설정 파일, API 키, 캔들 조회 없이 메서드 하나만 검사할 때 쓴다.
+    """
+    ma = MarketAnalyzer.__new__(MarketAnalyzer)
+    for name, value in attrs.items():
+        setattr(ma, name, value)
+    return ma
+
+
+def make_analyzer(accounts, trade_price=None, *, open_positions=None, order_state='wait'):
+    """get_holdings 테스트용 MarketAnalyzer (__init__ 없이 생성, 외부 호출은 MagicMock)
+
+    accounts 는 /v1/accounts 응답, trade_price 는 모든 마켓에 공통으로 돌려줄 현재가이다.
+    """
+    ma = bare_analyzer(
+        order_manager=fresh_order_manager(),
+        api=fresh_api(),
+        _send_request=MagicMock(return_value=accounts),
+        get_market_info=MagicMock(
+            return_value=None if trade_price is None else {'trade_price': trade_price}
+        ),
+        get_sell_settings=MagicMock(return_value=dict(SELL_SETTINGS)),
+        invalid_markets=set(),
+        krw_balance=0,
+        auto_bought=set(),
+        open_positions=list(open_positions or []),
+    )
+    ma.api.get_order_info.return_value = {'state': order_state}
+    return ma
+
+
+class MemoryMonitoringFile:
+    """monitoring_coin.json 을 디스크 대신 메모리에 두는 테스트용 저장소
+
+    data 가 None 이면 파일이 없는 상태이다. 저장 시에는 실제 파일처럼 JSON 으로
+    직렬화한 바이트를 보관하므로 호출 측이 dict 를 수정해도 저장된 값은 바뀌지 않는다.
+    """
+
+    def __init__(self, data=None):
+        self.raw = None if data is None else json_utils.dumps(data)
+        self.writes = 0
+
+    @property
+    def data(self):
+        return None if self.raw is None else json_utils.loads(self.raw)
+
+    def _read(self):
+        return {} if self.raw is None else json_utils.loads(self.raw)
+
+    def _write_raw(self, raw):
+        self.raw = raw
+        self.writes += 1
+
+    @contextmanager
+    def installed(self):
+        # 이전 테스트가 마지막으로 쓴 내용이 남아 있으면 같은 내용의 저장을 건너뛰므로 비운다
+        with patch('core.monitoring_coin._read', self._read), \
+                patch('core.monitoring_coin._write_raw', self._write_raw), \
+                patch('core.monitoring_coin._last_written', None):
+            try:
+                yield self
+            finally:
+                # 백그라운드 저장이 끝난 뒤에 패치를 해제한다
+                monitoring_coin.flush()
+
+
+class WebAppTestCase(unittest.TestCase):
+    """web.app 의 전역 객체(app, config_manager, market_analyzer)를 공유하는 테스트 기반 클래스
+
+    web.app 은 Flask, SocketIO, MarketAnalyzer 를 모듈 로드 시 만들기 때문에 클래스마다
+    한 번만 가져와 재사용한다. 테스트가 바꾼 설정과 설정 파일 경로는 tearDown 에서
+    처음 상태로 되돌려 다른 테스트 모듈로 새지 않게 한다.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Flask 를 쓰지 않는 테스트가 _helpers 를 가져올 때는 web.app 을 로드하지 않는다
+        from web import app as web_app
+        cls.web = web_app
+        cls.app = web_app.app
+        cls.config_manager = web_app.config_manager
+        cls.market_analyzer = web_app.market_analyzer
+
+    def setUp(self):
+        super().setUp()
+        cm, ma = self.config_manager, self.market_analyzer
+        snapshot = json_utils.dumps({'cm': cm.config, 'ma': ma.config})
+        config_file, config_path = cm.config_file, ma.config_path
+        self.addCleanup(self._restore_web_state, snapshot, config_file, config_path)
+
+    def _restore_web_state(self, snapshot, config_file, config_path):
+        configs = json_utils.loads(snapshot)
+        self.config_manager.config = configs['cm']
+        self.market_analyzer.config = configs['ma']
+        self.config_manager.config_file = config_file
+        self.market_analyzer.config_path = config_path
+        # 설정을 직접 바꿨으므로 설정에서 파생된 캐시도 비운다
+        self.market_analyzer._monitored_cache = None
+        self.market_analyzer._sell_params_cache = None
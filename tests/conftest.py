@@ -1,2 +1,21 @@
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+# 실제 파일(설정 파일, CSV, 로그)을 읽고 쓰는 테스트 모듈
+IO_TEST_MODULES = {
+    'test_config_sync',
+    'test_log_tail',
+    'test_performance',
+    'test_record_trade_excluded',
+    'test_risk_manager',
+    'test_settings_api',
+    'test_trading_state',
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        if item.module.__name__.rsplit('.', 1)[-1] in IO_TEST_MODULES:
+            item.add_marker(pytest.mark.io)
@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+
+from _helpers import bare_analyzer
+
+
+class TestBollingerBands(unittest.TestCase):
+    def test_matches_windowed_std(self):
+        rng = np.random.default_rng(5)
+        prices = 50_000_000 + rng.random(100) * 100_000
+        bands = bare_analyzer().calculate_bollinger_bands([{'trade_price': p} for p in prices], period=20, k=2.0)
+
+        windows = np.lib.stride_tricks.sliding_window_view(prices, 20)
+        middle = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        np.testing.assert_allclose(bands['middle'], middle, rtol=1e-12)
+        np.testing.assert_allclose(bands['upper'], middle + 2 * std, rtol=1e-12)
+        np.testing.assert_allclose(bands['lower'], middle - 2 * std, rtol=1e-12)
+
+    def test_flat_prices_have_zero_width(self):
+        bands = bare_analyzer().calculate_bollinger_bands([{'trade_price': 1000}] * 25, period=20)
+        self.assertEqual(bands['upper'], bands['lower'])
+        self.assertEqual(len(bands['middle']), 6)
+
+    def test_too_few_candles(self):
+        self.assertIsNone(bare_analyzer().calculate_bollinger_bands([{'trade_price': 1}] * 5, period=20))
+
+
+if __name__ == '__main__':
+    unittest.main()
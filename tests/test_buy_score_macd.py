@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from trading.indicators.technical import calculate_score_indicators
+from _helpers import bare_analyzer
+
+MACD_ONLY = {'buy_score': {'macd_weight': 1, 'macd_enabled': True}}
+
+
+class TestBuyScoreStreamingMACD(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.close = np.cumsum(rng.normal(size=90)) + 1000
+        self.timestamps = np.array([f'2024-01-01T{i // 60:02d}:{i % 60:02d}:00' for i in range(90)])
+
+    def _window(self, end, size=30):
+        ma = bare_analyzer()
+        df = ma.prepare_dataframe([
+            {'opening_price': p, 'high_price': p, 'low_price': p, 'trade_price': p, 'candle_acc_trade_volume': 1}
+            for p in self.close[end - size:end]
+        ])
+        return df, self.timestamps[end - size:end]
+
+    def test_state_follows_full_history(self):
+        ma = bare_analyzer(config=MACD_ONLY, _macd_states={})
+        for end in range(30, 91, 5):
+            df, ts = self._window(end)
+            ma.calculate_buy_score('KRW-BTC', df, ts)
+
+        # 30봉씩만 받아도 상태에는 처음부터의 봉이 모두 반영되어 있다
+        streamed = ma._macd_states['KRW-BTC'].update(self.timestamps[60:90], self.close[60:90])
+        full = calculate_score_indicators(self.close, self.close, self.close)
+        self.assertAlmostEqual(streamed['macd'], full['macd'], places=9)
+        self.assertAlmostEqual(streamed['macd_signal'], full['macd_signal'], places=9)
+
+    def test_without_timestamps_uses_window(self):
+        ma = bare_analyzer(config=MACD_ONLY, _macd_states={})
+        df, _ = self._window(90)
+        ma.calculate_buy_score('KRW-BTC', df)
+        self.assertEqual(ma._macd_states, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -122,7 +122,23 @@ class TestConfigSync(unittest.TestCase):
             self.config_manager.default_config,
             "Config와 ConfigManager의 기본 설정값이 다릅니다."
         )
-    
+
+    def test_default_config_not_aliased(self):
+        """
+        기본 설정값 공유 방지 테스트
+
+        로드된 설정의 중첩 값을 수정해도 DEFAULT_SETTINGS 가 바뀌지 않는지 검증합니다.
+        """
+        from config.default_settings import DEFAULT_SETTINGS, get_default_settings
+
+        expected = get_default_settings()
+        self.config_manager.load_config()
+        self.config_manager.config['trading']['coin_selection']['min_price'] = -1
+        defaults = get_default_settings()
+        defaults['trading']['coin_selection']['max_price'] = -1
+
+        self.assertEqual(DEFAULT_SETTINGS, expected)
+
     def test_web_to_backend_sync(self):
         """
         웹 인터페이스에서 백엔드로의 설정 동기화 테스트
@@ -289,6 +305,23 @@ class TestConfigSync(unittest.TestCase):
                 f"설정 파일에서 로드된 '{key}' 값이 저장된 값과 다릅니다."
             )
     
+    def test_atomic_write_keeps_file_on_error(self):
+        """
+        원자적 저장 테스트
+
+        직렬화에 실패해도 기존 설정 파일이 그대로 남고 임시 파일이 정리되는지 검증합니다.
+        """
+        from core import json_utils
+
+        json_utils.write_atomic(self.test_config_file, {'max_coins': 3})
+        with self.assertRaises(TypeError):
+            json_utils.write_atomic(self.test_config_file, {'max_coins': object()})
+
+        with open(self.test_config_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'max_coins': 3})
+        leftovers = list(Path('.').glob(f'{self.test_config_file.name}.*.tmp'))
+        self.assertEqual(leftovers, [])
+
     def test_indicator_dependencies(self):
         """
         지표 의존성 테스트
@@ -1,26 +1,21 @@
 import unittest
 from unittest.mock import MagicMock
 
-from core.market_analyzer import MarketAnalyzer
+from core.market_analyzer import get_holding_status
 from unittest.mock import patch
+from _helpers import bare_analyzer, make_analyzer
 
 class TestHoldingsPreSell(unittest.TestCase):
     def test_missing_pre_sell_is_created(self):
-        ma = MarketAnalyzer.__new__(MarketAnalyzer)
-        ma.order_manager = MagicMock()
-        ma.api = MagicMock()
-        ma._send_request = MagicMock(return_value=[
-            {'currency': 'UNI', 'balance': '1', 'avg_buy_price': '11420.0'},
-            {'currency': 'KRW', 'balance': '0'}
-        ])
-        ma.get_market_info = MagicMock(return_value={'trade_price': 11420.0})
-        ma.get_sell_settings = MagicMock(return_value={'TP_PCT': 0.18, 'MINIMUM_TICKS': 2})
-        ma._get_tick_size = MarketAnalyzer._get_tick_size.__get__(ma)
-        ma.invalid_markets = set()
-        ma.krw_balance = 0
-        ma.auto_bought = set()
-        ma.open_positions = [{'market': 'KRW-UNI', 'entry_price': 11420.0, 'volume': 1.0, 'sell_uuid': 'old'}]
-        ma.api.get_order_info.return_value = {'state': 'cancel'}
+        ma = make_analyzer(
+            [
+                {'currency': 'UNI', 'balance': '1', 'avg_buy_price': '11420.0'},
+                {'currency': 'KRW', 'balance': '0'}
+            ],
+            11420.0,
+            open_positions=[{'market': 'KRW-UNI', 'entry_price': 11420.0, 'volume': 1.0, 'sell_uuid': 'old'}],
+            order_state='cancel',
+        )
         ma.order_manager.place_limit_sell.return_value = (True, {'uuid': 'new'})
 
         with patch('core.monitoring_coin.sync_holdings') as mock_sync:
@@ -29,6 +24,26 @@ class TestHoldingsPreSell(unittest.TestCase):
         ma.order_manager.place_limit_sell.assert_not_called()
         self.assertEqual(ma.open_positions[0]['sell_uuid'], 'old')
         self.assertIn('KRW-UNI', holdings)
+        self.assertEqual(holdings['KRW-UNI']['status'], '소폭 손실')
+
+    def test_accounts_reused_within_ttl(self):
+        accounts = [{'currency': 'KRW', 'balance': '1000'}]
+        ma = bare_analyzer(_send_request=MagicMock(return_value=accounts))
+
+        self.assertEqual(ma._get_accounts(), accounts)
+        self.assertEqual(ma._get_accounts(), accounts)
+        ma._send_request.assert_called_once_with('GET', '/v1/accounts')
+
+        ma._accounts_cache = None
+        ma._get_accounts()
+        self.assertEqual(ma._send_request.call_count, 2)
+
+    def test_holding_status_bounds(self):
+        self.assertEqual(get_holding_status(-5.0), '손실')
+        self.assertEqual(get_holding_status(-2.0), '소폭 손실')
+        self.assertEqual(get_holding_status(1.9), '소폭 손실')
+        self.assertEqual(get_holding_status(2.0), '수익')
+        self.assertEqual(get_holding_status(5.0), '높은 수익')
 
 if __name__ == '__main__':
     unittest.main()
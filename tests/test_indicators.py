@@ -0,0 +1,26 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading.indicators.technical import calculate_rsi
+
+
+class TestCalculateRSI(unittest.TestCase):
+    def test_period_longer_than_series_is_all_nan(self):
+        rsi = calculate_rsi(pd.Series(np.linspace(100, 170, 70)), 100)
+        self.assertEqual(len(rsi), 70)
+        self.assertTrue(rsi.isna().all())
+
+    def test_long_series_matches_rolling_means(self):
+        rng = np.random.default_rng(11)
+        data = pd.Series(np.cumsum(rng.normal(size=120)) + 1000)
+        delta = data.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        expected = 100 - 100 / (1 + gain / loss)
+        np.testing.assert_allclose(calculate_rsi(data, 14)[14:], expected[14:], rtol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
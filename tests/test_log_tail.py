@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from web import app as web_app
+
+
+class TestLogTail(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.log')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write(self, lines, trailing_newline=True):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + ('\n' if trailing_newline else ''))
+
+    def test_returns_last_lines_across_chunks(self):
+        lines = [f'[2024-01-01] INFO - 로그 {i} ' + 'x' * 200 for i in range(500)]
+        self._write(lines)
+        self.assertEqual(web_app.tail_lines(self.path, 100), lines[-100:])
+
+    def test_short_file_without_trailing_newline(self):
+        self._write(['a', 'b', 'c'], trailing_newline=False)
+        self.assertEqual(web_app.tail_lines(self.path, 100), ['a', 'b', 'c'])
+
+    def test_empty_file(self):
+        self.assertEqual(web_app.tail_lines(self.path, 100), [])
+
+    def test_api_logs(self):
+        self._write(['[INFO] 첫 줄', '[ERROR] 마지막 줄'])
+        client = web_app.app.test_client()
+        original = web_app._current_log_file
+        web_app._current_log_file = lambda: self.path
+        try:
+            resp = client.get('/api/logs')
+        finally:
+            web_app._current_log_file = original
+        self.assertEqual(resp.status_code, 200)
+        data = resp.get_json()
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['data']['logs'], ['[INFO] 첫 줄', '[ERROR] 마지막 줄'])
+
+
+if __name__ == '__main__':
+    unittest.main()
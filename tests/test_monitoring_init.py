@@ -1,12 +1,12 @@
 import unittest
 from unittest.mock import patch
 
-from web.app import initialize_monitoring
+from _helpers import WebAppTestCase
 
-class TestMonitoringInit(unittest.TestCase):
+class TestMonitoringInit(WebAppTestCase):
     def test_initialize_calls_get_holdings(self):
-        with patch('web.app.market_analyzer.get_holdings') as mock_get:
-            initialize_monitoring()
+        with patch.object(self.market_analyzer, 'get_holdings') as mock_get:
+            self.web.initialize_monitoring()
             mock_get.assert_called_once()
 
 if __name__ == '__main__':
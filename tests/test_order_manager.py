@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 
-from core.order_manager import OrderManager
+from core.order_manager import OrderManager, get_tick_size, pre_sell_target_price, round_up_to_tick
 from core.upbit_api import UpbitAPI
 
 class TestOrderManagerGiveUp(unittest.TestCase):
@@ -20,3 +20,21 @@ class TestOrderManagerGiveUp(unittest.TestCase):
         success, order = om.buy_with_settings('KRW-BTC', settings)
         self.assertFalse(success)
         api.place_order.assert_not_called()
+
+
+class TestPreSellTargetPrice(unittest.TestCase):
+    def test_rounds_up_to_tick(self):
+        self.assertEqual(round_up_to_tick(11440.6, 10), 11450)
+        self.assertEqual(pre_sell_target_price(11420.0, 10, 0.18, 2), 11450.0)
+
+    def test_minimum_ticks_enforced(self):
+        # 0.18% 는 1호가(5원)에 못 미치므로 매수가 + 2호가로 맞춘다
+        self.assertEqual(pre_sell_target_price(1000.0, 5, 0.18, 2), 1010.0)
+
+    def test_bot_and_analyzer_share_tick_table(self):
+        from core.market_analyzer import MarketAnalyzer
+        from trading.bot.trading_bot import TradingBot
+        for price in (5, 10, 999, 1000, 99999, 100000, 500000, 1999999, 2000000):
+            tick = get_tick_size(price)
+            self.assertEqual(TradingBot._get_tick_size(None, price), tick)
+            self.assertEqual(MarketAnalyzer._get_tick_size(None, price), tick)
@@ -4,9 +4,12 @@
 
 import unittest
 from datetime import datetime
+from core import performance
 from core.performance import PerformanceMetrics
+import numpy as np
 import pandas as pd
 import os
+import tempfile
 
 class TestPerformanceMetrics(unittest.TestCase):
     """성과 측정 기능 테스트 클래스"""
@@ -113,29 +116,94 @@ class TestPerformanceMetrics(unittest.TestCase):
         
     def test_csv_export(self):
         """거래 기록 CSV 저장 테스트"""
-        # 테스트용 로그 디렉토리 생성
-        os.makedirs("tests/test_logs", exist_ok=True)
-        test_file = "tests/test_logs/test_performance.csv"
-        
         # 거래 데이터 추가
         for trade in self.test_trades:
             self.metrics.update(trade)
-            
-        # CSV 파일로 저장
-        self.metrics.save_to_csv(test_file)
-        
-        # 파일 생성 확인
-        self.assertTrue(os.path.exists(test_file))
-        
-        # 저장된 데이터 확인
-        df = pd.read_csv(test_file)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = os.path.join(tmpdir, "test_performance.csv")
+
+            # CSV 파일로 저장
+            self.metrics.save_to_csv(test_file)
+
+            # 파일 생성 확인
+            self.assertTrue(os.path.exists(test_file))
+
+            # 저장된 데이터 확인
+            df = pd.read_csv(test_file)
         self.assertEqual(len(df), len(self.test_trades))
-        
-        # 테스트 파일 정리
-        if os.path.exists(test_file):
+
+    def test_csv_export_appends_new_trades(self):
+        """반복 저장 시 새 거래만 이어서 기록되는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = os.path.join(tmpdir, "test_performance_append.csv")
+
+            self.metrics.update(self.test_trades[0])
+            self.metrics.save_to_csv(test_file)
+
+            for trade in self.test_trades[1:]:
+                self.metrics.update(trade)
+            self.metrics.save_to_csv(test_file)
+            self.metrics.save_to_csv(test_file)
+
+            df = pd.read_csv(test_file)
+        self.assertEqual(len(df), len(self.test_trades))
+        self.assertListEqual(list(df['market']), [t['market'] for t in self.test_trades])
+
+    def test_csv_rewritten_after_file_removed(self):
+        """파일이 삭제된 뒤 저장하면 헤더와 전체 기록을 다시 쓰는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = os.path.join(tmpdir, "test_performance_rotate.csv")
+
+            self.metrics.update(self.test_trades[0])
+            self.metrics.save_to_csv(test_file)
             os.remove(test_file)
-        if os.path.exists("tests/test_logs"):
-            os.rmdir("tests/test_logs")
+
+            self.metrics.update(self.test_trades[1])
+            self.metrics.save_to_csv(test_file)
+
+            df = pd.read_csv(test_file)
+        self.assertListEqual(list(df['market']), [t['market'] for t in self.test_trades[:2]])
+
+    def test_csv_keeps_columns_added_later(self):
+        """나중 거래에 새 항목이 생겨도 열이 빠지지 않는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = os.path.join(tmpdir, "test_performance_columns.csv")
+
+            self.metrics.update(dict(self.test_trades[0]))
+            self.metrics.save_to_csv(test_file)
+            self.metrics.update(dict(self.test_trades[1], note='manual'))
+            self.metrics.save_to_csv(test_file)
+
+            df = pd.read_csv(test_file)
+        self.assertEqual(len(df), 2)
+        self.assertTrue(pd.isna(df['note'].iloc[0]))
+        self.assertEqual(df['note'].iloc[1], 'manual')
+
+    def test_npz_export(self):
+        """거래 기록 NumPy 저장 테스트"""
+        for trade in self.test_trades:
+            self.metrics.update(trade)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = os.path.join(tmpdir, 'performance.npz')
+            self.metrics.save_to_npz(test_file)
+            with np.load(test_file) as data:
+                self.assertListEqual(list(data['market']), [t['market'] for t in self.test_trades])
+                np.testing.assert_allclose(data['profit'], [t['profit'] for t in self.test_trades])
+                self.assertEqual(len(data['timestamp']), len(self.test_trades))
+
+    @unittest.skipIf(performance.pyarrow is None, "pyarrow 미설치")
+    def test_parquet_export(self):
+        """거래 기록 parquet 저장 테스트"""
+        for trade in self.test_trades:
+            self.metrics.update(trade)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = os.path.join(tmpdir, 'performance.parquet')
+            self.metrics.save_to_parquet(test_file)
+            df = pd.read_parquet(test_file)
+        self.assertListEqual(list(df['profit']), [t['profit'] for t in self.test_trades])
             
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
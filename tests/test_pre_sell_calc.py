@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from core.market_analyzer import MarketAnalyzer
 
 class TestPreSellCalc(unittest.TestCase):
@@ -22,5 +24,16 @@ class TestPreSellCalc(unittest.TestCase):
         args = self.ma.order_manager.place_limit_sell.call_args[0]
         self.assertEqual(args, ('KRW-XRP', 1.0, 200.4))
 
+    def test_sell_params_follow_new_settings(self):
+        self.assertEqual(self.ma._get_pre_sell_params(), (0.18, 2))
+        self.ma.get_sell_settings.return_value = {'TP_PCT': 0.5, 'MINIMUM_TICKS': 3}
+        self.assertEqual(self.ma._get_pre_sell_params(), (0.5, 3))
+
+    def test_tick_sizes_match_scalar(self):
+        prices = [5, 10, 999, 1000, 99999, 100000, 500000, 1999999, 2000000]
+        expected = [self.ma._get_tick_size(p) for p in prices]
+        self.assertEqual(expected, [0.01, 0.1, 0.1, 5, 10, 50, 100, 500, 1000])
+        np.testing.assert_array_equal(self.ma._get_tick_sizes(np.array(prices)), expected)
+
 if __name__ == '__main__':
     unittest.main()
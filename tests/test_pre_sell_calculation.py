@@ -1,13 +1,13 @@
 import unittest
 from unittest.mock import MagicMock
-from core.market_analyzer import MarketAnalyzer
+from _helpers import SELL_SETTINGS, bare_analyzer
 
 class TestPreSellCalculation(unittest.TestCase):
     def test_target_price_from_avg_price(self):
-        analyzer = MarketAnalyzer.__new__(MarketAnalyzer)
-        analyzer.order_manager = MagicMock()
-        analyzer.get_sell_settings = MagicMock(return_value={'TP_PCT': 0.18, 'MINIMUM_TICKS': 2})
-        analyzer._get_tick_size = MarketAnalyzer._get_tick_size.__get__(analyzer)
+        analyzer = bare_analyzer(
+            order_manager=MagicMock(),
+            get_sell_settings=MagicMock(return_value=dict(SELL_SETTINGS)),
+        )
 
         buy_order = {
             'price': '11420.0',
@@ -1,9 +1,9 @@
 import unittest
-from core.market_analyzer import MarketAnalyzer
+from _helpers import bare_analyzer
 
 class TestPrepareDataFrame(unittest.TestCase):
     def setUp(self):
-        self.analyzer = MarketAnalyzer.__new__(MarketAnalyzer)
+        self.analyzer = bare_analyzer()
 
     def test_prepare_dataframe(self):
         sample = [
@@ -28,5 +28,13 @@ class TestPrepareDataFrame(unittest.TestCase):
         self.assertEqual(df['close'].iloc[0], 105)
         self.assertEqual(df['volume'].iloc[1], 150)
 
+    def test_missing_values_become_nan(self):
+        sample = [{'opening_price': '100', 'high_price': 110, 'low_price': 90, 'trade_price': None}]
+        df = self.analyzer.prepare_dataframe(sample)
+        self.assertEqual(df['open'].dtype, 'float64')
+        self.assertEqual(df['open'].iloc[0], 100.0)
+        self.assertTrue(df['close'].isna().iloc[0])
+        self.assertTrue(df['volume'].isna().iloc[0])
+
 if __name__ == '__main__':
     unittest.main()
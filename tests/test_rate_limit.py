@@ -0,0 +1,32 @@
+import threading
+import time
+import unittest
+
+from core.market_analyzer import rate_limit
+
+
+class TestRateLimit(unittest.TestCase):
+    def test_calls_spaced_across_threads(self):
+        calls = []
+        lock = threading.Lock()
+
+        @rate_limit(0.02)
+        def request():
+            with lock:
+                calls.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=lambda: [request() for _ in range(3)]) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 24)
+        # 각 호출은 예약된 시각 이전에 실행될 수 없으므로, 스케줄링 지연과 무관하게
+        # 마지막 호출은 시작 시각으로부터 최소 23 * 0.02초 뒤에 일어난다
+        self.assertGreaterEqual(max(calls) - start, 23 * 0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()
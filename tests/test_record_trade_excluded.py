@@ -1,17 +1,53 @@
-import unittest
+import json
 import os
 import tempfile
+import unittest
 from unittest.mock import patch
 
+from core import monitoring_coin
 from core.monitoring_coin import record_trade
+from _helpers import MemoryMonitoringFile
 
 class TestRecordTradeExcluded(unittest.TestCase):
     def test_excluded_market_not_written(self):
+        with MemoryMonitoringFile().installed() as mon_file:
+            record_trade('KRW-ETHW', 1000.0, 1100.0)
+        self.assertIsNone(mon_file.data)
+
+    def test_batch_writes_once_on_exit(self):
+        with MemoryMonitoringFile().installed() as mon_file:
+            with monitoring_coin.batch():
+                record_trade('KRW-UNI', 1000.0, 1100.0)
+                record_trade('KRW-XRP', 500.0, 550.0)
+                monitoring_coin.update_sell_price('KRW-UNI', 1200.0)
+                self.assertEqual(mon_file.writes, 0)
+            data = monitoring_coin.get_monitoring_coins()
+        self.assertEqual(mon_file.writes, 1)
+        self.assertEqual(set(data), {'KRW-UNI', 'KRW-XRP'})
+        self.assertEqual(data['KRW-UNI']['매도주문가격'], 1200.0)
+
+    def test_unchanged_state_not_rewritten(self):
+        with MemoryMonitoringFile().installed() as mon_file:
+            record_trade('KRW-UNI', 1000.0, 1100.0)
+            monitoring_coin.flush()
+            record_trade('KRW-UNI', 1000.0, 1100.0)
+            monitoring_coin.update_sell_price('KRW-UNI', 1100.0)
+            monitoring_coin.flush()
+            self.assertEqual(mon_file.writes, 1)
+            monitoring_coin.update_sell_price('KRW-UNI', 1200.0)
+        self.assertEqual(mon_file.writes, 2)
+        self.assertEqual(mon_file.data['KRW-UNI']['매도주문가격'], 1200.0)
+
+    def test_background_write_visible_before_and_after_flush(self):
         with tempfile.TemporaryDirectory() as tmpdir:
-            path = f"{tmpdir}/mon.json"
+            path = os.path.join(tmpdir, 'mon.json')
             with patch('core.monitoring_coin.FILE_PATH', path):
-                record_trade('KRW-ETHW', 1000.0, 1100.0)
-            self.assertFalse(os.path.exists(path))
+                record_trade('KRW-UNI', 1000.0, 1100.0)
+                # 파일 기록 전이라도 읽기에는 바로 반영된다
+                self.assertIn('KRW-UNI', monitoring_coin.get_monitoring_coins())
+                monitoring_coin.flush()
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.assertIn('KRW-UNI', json.load(f))
 
 if __name__ == '__main__':
     unittest.main()
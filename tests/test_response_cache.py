@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from _helpers import bare_analyzer
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.ma = bare_analyzer(_response_cache={})
+        self.ma._send_request_uncached = MagicMock(return_value=[{'market': 'KRW-BTC'}])
+
+    def test_public_get_reused_within_ttl(self):
+        first = self.ma._send_request('GET', '/v1/market/all', {'isDetails': 'true'})
+        second = self.ma._send_request('GET', '/v1/market/all', {'isDetails': 'true'})
+        self.assertIs(first, second)
+        self.ma._send_request('GET', '/v1/market/all', {'isDetails': 'false'})
+        self.assertEqual(self.ma._send_request_uncached.call_count, 2)
+
+    def test_ticker_expires(self):
+        with patch('core.market_analyzer.time.monotonic', side_effect=[100.0, 100.5, 101.5]):
+            for _ in range(3):
+                self.ma._send_request('GET', '/v1/ticker', {'markets': 'KRW-BTC'})
+        self.assertEqual(self.ma._send_request_uncached.call_count, 2)
+
+    def test_failures_and_other_endpoints_not_cached(self):
+        self.ma._send_request_uncached.return_value = None
+        self.ma._send_request('GET', '/v1/ticker', {'markets': 'KRW-BTC'})
+        self.ma._send_request('GET', '/v1/ticker', {'markets': 'KRW-BTC'})
+        self.ma._send_request('GET', '/v1/candles/minutes/1', {'market': 'KRW-BTC', 'count': 30})
+        self.ma._send_request('GET', '/v1/candles/minutes/1', {'market': 'KRW-BTC', 'count': 30})
+        self.assertEqual(self.ma._send_request_uncached.call_count, 4)
+        self.assertEqual(self.ma._response_cache, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from core.risk_manager import RiskManager
 import json
 import os
+import tempfile
 
 class TestRiskManager(unittest.TestCase):
     """위험 관리 기능 테스트 클래스"""
@@ -34,23 +35,21 @@ class TestRiskManager(unittest.TestCase):
             }
         }
         
-        # 테스트용 설정 파일 생성
-        os.makedirs("tests/test_config", exist_ok=True)
-        with open("tests/test_config/test_config.json", "w") as f:
+        # 테스트용 설정 파일 생성 (임시 폴더는 테스트가 끝나면 통째로 삭제)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.config_path = os.path.join(self._tmp.name, "test_config.json")
+        with open(self.config_path, "w") as f:
             json.dump(self.test_config, f)
             
-        self.risk_manager = RiskManager("tests/test_config/test_config.json")
+        self.risk_manager = RiskManager(self.config_path)
         
-    def tearDown(self):
-        """
-        테스트 환경 정리
-        - 테스트용 설정 파일 삭제
-        """
-        if os.path.exists("tests/test_config/test_config.json"):
-            os.remove("tests/test_config/test_config.json")
-        if os.path.exists("tests/test_config"):
-            os.rmdir("tests/test_config")
-            
+    def test_config_copies_not_shared(self):
+        """같은 설정 파일로 만든 인스턴스끼리 설정 dict 를 공유하지 않는지 테스트"""
+        other = RiskManager(self.config_path)
+        other.risk_config['system']['max_daily_loss'] = 1
+        self.assertEqual(self.risk_manager.risk_config['system']['max_daily_loss'], 100000)
+
     def test_daily_loss_limit(self):
         """일일 손실 한도 테스트"""
         # 초기 상태 확인
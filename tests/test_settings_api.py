@@ -2,34 +2,39 @@ import unittest
 import json
 import os
 from pathlib import Path
-from copy import deepcopy
 
-from web.app import app, config_manager, market_analyzer
 from config.default_settings import DEFAULT_SETTINGS
+from core import json_utils
+from _helpers import WebAppTestCase
 
-class TestSettingsAPI(unittest.TestCase):
+# 기본 설정은 한 번만 직렬화해 두고 테스트마다 파싱해서 새 사본을 만든다 (deepcopy 보다 빠름)
+_DEFAULTS_TEMPLATE = json_utils.dumps(DEFAULT_SETTINGS)
+
+def fresh_defaults():
+    return json_utils.loads(_DEFAULTS_TEMPLATE)
+
+class TestSettingsAPI(WebAppTestCase):
     def setUp(self):
-        self.client = app.test_client()
+        super().setUp()
+        self.client = self.app.test_client()
         # use a temporary config file
         self.test_file = Path('tests/test_api_config.json')
-        config_manager.config_file = self.test_file
-        market_analyzer.config_path = str(self.test_file)
+        self.config_manager.config_file = self.test_file
+        self.market_analyzer.config_path = str(self.test_file)
         # start from default settings
-        self.original = deepcopy(DEFAULT_SETTINGS)
-        config_manager.config = deepcopy(DEFAULT_SETTINGS)
-        market_analyzer.config = deepcopy(DEFAULT_SETTINGS)
+        self.config_manager.config = fresh_defaults()
+        self.market_analyzer.config = fresh_defaults()
 
     def tearDown(self):
         if self.test_file.exists():
             self.test_file.unlink()
+        super().tearDown()
 
     def test_partial_update_with_zero_volume(self):
+        defaults = fresh_defaults()
         partial = {
-            'trading': deepcopy(DEFAULT_SETTINGS['trading']),
-            'notifications': deepcopy(DEFAULT_SETTINGS['notifications']),
-            'buy_score': deepcopy(DEFAULT_SETTINGS['buy_score']),
-            'buy_settings': deepcopy(DEFAULT_SETTINGS['buy_settings']),
-            'sell_settings': deepcopy(DEFAULT_SETTINGS['sell_settings']),
+            section: defaults[section]
+            for section in ('trading', 'notifications', 'buy_score', 'buy_settings', 'sell_settings')
         }
         # set 1h volume to zero
         partial['trading']['coin_selection']['min_volume_1h'] = 0
@@ -37,11 +42,50 @@ class TestSettingsAPI(unittest.TestCase):
         self.assertEqual(resp.status_code, 200, resp.data)
         data = resp.get_json()
         self.assertTrue(data['success'])
-        saved = config_manager.get_config()
+        saved = self.config_manager.get_config()
         self.assertEqual(saved['trading']['coin_selection']['min_volume_1h'], 0)
         # ensure other sections remain
         self.assertIn('market_analysis', saved)
         self.assertEqual(saved['version'], DEFAULT_SETTINGS['version'])
 
+    def test_default_settings_endpoint(self):
+        resp = self.client.get('/api/default_settings')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        data = resp.get_json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['data'], DEFAULT_SETTINGS)
+
+    def test_export_settings(self):
+        compact = self.client.get('/api/settings/export')
+        pretty = self.client.get('/api/settings/export?pretty=1')
+        self.assertEqual(compact.status_code, 200)
+        self.assertNotIn(b'\n', compact.data)
+        self.assertIn(b'\n', pretty.data)
+        self.assertEqual(json.loads(compact.data), json.loads(pretty.data))
+
+    def test_reset_settings(self):
+        changed = fresh_defaults()
+        changed['trading']['investment_amount'] = 12345
+        self.config_manager.update_config(changed)
+        resp = self.client.post('/api/settings/reset')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        self.assertTrue(resp.get_json()['success'])
+        saved = self.config_manager.get_config()
+        self.assertEqual(
+            saved['trading']['investment_amount'],
+            DEFAULT_SETTINGS['trading']['investment_amount'],
+        )
+
+    def test_settings_diff_only_changed(self):
+        new = fresh_defaults()
+        new['trading']['coin_selection']['min_price'] = 1
+        new['extra'] = True
+        self.assertEqual(self.web.settings_diff(DEFAULT_SETTINGS, DEFAULT_SETTINGS), {})
+        self.assertEqual(
+            self.web.settings_diff(DEFAULT_SETTINGS, new),
+            {'trading': {'coin_selection': {'min_price': 1}}, 'extra': True},
+        )
+        self.assertEqual(self.web.settings_diff(new, DEFAULT_SETTINGS)['extra'], None)
+
 if __name__ == '__main__':
     unittest.main()
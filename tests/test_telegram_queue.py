@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+from core.telegram_notifier import TelegramNotifier
+
+
+class TestTelegramSendQueue(unittest.TestCase):
+    def test_sync_send_reaches_worker_on_other_loop(self):
+        with patch.dict('os.environ', {'TELEGRAM_BOT_TOKEN': 'token', 'TELEGRAM_CHAT_ID': '1'}):
+            notifier = TelegramNotifier()
+        delivered = []
+        done = threading.Event()
+
+        async def fake_deliver(message):
+            delivered.append((message, threading.current_thread().name))
+            done.set()
+
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        async def start_worker():
+            # start_monitoring 중 대기열과 워커를 만드는 부분만 실행
+            notifier._send_queue = asyncio.Queue(maxsize=10)
+            notifier._sender_loop = asyncio.get_running_loop()
+            notifier._sender_task = asyncio.create_task(notifier._sender_worker())
+            ready.set()
+
+        thread = threading.Thread(target=loop.run_forever, name='worker-loop', daemon=True)
+        thread.start()
+        try:
+            with patch.object(notifier, '_deliver', side_effect=fake_deliver):
+                asyncio.run_coroutine_threadsafe(start_worker(), loop)
+                self.assertTrue(ready.wait(5))
+                # 동기 코드 경로: 공용 백그라운드 루프에서 send_message 가 실행된다
+                notifier.send_message_nowait('hello').result(5)
+                self.assertTrue(done.wait(5))
+        finally:
+            if notifier._sender_task is not None:
+                asyncio.run_coroutine_threadsafe(notifier._stop_sender(timeout=1), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+
+        self.assertEqual(delivered, [('hello', 'worker-loop')])
+
+
+if __name__ == '__main__':
+    unittest.main()
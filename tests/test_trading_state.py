@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from core.trading_state import TradingState, Position
 import json
 import os
+import tempfile
 
 class TestTradingState(unittest.TestCase):
     """거래 상태 관리 기능 테스트 클래스"""
@@ -26,23 +27,15 @@ class TestTradingState(unittest.TestCase):
             }
         }
         
-        # 테스트용 설정 파일 생성
-        os.makedirs("tests/test_config", exist_ok=True)
-        with open("tests/test_config/test_config.json", "w") as f:
+        # 테스트용 설정 파일 생성 (임시 폴더는 테스트가 끝나면 통째로 삭제)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.config_path = os.path.join(self._tmp.name, "test_config.json")
+        with open(self.config_path, "w") as f:
             json.dump(self.test_config, f)
             
-        self.trading_state = TradingState("tests/test_config/test_config.json")
+        self.trading_state = TradingState(self.config_path)
         
-    def tearDown(self):
-        """
-        테스트 환경 정리
-        - 테스트용 설정 파일 삭제
-        """
-        if os.path.exists("tests/test_config/test_config.json"):
-            os.remove("tests/test_config/test_config.json")
-        if os.path.exists("tests/test_config"):
-            os.rmdir("tests/test_config")
-            
     def test_position_management(self):
         """포지션 관리 기능 테스트"""
         # 포지션 추가
@@ -85,6 +78,41 @@ class TestTradingState(unittest.TestCase):
         self.assertFalse(can_open)
         self.assertEqual(reason, "이미 보유 중인 포지션 존재")
         
+    def test_update_all_positions(self):
+        """전체 포지션 일괄 손익 계산 테스트"""
+        self.trading_state.add_position("KRW-BTC", 50000000, 0.001, fee=50)
+        self.trading_state.add_position("KRW-ETH", 3000000, 0.1)
+        self.trading_state.add_position("KRW-XRP", 500, 100)
+
+        # 중간 포지션 제거 후에도 마켓 순서와 값이 일치해야 한다
+        self.trading_state.remove_position("KRW-BTC")
+        markets = self.trading_state.position_markets
+        self.assertEqual(sorted(markets), ["KRW-ETH", "KRW-XRP"])
+
+        prices = {"KRW-ETH": 3300000, "KRW-XRP": 450}
+        result = self.trading_state.update_all([prices[m] for m in markets])
+        self.assertAlmostEqual(result["KRW-ETH"]['unrealized_profit'], 30000)
+        self.assertAlmostEqual(result["KRW-ETH"]['profit_percent'], 10.0)
+        self.assertAlmostEqual(result["KRW-XRP"]['unrealized_profit'], -5000)
+        self.assertAlmostEqual(result["KRW-XRP"]['volume'], 100)
+
+    def test_adjust_position_keeps_arrays_in_sync(self):
+        """포지션 변경이 개별/일괄 손익 계산에 똑같이 반영되는지 테스트"""
+        position = self.trading_state.add_position("KRW-ETH", 3000000, 0.1, fee=100)
+        with self.assertRaises(AttributeError):
+            position.volume = 0.2
+
+        self.trading_state.adjust_position("KRW-ETH", price=2900000, volume=0.2, fee=50)
+        adjusted = self.trading_state.active_positions["KRW-ETH"]
+        self.assertEqual(adjusted.total_fee, 150)
+
+        single = self.trading_state.update_position("KRW-ETH", 3000000)
+        batch = self.trading_state.update_all([3000000])["KRW-ETH"]
+        self.assertAlmostEqual(single['unrealized_profit'], 20000 - 150)
+        self.assertAlmostEqual(batch['unrealized_profit'], single['unrealized_profit'])
+        self.assertAlmostEqual(batch['profit_percent'], single['profit_percent'])
+        self.assertAlmostEqual(batch['volume'], 0.2)
+
     def test_market_cooldown(self):
         """마켓 거래 제한 기능 테스트"""
         # 거래 제한 설정
@@ -1,6 +1,67 @@
+import asyncio
+import base64
+import hashlib
+import json
+import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
+
+import requests
+
 from core.upbit_api import UpbitAPI
+from core.upbit_async import fetch_many
+
+class TestUpbitQueryHash(unittest.TestCase):
+    def test_list_params_hash_matches_sent_query_string(self):
+        api = UpbitAPI(access_key='x', secret_key='y')
+        query = {'market': 'KRW-BTC', 'states[]': ['wait', 'watch']}
+        headers = api._get_token(query)
+        self.assertIsNotNone(headers)
+
+        payload = headers['Authorization'].split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        # requests 가 실제로 보내는 쿼리 문자열과 같은 값을 해시해야 한다
+        sent = urlsplit(requests.Request('GET', 'https://api.upbit.com/v1/orders', params=query).prepare().url).query
+        self.assertEqual(claims['query_hash'], hashlib.sha512(sent.encode()).hexdigest())
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, url):
+        self.url = url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return [{'market': self.url}]
+
+
+class _FakeSession:
+    def __init__(self):
+        self.started = []
+
+    def get(self, url):
+        self.started.append(asyncio.get_running_loop().time())
+        return _FakeResponse(url)
+
+
+class TestFetchManyPacing(unittest.TestCase):
+    def test_request_starts_are_spaced_by_rate(self):
+        session = _FakeSession()
+        urls = [f'KRW-{i}' for i in range(6)]
+        results = asyncio.run(fetch_many(session, urls, limit=6, rate=50))
+        self.assertEqual([r[0]['market'] for r in results], urls)
+        # 동시 요청 수 제한과 관계없이 요청 시작이 1/rate 초 간격으로 나뉜다
+        # (이벤트 루프는 시계 해상도만큼 일찍 깨울 수 있어 약간의 여유를 둔다)
+        self.assertGreaterEqual(session.started[-1] - session.started[0], 5 * 0.02 - 0.005)
+        self.assertEqual(session.started, sorted(session.started))
+
 
 class TestUpbitOrderbookRetries(unittest.TestCase):
     @patch('time.sleep', return_value=None)
@@ -12,3 +73,101 @@ class TestUpbitOrderbookRetries(unittest.TestCase):
         self.assertEqual(mock_get_orderbook.call_count, 3)
         # sleep should be called retries-1 times
         self.assertEqual(mock_sleep.call_count, 2)
+
+
+class TestUpbitQuoteCache(unittest.TestCase):
+    @patch('core.upbit_api.pyupbit')
+    def test_orderbook_cached_until_cleared(self, mock_pyupbit):
+        mock_pyupbit.get_orderbook.return_value = [{'market': 'KRW-BTC'}]
+        api = UpbitAPI(access_key='x', secret_key='y')
+        first = api.get_orderbook('KRW-BTC')
+        second = api.get_orderbook('KRW-BTC')
+        self.assertEqual(first, {'market': 'KRW-BTC'})
+        self.assertIs(first, second)
+        self.assertEqual(mock_pyupbit.get_orderbook.call_count, 1)
+
+        api.clear_caches()
+        api.get_orderbook('KRW-BTC')
+        self.assertEqual(mock_pyupbit.get_orderbook.call_count, 2)
+
+    @patch('core.upbit_api.pyupbit')
+    def test_failed_lookup_not_cached(self, mock_pyupbit):
+        mock_pyupbit.get_current_price.side_effect = [None, 100.0]
+        api = UpbitAPI(access_key='x', secret_key='y')
+        self.assertIsNone(api.get_current_price('KRW-BTC'))
+        self.assertEqual(api.get_current_price('KRW-BTC'), 100.0)
+        self.assertEqual(api.get_current_price('KRW-BTC'), 100.0)
+        self.assertEqual(mock_pyupbit.get_current_price.call_count, 2)
+
+    @patch('core.upbit_api.pyupbit')
+    def test_invalidate_market_keeps_other_markets(self, mock_pyupbit):
+        mock_pyupbit.get_orderbook.side_effect = lambda ticker: {'market': ticker}
+        api = UpbitAPI(access_key='x', secret_key='y')
+        api.get_orderbook('KRW-BTC')
+        api.get_orderbook(market='KRW-ETH')
+
+        api.invalidate_market('KRW-ETH')
+        api.get_orderbook('KRW-BTC')
+        api.get_orderbook(market='KRW-ETH')
+        self.assertEqual(mock_pyupbit.get_orderbook.call_count, 3)
+
+    def test_bulk_ticker_fills_single_market_cache(self):
+        api = UpbitAPI(access_key='x', secret_key='y')
+        tickers = [{'market': 'KRW-BTC', 'trade_price': 1.0}, {'market': 'KRW-ETH', 'trade_price': 2.0}]
+        with patch.object(api.session, 'get') as mock_get:
+            mock_get.return_value.ok = True
+            mock_get.return_value.content = json.dumps(tickers).encode()
+            mock_get.return_value.json.return_value = tickers
+            infos = api.get_market_infos(['KRW-BTC', 'KRW-ETH'])
+            self.assertEqual(api.get_market_info('KRW-ETH'), infos['KRW-ETH'])
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_bulk_ticker_falls_back_only_on_unknown_market(self):
+        api = UpbitAPI(access_key='x', secret_key='y')
+        with patch.object(api.session, 'get') as mock_get, \
+                patch.object(api, '_get_market_infos_each', return_value={}) as mock_each:
+            mock_get.return_value.ok = False
+            mock_get.return_value.status_code = 429
+            mock_get.return_value.text = '{"error":{"name":"too_many_requests"}}'
+            self.assertEqual(api.get_market_infos(['KRW-BTC', 'KRW-ETH']), {})
+            mock_each.assert_not_called()
+
+            mock_get.return_value.status_code = 404
+            mock_get.return_value.text = '{"error":{"name":404,"message":"Code not found"}}'
+            api.get_market_infos(['KRW-BTC', 'KRW-XXX'])
+            mock_each.assert_called_once_with(['KRW-BTC', 'KRW-XXX'])
+
+    def test_invalidate_while_caching_from_other_threads(self):
+        api = UpbitAPI(access_key='x', secret_key='y')
+        errors = []
+        stop = threading.Event()
+
+        def fill():
+            i = 0
+            while not stop.is_set():
+                api._cache_put(('get_orderbook', (f'KRW-{i % 500}',), ()), {'i': i}, 10)
+                i += 1
+
+        threads = [threading.Thread(target=fill) for _ in range(4)]
+        for t in threads:
+            t.start()
+        try:
+            for _ in range(2000):
+                try:
+                    api.invalidate_market('KRW-1')
+                    api.clear_caches()
+                except RuntimeError as e:
+                    errors.append(e)
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+        self.assertEqual(errors, [])
+
+    def test_filled_order_not_reported_as_failure_when_invalidate_fails(self):
+        api = UpbitAPI(access_key='x', secret_key='y')
+        api.upbit = MagicMock()
+        api.upbit.buy_market_order.return_value = {'uuid': 'u1'}
+        with patch('core.upbit_api._key_mentions', side_effect=RuntimeError('boom')):
+            api._cache_put(('get_orderbook', ('KRW-BTC',), ()), {'x': 1}, 10)
+            self.assertEqual(api.buy_market_order('KRW-BTC', 5000), {'uuid': 'u1'})
@@ -1,8 +1,7 @@
 import time
-import math
 from typing import Dict, List, Optional
 from core.upbit_api import UpbitAPI
-from core.order_manager import OrderManager
+from core.order_manager import OrderManager, get_tick_size, pre_sell_target_price
 from ..data.market_data import MarketData
 from ..strategies.one_min_strategy import OneMinStrategy
 from core.logger import TradingLogger
@@ -44,23 +43,7 @@ class TradingBot:
         self.is_running = False
 
     def _get_tick_size(self, price: float) -> float:
-        if price < 10:
-            return 0.01
-        if price < 100:
-            return 0.1
-        if price < 1000:
-            return 0.1
-        if price < 10000:
-            return 5
-        if price < 100000:
-            return 10
-        if price < 500000:
-            return 50
-        if price < 1000000:
-            return 100
-        if price < 2000000:
-            return 500
-        return 1000
+        return get_tick_size(price)
         
     def start(self) -> None:
         """트레이딩 봇 시작"""
@@ -157,11 +140,7 @@ class TradingBot:
                             tick = self._get_tick_size(avg_price)
                             tp_pct = float(self.sell_settings.get('TP_PCT', 0))
                             min_ticks = int(self.sell_settings.get('MINIMUM_TICKS', 2))
-                            target_price = avg_price * (1 + tp_pct / 100)
-                            target_price = math.ceil(target_price / tick) * tick
-                            if target_price - avg_price < tick * min_ticks:
-                                target_price = avg_price + tick * min_ticks
-                                target_price = math.ceil(target_price / tick) * tick
+                            target_price = pre_sell_target_price(avg_price, tick, tp_pct, min_ticks)
 
                             sell_success, sell_order = self.order_manager.place_limit_sell(symbol, executed_volume, target_price)
                             sell_uuid = sell_order['uuid'] if sell_success and sell_order else None
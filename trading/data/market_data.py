@@ -1,9 +1,15 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from core.upbit_api import UpbitAPI
 from core.logger import TradingLogger
 
+# 심볼별 캔들 동시 조회 수 (업비트 공개 API 요청 제한 고려)
+MARKET_DATA_FETCH_WORKERS = 4
+# 심볼마다 조회하는 캔들 간격 (캐시 키, pyupbit interval)
+_INTERVALS = (("1m", "minute1"), ("5m", "minute5"), ("15m", "minute15"))
+
 class MarketData:
     def __init__(self, exchange: UpbitAPI, settings: Dict):
         """
@@ -23,8 +29,13 @@ class MarketData:
         Args:
             symbols: 심볼 목록
         """
-        for symbol in symbols:
-            self._update_symbol_data(symbol)
+        # 심볼마다 캔들 조회(네트워크 대기)가 대부분이므로 여러 심볼을 동시에 조회한다
+        if len(symbols) <= 1:
+            for symbol in symbols:
+                self._update_symbol_data(symbol)
+            return
+        with ThreadPoolExecutor(max_workers=MARKET_DATA_FETCH_WORKERS) as executor:
+            list(executor.map(self._update_symbol_data, symbols))
             
     def _update_symbol_data(self, symbol: str) -> None:
         """
@@ -33,24 +44,14 @@ class MarketData:
             symbol: 심볼
         """
         try:
-            # 1분봉 데이터 업데이트
-            df_1m = self.exchange.get_ohlcv(symbol, "minute1", 100)
-            if df_1m is not None:
-                if symbol not in self.data_cache:
-                    self.data_cache[symbol] = {}
-                self.data_cache[symbol]["1m"] = df_1m
-
-            # 5분봉 데이터 업데이트
-            df_5m = self.exchange.get_ohlcv(symbol, "minute5", 100)
-            if df_5m is not None:
-                if symbol not in self.data_cache:
-                    self.data_cache[symbol] = {}
-                self.data_cache[symbol]["5m"] = df_5m
-            
-            # 15분봉 데이터 업데이트
-            df_15m = self.exchange.get_ohlcv(symbol, "minute15", 100)
-            if df_15m is not None:
-                self.data_cache[symbol]["15m"] = df_15m
+            # 여러 스레드에서 호출되므로 심볼의 캐시 dict 를 새로 만들어 한 번에 교체한다
+            data = dict(self.data_cache.get(symbol, {}))
+            for key, interval in _INTERVALS:
+                df = self.exchange.get_ohlcv(symbol, interval, 100)
+                if df is not None:
+                    data[key] = df
+            if data:
+                self.data_cache[symbol] = data
                 
         except Exception as e:
             self.logger.error(f"{symbol} 데이터 업데이트 실패: {str(e)}")
@@ -77,9 +78,11 @@ class MarketData:
             investable = [ticker for ticker in investable if ticker not in excluded]
 
             # 24시간 거래대금 및 1시간 평균 거래대금 필터링
+            # 현재가 정보는 티커마다 요청하지 않고 한 번의 요청으로 모두 받아온다
+            infos = self.exchange.get_market_infos(investable)
             tradable = []
             for ticker in investable:
-                info = self.exchange.get_market_info(ticker)
+                info = infos.get(ticker)
                 if not info:
                     continue
                 if info.get('acc_trade_price_24h', 0) < min_volume_24h:
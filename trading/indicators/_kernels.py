@@ -0,0 +1,94 @@
+"""보조지표 계산용 수치 커널
+
+numba 가 설치되어 있으면 JIT 컴파일해서 사용하고, 없으면 순수 파이썬 함수로 남는다.
+순수 파이썬 루프는 pandas 보다 느리므로 호출 측에서 NUMBA_AVAILABLE 을 확인해
+numba 가 없을 때는 기존 pandas/NumPy 경로를 사용한다.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 커널은 순수 파이썬 함수로 동작
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _jit(func):
+    # nan/inf 처리 결과를 pandas 와 맞추기 위해 fastmath 는 사용하지 않는다
+    return njit(cache=True, nogil=True)(func) if njit is not None else func
+
+
+@_jit
+def ema(data, period):
+    """pandas ewm(span=period, adjust=False).mean() 과 같은 EMA"""
+    n = data.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 2.0 / (period + 1)
+    out[0] = data[0]
+    for i in range(1, n):
+        out[i] = out[i - 1] + alpha * (data[i] - out[i - 1])
+    return out
+
+
+@_jit
+def rsi_sma(data, period):
+    """상승/하락폭의 단순이동평균으로 계산하는 RSI (calculate_rsi 와 같은 정의)
+
+    첫 봉의 변화량은 0 으로 보고, period 개 봉이 채워지기 전 값은 nan 이다.
+    """
+    n = data.shape[0]
+    out = np.full(n, np.nan)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        d = data[i] - data[i - 1]
+        if d > 0:
+            gains[i] = d
+        elif d < 0:
+            losses[i] = -d
+
+    # 누적합 차감 방식의 오차로 손실 합이 0 이 아닌 값이 되지 않도록 구간마다 다시 합산
+    for i in range(period - 1, n):
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for j in range(i - period + 1, i + 1):
+            gain_sum += gains[j]
+            loss_sum += losses[j]
+        if loss_sum > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+        elif gain_sum > 0:
+            out[i] = 100.0
+    return out
+
+
+@_jit
+def bbands(data, period, std_dev):
+    """pandas rolling(period).mean() / .std() 로 계산하는 볼린저 밴드 (상단, 중간, 하단)
+
+    표준편차는 pandas 와 같은 표본표준편차(ddof=1)이고, period 개 봉이 채워지기 전 값은 nan 이다.
+    """
+    n = data.shape[0]
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    if period < 2:
+        return upper, middle, lower
+    for i in range(period - 1, n):
+        # 구간마다 평균을 먼저 구한 뒤 편차 제곱합을 더해 누적 오차를 피한다
+        total = 0.0
+        for j in range(i - period + 1, i + 1):
+            total += data[j]
+        mean = total / period
+        sq = 0.0
+        for j in range(i - period + 1, i + 1):
+            d = data[j] - mean
+            sq += d * d
+        width = np.sqrt(sq / (period - 1)) * std_dev
+        middle[i] = mean
+        upper[i] = mean + width
+        lower[i] = mean - width
+    return upper, middle, lower
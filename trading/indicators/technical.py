@@ -1,9 +1,15 @@
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from scipy.signal import lfilter
+from typing import Dict, List, Tuple
+
+from . import _kernels
 
 def calculate_ema(data: pd.Series, period: int) -> pd.Series:
     """지수이동평균(EMA) 계산"""
+    if _kernels.NUMBA_AVAILABLE:
+        values = data.to_numpy(dtype=np.float64)
+        return pd.Series(_kernels.ema(values, period), index=data.index)
     return data.ewm(span=period, adjust=False).mean()
 
 def calculate_sma(data: pd.Series, period: int) -> pd.Series:
@@ -12,6 +18,10 @@ def calculate_sma(data: pd.Series, period: int) -> pd.Series:
 
 def calculate_bollinger_bands(data: pd.Series, period: int, std_dev: float) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """볼린저 밴드 계산"""
+    if _kernels.NUMBA_AVAILABLE and period >= 2:
+        upper, middle, lower = _kernels.bbands(data.to_numpy(dtype=np.float64), period, float(std_dev))
+        index = data.index
+        return pd.Series(upper, index=index), pd.Series(middle, index=index), pd.Series(lower, index=index)
     middle_band = calculate_sma(data, period)
     std = data.rolling(window=period).std()
     upper_band = middle_band + (std * std_dev)
@@ -20,12 +30,43 @@ def calculate_bollinger_bands(data: pd.Series, period: int, std_dev: float) -> T
 
 def calculate_rsi(data: pd.Series, period: int) -> pd.Series:
     """RSI 계산"""
+    if _kernels.NUMBA_AVAILABLE:
+        values = data.to_numpy(dtype=np.float64)
+        return pd.Series(_kernels.rsi_sma(values, period), index=data.index)
+    if len(data) >= max(64, period):
+        # 긴 구간은 NumPy 로 한 번에 계산 (짧은 구간은 pandas 쪽이 오버헤드가 적다)
+        # period 보다 짧으면 구간을 만들 수 없으므로 모두 nan 인 pandas 경로를 사용한다
+        values = data.to_numpy(dtype=np.float64)
+        delta = np.diff(values, prepend=values[:1])
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = np.where(delta < 0, -delta, 0.0)
+        gain_sum = np.lib.stride_tricks.sliding_window_view(gains, period).sum(axis=1)
+        loss_sum = np.lib.stride_tricks.sliding_window_view(losses, period).sum(axis=1)
+        rsi = np.full(len(values), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi[period - 1:] = 100 - 100 / (1 + gain_sum / loss_sum)
+        return pd.Series(rsi, index=data.index)
     delta = data.diff()
     gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
     loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
     rs = gain / loss
     return 100 - (100 / (1 + rs))
 
+def calculate_trade_strength(trades: List[Dict]) -> float:
+    """최근 체결 목록으로 체결강도(매수 체결량 / 매도 체결량 * 100) 계산
+
+    체결 목록을 한 번만 순회하며, 매도 체결이 없으면 0 을 반환한다.
+    """
+    buy_vol = 0.0
+    sell_vol = 0.0
+    for t in trades:
+        side = t['ask_bid']
+        if side == 'BID':
+            buy_vol += t['trade_volume']
+        elif side == 'ASK':
+            sell_vol += t['trade_volume']
+    return (buy_vol / sell_vol * 100) if sell_vol else 0
+
 def calculate_slope(data: pd.Series) -> float:
     """기울기 계산 ((현재값 - 이전값) / 이전값)"""
     if len(data) < 2:
@@ -47,4 +88,117 @@ def calculate_volume_conditions(volume: pd.Series) -> Tuple[bool, bool]:
     prev_condition = current_volume >= prev_volume * 2
     ma_condition = current_volume >= volume_ma5 * 1.5
     
-    return prev_condition, ma_condition 
\ No newline at end of file
+    return prev_condition, ma_condition 
+
+def _ema_adjusted(values: np.ndarray, span: int) -> np.ndarray:
+    """pandas ewm(span=span).mean() (adjust=True) 과 같은 EMA를 선형 필터 한 번으로 계산"""
+    beta = 1 - 2 / (span + 1)
+    numerator = lfilter([1.0], [1.0, -beta], values)
+    denominator = (1 - beta ** np.arange(1, len(values) + 1)) / (1 - beta)
+    return numerator / denominator
+
+def calculate_score_indicators(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                               period: int = 14, smooth: int = 3, macd: bool = True) -> Dict[str, float]:
+    """매수 점수용 보조지표(Williams %R, 스토캐스틱, MACD)를 한 번에 계산
+
+    점수 계산은 마지막 한두 봉의 값만 사용하므로 롤링 구간은 필요한 만큼만 계산한다.
+    계산할 수 없는 값(데이터 부족, 고가 == 저가)은 nan 으로 반환한다.
+    MACD 를 StreamingMACD 로 따로 계산하는 경우 macd=False 로 생략할 수 있다.
+
+    Returns:
+        Dict[str, float]: williams_r, stoch_k, stoch_d, macd, macd_signal,
+            macd_prev, macd_signal_prev
+    """
+    nan = float('nan')
+    result = dict.fromkeys(
+        ('williams_r', 'stoch_k', 'stoch_d', 'macd', 'macd_signal', 'macd_prev', 'macd_signal_prev'), nan
+    )
+    n = len(close)
+
+    if n >= period:
+        # 마지막 smooth 개 봉의 period 구간 최고/최저 (부족한 구간은 nan)
+        m = min(smooth, n - period + 1)
+        highs = np.lib.stride_tricks.sliding_window_view(high[-(period + m - 1):], period).max(axis=1)
+        lows = np.lib.stride_tricks.sliding_window_view(low[-(period + m - 1):], period).min(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = (close[-m:] - lows) / (highs - lows) * 100
+        result['stoch_k'] = float(k[-1])
+        if m == smooth:
+            result['stoch_d'] = float(k.mean())
+        if highs[-1] != lows[-1]:
+            result['williams_r'] = float((highs[-1] - close[-1]) / (highs[-1] - lows[-1]) * -100)
+
+    if macd and n >= 2:
+        line = _ema_adjusted(close, 12) - _ema_adjusted(close, 26)
+        signal = _ema_adjusted(line, 9)
+        result['macd'], result['macd_prev'] = float(line[-1]), float(line[-2])
+        result['macd_signal'], result['macd_signal_prev'] = float(signal[-1]), float(signal[-2])
+
+    return result
+
+
+class StreamingMACD:
+    """확정된 봉까지의 EMA 상태를 보관하고 새로 확정된 봉만 반영하는 MACD(12, 26, 9) 계산기
+
+    마지막 봉은 진행 중인 봉으로 보고 상태에 반영하지 않는다. 매 틱마다 전체 구간을
+    다시 계산하지 않고 새 봉 수만큼만 계산하며, 보관한 시점이 조회 구간 밖으로
+    밀려나면 현재 구간으로 처음부터 다시 계산한다.
+    """
+
+    __slots__ = ('_ts', '_state')
+
+    _B12 = 1 - 2 / 13
+    _B26 = 1 - 2 / 27
+    _B9 = 1 - 2 / 10
+
+    def __init__(self):
+        self._ts = None
+        self._state = None
+
+    @classmethod
+    def _fold(cls, state: Tuple[float, ...], price: float) -> Tuple[float, ...]:
+        """adjust=True EMA 의 분자/분모 점화식에 한 봉을 반영"""
+        n12, d12, n26, d26, ns, ds = state
+        n12 = price + cls._B12 * n12
+        d12 = 1 + cls._B12 * d12
+        n26 = price + cls._B26 * n26
+        d26 = 1 + cls._B26 * d26
+        ns = (n12 / d12 - n26 / d26) + cls._B9 * ns
+        ds = 1 + cls._B9 * ds
+        return n12, d12, n26, d26, ns, ds
+
+    @staticmethod
+    def _values(state: Tuple[float, ...]) -> Tuple[float, float]:
+        n12, d12, n26, d26, ns, ds = state
+        return n12 / d12 - n26 / d26, ns / ds
+
+    def update(self, timestamps: np.ndarray, close: np.ndarray) -> Dict[str, float]:
+        """
+        Args:
+            timestamps: 오름차순 봉 시각 배열
+            close: 종가 배열
+        Returns:
+            Dict[str, float]: macd, macd_signal, macd_prev, macd_signal_prev
+        """
+        nan = float('nan')
+        n = len(close)
+        if n < 2:
+            return {'macd': nan, 'macd_signal': nan, 'macd_prev': nan, 'macd_signal_prev': nan}
+
+        start = 0
+        if self._ts is not None:
+            pos = int(np.searchsorted(timestamps, self._ts))
+            if pos < n and timestamps[pos] == self._ts:
+                start = pos + 1
+        if start == 0:
+            self._state = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+        state = self._state
+        for price in close[start:n - 1].tolist():
+            state = self._fold(state, price)
+        self._state = state
+        self._ts = timestamps[n - 2]
+
+        macd_prev, signal_prev = self._values(state)
+        macd, signal = self._values(self._fold(state, float(close[-1])))
+        return {'macd': macd, 'macd_signal': signal, 'macd_prev': macd_prev, 'macd_signal_prev': signal_prev}
@@ -3,38 +3,78 @@ import numpy as np
 from typing import Dict, Optional, Tuple
 from ..indicators.technical import (
     calculate_ema, calculate_sma, calculate_bollinger_bands,
-    calculate_rsi, calculate_slope, calculate_volume_conditions
+    calculate_rsi, calculate_slope, calculate_volume_conditions,
+    calculate_score_indicators, calculate_trade_strength, StreamingMACD
 )
 from core.upbit_api import UpbitAPI
 from core.logger import TradingLogger
 
 class OneMinStrategy:
+    # 매 틱 설정 딕셔너리를 조회하지 않도록 점수 파라미터를 속성으로 펼쳐 둔다
+    __slots__ = (
+        'settings', 'exchange', 'logger', 'positions', '_macd_states', '_indicator_cache',
+        '_score_threshold', '_score_thresholds',
+        '_strength_w', '_strength_thr', '_strength_thr_low',
+        '_volume_w', '_volume_ratio', '_volume_ratio_low',
+        '_orderbook_w', '_orderbook_thr',
+        '_momentum_w', '_momentum_thr',
+        '_near_high_w', '_near_high_ratio',
+        '_trend_w', '_williams_w', '_stochastic_w', '_macd_w',
+    )
+
     def __init__(self, settings: Dict, exchange: UpbitAPI):
         """
         1분봉 매매 전략 클래스
         Args:
             settings: 설정값 딕셔너리
         """
-        self.settings = settings
         self.exchange = exchange
         self.logger = TradingLogger("OneMinStrategy")
         self.positions: Dict[str, Dict] = {}  # 보유 포지션 정보
+        self._macd_states: Dict[str, StreamingMACD] = {}  # 심볼별 MACD 누적 상태
+        # 심볼별 (마지막 봉 시각/시고저종, 보조지표) - 봉이 그대로면 재계산 생략
+        self._indicator_cache: Dict[str, Tuple[tuple, Dict[str, float]]] = {}
+        self.update_settings(settings)
+
+    def update_settings(self, settings: Dict) -> None:
+        """설정 변경 시 호출하여 매수 점수 파라미터를 다시 계산"""
+        self.settings = settings
+        conf = settings.get('buy_score', {})
+        self._score_threshold = conf.get('score_threshold', 0)
+        self._score_thresholds = conf.get('score_thresholds', {})
+        self._strength_w = conf.get('strength_weight', 0)
+        self._strength_thr = conf.get('strength_threshold', 130)
+        self._strength_thr_low = conf.get('strength_threshold_low', 110)
+        self._volume_w = conf.get('volume_spike_weight', 0)
+        self._volume_ratio = conf.get('volume_spike_threshold', 200) / 100
+        self._volume_ratio_low = conf.get('volume_spike_threshold_low', 150) / 100
+        self._orderbook_w = conf.get('orderbook_weight', 0)
+        self._orderbook_thr = conf.get('orderbook_threshold', 130)
+        self._momentum_w = conf.get('momentum_weight', 0)
+        self._momentum_thr = conf.get('momentum_threshold', 0.3)
+        self._near_high_w = conf.get('near_high_weight', 0)
+        self._near_high_ratio = abs(conf.get('near_high_threshold', -1)) / 100
+        self._trend_w = conf.get('trend_reversal_weight', 0)
+        # 비활성화된 지표는 가중치 0 으로 취급
+        self._williams_w = conf.get('williams_weight', 0) if conf.get('williams_enabled', True) else 0
+        self._stochastic_w = conf.get('stochastic_weight', 0) if conf.get('stochastic_enabled', True) else 0
+        self._macd_w = conf.get('macd_weight', 0) if conf.get('macd_enabled', True) else 0
         
     def check_buy_signal(
-        self, symbol: str, df_1m: pd.DataFrame, df_15m: pd.DataFrame
+        self, symbol: str, df_1m: pd.DataFrame, df_15m: Optional[pd.DataFrame] = None
     ) -> Tuple[bool, float]:
         """점수 기반 매수 신호 확인
 
+        df_15m 은 데이터 충분 여부 확인에만 쓰이며, None 이면 해당 확인을 생략한다.
+
         Returns:
             Tuple[bool, float]: (매수 신호 여부, 계산된 점수)
         """
-        if len(df_1m) < 20 or len(df_15m) < 20:
+        if len(df_1m) < 20 or (df_15m is not None and len(df_15m) < 20):
             return False, 0.0
 
         score = self._calculate_score(symbol, df_1m)
-        buy_conf = self.settings.get('buy_score', {})
-        thresholds = buy_conf.get('score_thresholds', {})
-        threshold = thresholds.get(symbol, buy_conf.get('score_threshold', 0))
+        threshold = self._score_thresholds.get(symbol, self._score_threshold)
 
         # 점수와 임계값을 항상 기록하여 디버깅에 활용한다
         self.logger.info(f"{symbol} 매수 점수 {score} / {threshold}")
@@ -49,91 +89,103 @@ class OneMinStrategy:
         return score >= threshold, score
 
     def _calculate_score(self, symbol: str, df_1m: pd.DataFrame) -> float:
-        conf = self.settings.get('buy_score', {})
         score = 0
+        n = len(df_1m)
+        # 라벨 인덱싱 대신 필요한 열을 한 번만 ndarray 로 꺼내 위치로 참조
+        close = df_1m['close'].to_numpy(dtype=np.float64)
+        volume = df_1m['volume'].to_numpy(dtype=np.float64)
+
+        # 단기 급락이면 점수가 0 이므로 체결/호가 등 네트워크 조회 전에 먼저 판정
+        use_momentum = self._momentum_w > 0 and n > 4
+        if use_momentum:
+            change = (close[-1] / close[-4] - 1) * 100
+            if change < self._momentum_thr and change <= -self._momentum_thr:
+                return 0
 
         # 1. 체결강도
-        if conf.get('strength_weight', 0) > 0:
+        if self._strength_w > 0:
             trades = self.exchange.get_recent_trades(symbol, count=100)
             if trades:
-                buy_vol = sum(t['trade_volume'] for t in trades if t['ask_bid'] == 'BID')
-                sell_vol = sum(t['trade_volume'] for t in trades if t['ask_bid'] == 'ASK')
-                strength = (buy_vol / sell_vol * 100) if sell_vol else 0
-                if strength >= conf.get('strength_threshold', 130):
-                    score += conf['strength_weight']
-                elif strength >= conf.get('strength_threshold_low', 110):
-                    score += conf['strength_weight'] / 2
+                strength = calculate_trade_strength(trades)
+                if strength >= self._strength_thr:
+                    score += self._strength_w
+                elif strength >= self._strength_thr_low:
+                    score += self._strength_w / 2
 
         # 2. 실시간 거래량 급증
-        if conf.get('volume_spike_weight', 0) > 0 and len(df_1m) > 5:
-            recent_vol = df_1m['volume'].iloc[-1]
-            avg_vol = df_1m['volume'].iloc[-6:-1].mean()
+        if self._volume_w > 0 and n > 5:
+            recent_vol = volume[-1]
+            avg_vol = volume[-6:-1].mean()
             if avg_vol:
-                if recent_vol >= avg_vol * (conf.get('volume_spike_threshold', 200) / 100):
-                    score += conf['volume_spike_weight']
-                elif recent_vol >= avg_vol * (conf.get('volume_spike_threshold_low', 150) / 100):
-                    score += conf['volume_spike_weight'] / 2
+                if recent_vol >= avg_vol * self._volume_ratio:
+                    score += self._volume_w
+                elif recent_vol >= avg_vol * self._volume_ratio_low:
+                    score += self._volume_w / 2
 
         # 3. 호가 잔량 불균형
-        if conf.get('orderbook_weight', 0) > 0:
+        if self._orderbook_w > 0:
             ob = self.exchange.get_orderbook(symbol)
             if ob:
                 bid = float(ob.get('total_bid_size', 0))
                 ask = float(ob.get('total_ask_size', 0))
-                if ask and (bid / ask * 100) >= conf.get('orderbook_threshold', 130):
-                    score += conf['orderbook_weight']
-
-        # 4. 단기 등락률
-        if conf.get('momentum_weight', 0) > 0 and len(df_1m) > 4:
-            change = (df_1m['close'].iloc[-1] / df_1m['close'].iloc[-4] - 1) * 100
-            if change >= conf.get('momentum_threshold', 0.3):
-                score += conf['momentum_weight']
-            elif change <= -conf.get('momentum_threshold', 0.3):
-                return 0
+                if ask and (bid / ask * 100) >= self._orderbook_thr:
+                    score += self._orderbook_w
+
+        # 4. 단기 등락률 (급락 감점은 위에서 먼저 처리)
+        if use_momentum and change >= self._momentum_thr:
+            score += self._momentum_w
 
         # 5. 전고점 근접 여부
-        if conf.get('near_high_weight', 0) > 0:
+        if self._near_high_w > 0:
             day = self.exchange.get_ohlcv(symbol, 'day', 2)
             if day is not None and len(day) >= 2:
                 prev_high = max(day['high'].iloc[-2], day['high'].iloc[-1])
-                price = df_1m['close'].iloc[-1]
-                if prev_high and abs(price - prev_high) / prev_high <= abs(conf.get('near_high_threshold', -1)) / 100:
-                    score += conf['near_high_weight']
+                price = close[-1]
+                if prev_high and abs(price - prev_high) / prev_high <= self._near_high_ratio:
+                    score += self._near_high_w
 
         # 6. 추세 전환 징후
-        if conf.get('trend_reversal_weight', 0) > 0 and len(df_1m) > 16:
-            past_15 = df_1m['close'].iloc[-16]
-            past_5 = df_1m['close'].iloc[-6]
-            current = df_1m['close'].iloc[-1]
+        if self._trend_w > 0 and n > 16:
+            past_15 = close[-16]
+            past_5 = close[-6]
+            current = close[-1]
             if past_15 > current and current > past_5:
-                score += conf['trend_reversal_weight']
-
-        # 7. Williams %R
-        if conf.get('williams_weight', 0) > 0 and conf.get('williams_enabled', True) and len(df_1m) >= 14:
-            hh = df_1m['high'].iloc[-14:].max()
-            ll = df_1m['low'].iloc[-14:].min()
-            if hh != ll:
-                wr = (hh - df_1m['close'].iloc[-1]) / (hh - ll) * -100
-                if wr <= -80:
-                    score += conf['williams_weight']
+                score += self._trend_w
+
+        # 7~9. 보조지표는 사용하는 항목이 있을 때만 한 번에 계산해 공유한다
+        use_williams = self._williams_w > 0 and n >= 14
+        use_stochastic = self._stochastic_w > 0 and n >= 14
+        if use_williams or use_stochastic:
+            high = df_1m['high'].to_numpy(dtype=np.float64)
+            low = df_1m['low'].to_numpy(dtype=np.float64)
+            # 확정된 봉은 바뀌지 않으므로 마지막 봉이 같으면 직전 결과를 그대로 사용
+            key = (df_1m.index[-1], close[-1], high[-1], low[-1])
+            cached = self._indicator_cache.get(symbol)
+            if cached is not None and cached[0] == key:
+                ind = cached[1]
+            else:
+                ind = calculate_score_indicators(high, low, close, macd=False)
+                self._indicator_cache[symbol] = (key, ind)
+
+        # 7. Williams %R (고가 == 저가이면 nan 이므로 조건 불충족)
+        if use_williams:
+            if ind['williams_r'] <= -80:
+                score += self._williams_w
 
         # 8. Stochastic
-        if conf.get('stochastic_weight', 0) > 0 and conf.get('stochastic_enabled', True) and len(df_1m) >= 14:
-            lowest = df_1m['low'].rolling(14).min()
-            highest = df_1m['high'].rolling(14).max()
-            k = (df_1m['close'] - lowest) / (highest - lowest) * 100
-            d = k.rolling(3).mean()
-            if k.iloc[-1] < 20 and d.iloc[-1] < 20:
-                score += conf['stochastic_weight']
+        if use_stochastic:
+            if ind['stoch_k'] < 20 and ind['stoch_d'] < 20:
+                score += self._stochastic_w
 
         # 9. MACD
-        if conf.get('macd_weight', 0) > 0 and conf.get('macd_enabled', True):
-            ema12 = df_1m['close'].ewm(span=12).mean()
-            ema26 = df_1m['close'].ewm(span=26).mean()
-            macd = ema12 - ema26
-            signal = macd.ewm(span=9).mean()
-            if macd.iloc[-1] > signal.iloc[-1] and macd.iloc[-2] <= signal.iloc[-2]:
-                score += conf['macd_weight']
+        if self._macd_w > 0:
+            # 매 틱 전체 구간을 다시 계산하지 않고 새로 확정된 봉만 누적 반영
+            state = self._macd_states.get(symbol)
+            if state is None:
+                state = self._macd_states[symbol] = StreamingMACD()
+            macd = state.update(df_1m.index.to_numpy(), close)
+            if macd['macd'] > macd['macd_signal'] and macd['macd_prev'] <= macd['macd_signal_prev']:
+                score += self._macd_w
 
         return score
     
@@ -166,4 +218,6 @@ class OneMinStrategy:
     def remove_position(self, symbol: str):
         """포지션 정보 제거"""
         if symbol in self.positions:
-            del self.positions[symbol] 
\ No newline at end of file
+            del self.positions[symbol]
+        self._macd_states.pop(symbol, None)
+        self._indicator_cache.pop(symbol, None) 
\ No newline at end of file
@@ -9,11 +9,13 @@ os.environ.setdefault("EVENTLET_NO_GREENDNS", "yes")
 # eventlet 대신 threading 모드를 강제한다
 os.environ.setdefault("SOCKETIO_ASYNC_MODE", "threading")
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 from flask_socketio import SocketIO, emit
 import flask.cli
 import click
 import json
+import numpy as np
+from copy import deepcopy
 from datetime import datetime
 import logging
 from config.logging_config import setup_logging
@@ -22,11 +24,72 @@ from dotenv import load_dotenv
 
 from core.market_analyzer import MarketAnalyzer
 from core.config_manager import ConfigManager
+from core import json_utils
 import threading
 import time
-from config.default_settings import DEFAULT_SETTINGS  # 기본 설정 불러오기
+# get_default_settings 는 아래 /api/default_settings 뷰 함수 이름과 겹치므로 별칭으로 가져온다
+from config.default_settings import DEFAULT_SETTINGS, get_default_settings as _copy_default_settings  # 기본 설정 불러오기
 from core.constants import DEFAULT_COIN_SELECTION
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 Socket.IO 는 기본 JSON 직렬화 사용
+    msgpack = None
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:  # Flask 2.2 미만에는 JSON provider 가 없다
+    DefaultJSONProvider = None
+
+
+if orjson is not None and DefaultJSONProvider is not None:
+    class ORJSONProvider(DefaultJSONProvider):
+        """jsonify/request.json 을 orjson 으로 처리하는 JSON provider"""
+
+        _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+else:
+    ORJSONProvider = None
+
+
+def _json_bytes(obj):
+    """스트리밍 응답 조각용 JSON 직렬화 (bytes)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def stream_json(chunks):
+    """JSON 조각을 생성하는 제너레이터를 그대로 흘려보내는 응답
+
+    전체 응답 문자열을 메모리에 만들지 않고 항목 단위로 직렬화해서 전송한다.
+    """
+    return Response(stream_with_context(chunks), mimetype='application/json')
+
+
+def _iter_json_array(items):
+    yield b'['
+    for i, item in enumerate(items):
+        yield (b',' if i else b'') + _json_bytes(item)
+    yield b']'
+
+
+def _iter_json_object(pairs):
+    yield b'{'
+    for i, (key, value) in enumerate(pairs):
+        yield (b',' if i else b'') + _json_bytes(str(key)) + b':' + _json_bytes(value)
+    yield b'}'
+
 # .env 파일 로드
 dotenv_path = Path(__file__).resolve().parents[1] / '.env'
 load_dotenv(dotenv_path)
@@ -36,6 +99,15 @@ app = Flask(__name__,
     static_folder='../static'
 )
 app.config['SECRET_KEY'] = 'secret!'
+if ORJSONProvider is not None:
+    app.json = ORJSONProvider(app)
+
+# Socket.IO 패킷 직렬화 방식
+# msgpack 은 JSON 보다 작고 빠르지만 브라우저도 socket.io-msgpack-parser 를 써야 하므로
+# SOCKETIO_SERIALIZER=msgpack 으로 지정했을 때만 사용한다
+SOCKETIO_SERIALIZER = os.environ.get("SOCKETIO_SERIALIZER", "default").lower()
+if SOCKETIO_SERIALIZER == "msgpack" and msgpack is None:
+    SOCKETIO_SERIALIZER = "default"
 
 # Socket.IO 초기화
 # eventlet을 사용하여 안정적인 웹소켓 통신을 보장한다
@@ -43,10 +115,12 @@ socketio = SocketIO(
     app,
     cors_allowed_origins="*",
     async_mode=os.environ.get("SOCKETIO_ASYNC_MODE", "eventlet"),
+    serializer=SOCKETIO_SERIALIZER,
     logger=True,
     engineio_logger=True,
     ping_timeout=60,   # 기본값보다 넉넉하게 설정하여 타임아웃 방지
-    ping_interval=60
+    ping_interval=60,
+    compression_threshold=512  # 512바이트 이상 패킷은 압축 (기본값 1024)
 )
 
 # 로깅 설정
@@ -113,83 +187,42 @@ def initialize_monitoring():
     except Exception as e:
         logger.error(f"모니터링 파일 확인 실패: {str(e)}")
 
-# 설정 파일 경로
-CONFIG_FILE = 'config.json'
-
-def load_config():
-    """설정 파일 로드"""
-    try:
-        logger.info("설정 파일 로드 시작...")
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
-        logger.info(f"설정 파일 경로: {config_path}")
-        
-        # 설정 파일 존재 여부 확인
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                logger.info("설정 파일 로드 성공")
-                
-                # 필수 섹션 확인 및 보완
-                required_sections = ['trading', 'notifications', 'market_analysis', 'buy_score']
-                default_config = get_default_config()
-                
-                for section in required_sections:
-                    if section not in config:
-                        logger.warning(f"필수 섹션 누락: {section}, 기본값으로 보완합니다.")
-                        config[section] = default_config[section]
-                
-                return config
-            except json.JSONDecodeError as e:
-                logger.error(f"설정 파일 JSON 파싱 오류: {str(e)}")
-                return None
-            except Exception as e:
-                logger.error(f"설정 파일 읽기 오류: {str(e)}")
-                return None
-        else:
-            logger.warning("설정 파일이 없습니다. 기본 설정을 생성합니다.")
-            default_config = get_default_config()
-            
-            # 설정 파일 디렉토리 생성
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            
-            # 기본 설정 저장
-            try:
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_config, f, indent=4, ensure_ascii=False)
-                logger.info("기본 설정 파일 생성 완료")
-                return default_config
-            except Exception as e:
-                logger.error(f"기본 설정 파일 생성 실패: {str(e)}")
-                return None
-                
-    except Exception as e:
-        logger.error(f"설정 파일 로드 중 오류 발생: {str(e)}")
-        return None
-
-def save_config(config):
-    """설정 파일 저장"""
-    try:
-        config_path = os.path.abspath('config.json')
-        logger.info(f"설정 파일 저장 경로: {config_path}")
-        
-        # 임시 파일에 먼저 저장
-        temp_path = config_path + '.tmp'
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
-            logger.info("임시 파일에 설정 저장 완료")
-        
-        # 성공적으로 저장되면 원본 파일 교체
-        os.replace(temp_path, config_path)
-        logger.info(f"설정 파일 저장 완료: {config_path}")
-    except Exception as e:
-        logger.error(f"설정 파일 저장 중 오류 발생: {str(e)}")
-        raise
-
 def get_default_config():
     """기본 설정값 반환"""
-    # 기본 설정 모듈에서 값을 복사하여 반환한다.
-    return DEFAULT_SETTINGS.copy()
+    # 호출 측에서 수정해도 DEFAULT_SETTINGS 가 바뀌지 않도록 깊은 복사본을 반환한다.
+    return _copy_default_settings()
+
+def apply_default_settings():
+    """기본 설정을 ConfigManager 로 저장하고 MarketAnalyzer 에 반영한 뒤 적용된 설정 반환"""
+    config_manager.update_config(get_default_config())
+    settings = config_manager.get_config()
+    market_analyzer.update_config(settings)
+    return settings
+
+def settings_diff(old, new):
+    """두 설정 dict 를 비교해 바뀐 값만 같은 중첩 구조로 반환 (삭제된 키는 None)"""
+    diff = {}
+    for key, value in new.items():
+        prev = old.get(key)
+        if isinstance(value, dict) and isinstance(prev, dict):
+            child = settings_diff(prev, value)
+            if child:
+                diff[key] = child
+        elif key not in old or prev != value:
+            diff[key] = value
+    for key in old.keys() - new.keys():
+        diff[key] = None
+    return diff
+
+def broadcast_settings_patch(old, new):
+    """설정 변경분만 settings_patch 이벤트로 브로드캐스트
+
+    전체 설정(1~2KB) 대신 바뀐 항목만 보내므로 값 하나를 고친 경우 패킷이 훨씬 작다.
+    """
+    patch = settings_diff(old, new)
+    if patch:
+        socketio.emit('settings_patch', patch)
+    return patch
 
 def validate_config(config):
     """설정 유효성 검사"""
@@ -290,19 +323,84 @@ def config_equals(config1, config2):
     except Exception:
         return False
 
+# 페이지 템플릿에는 요청마다 달라지는 값이 없으므로 처음 렌더링한 HTML 을 재사용한다.
+# 템플릿을 수정하며 확인하는 디버그 모드에서는 매번 렌더링한다.
+_RENDERED_PAGES = {}
+
+def render_page(template_name):
+    """정적 페이지 템플릿 렌더링 (결과 캐시)"""
+    if app.debug:
+        return render_template(template_name)
+    html = _RENDERED_PAGES.get(template_name)
+    if html is None:
+        html = _RENDERED_PAGES[template_name] = render_template(template_name)
+    return html
+
 @app.route('/')
 def index():
     """통합된 메인 페이지"""
-    return render_template('index.html')
+    return render_page('index.html')
 
 @app.route('/dashboard')
 def dashboard():
-    return render_template('dashboard.html')
+    return render_page('dashboard.html')
 
 @app.route('/settings')
 def settings():
     """설정 페이지"""
-    return render_template('settings.html')
+    return render_page('settings.html')
+
+@app.route('/logs')
+def logs():
+    """로그 페이지"""
+    return render_page('logs.html')
+
+LOG_TAIL_LINES = 100
+LOG_TAIL_CHUNK = 8192
+
+def _current_log_file():
+    """루트 로거의 파일 핸들러가 기록 중인 로그 파일 경로"""
+    for handler in logging.getLogger().handlers:
+        path = getattr(handler, 'baseFilename', None)
+        if path:
+            return path
+    return None
+
+def tail_lines(path, count=LOG_TAIL_LINES):
+    """파일 끝에서부터 블록 단위로 거꾸로 읽어 마지막 count 줄 반환
+
+    파일 전체를 읽지 않으므로 로그 파일 크기와 관계없이 수 KB 만 읽는다.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b''
+        # 마지막 줄 끝의 개행을 제외하고 count 개의 줄 경계가 보일 때까지 읽는다
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(LOG_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode('utf-8', errors='replace').splitlines()
+    return lines[-count:]
+
+@app.route('/api/logs', methods=['GET'])
+def get_logs():
+    """최근 로그 조회 API"""
+    try:
+        log_file = _current_log_file()
+        lines = tail_lines(log_file) if log_file and os.path.exists(log_file) else []
+        return jsonify({
+            'status': 'success',
+            'data': {'logs': lines}
+        })
+    except Exception as e:
+        error_msg = f"로그 조회 실패: {str(e)}"
+        logger.error(error_msg)
+        return jsonify({
+            'status': 'error',
+            'message': error_msg
+        }), 500
 
 @app.route('/api/settings', methods=['GET'])
 def get_settings():
@@ -313,8 +411,8 @@ def get_settings():
         
         if not settings:
             logger.info("기존 설정 파일이 없어 기본 설정을 사용합니다.")
-            settings = get_default_config()
-            market_analyzer.save_settings(settings)
+            apply_default_settings()
+            settings = market_analyzer.get_settings()
         
         return jsonify({
             'success': True,
@@ -327,14 +425,49 @@ def get_settings():
             'error': str(e)
         }), 500
 
+# DEFAULT_SETTINGS 는 실행 중 바뀌지 않으므로 기본 설정 응답 본문을 한 번만 직렬화한다
+_DEFAULT_SETTINGS_RESPONSE = _json_bytes({'success': True, 'data': DEFAULT_SETTINGS})
+
+@app.route('/api/settings/export', methods=['GET'])
+def export_settings():
+    """현재 설정 내보내기 API (pretty=1 이면 들여쓰기해서 반환)
+
+    설정 파일은 공백 없이 저장하므로 사람이 읽을 설정은 이 API 로 받는다.
+    """
+    try:
+        settings = config_manager.get_config()
+        if request.args.get('pretty') == '1':
+            body = json_utils.dumps_pretty(settings)
+        else:
+            body = json_utils.dumps(settings)
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        logger.error(f"설정 내보내기 오류: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/default_settings', methods=['GET'])
 def get_default_settings():
     """기본 설정 반환 API"""
+    return Response(_DEFAULT_SETTINGS_RESPONSE, mimetype='application/json')
+
+@app.route('/api/settings/reset', methods=['POST'])
+def reset_settings():
+    """설정 초기화 API (기본 설정으로 되돌린다)"""
     try:
-        return jsonify({'success': True, 'data': get_default_config()})
+        logger.info("[정보] 설정 초기화 요청 받음")
+        previous = deepcopy(config_manager.get_config())
+        settings = apply_default_settings()
+        broadcast_settings_patch(previous, settings)
+        return jsonify({
+            'success': True,
+            'message': '설정이 초기화되었습니다.'
+        })
     except Exception as e:
-        logger.error(f"기본 설정 조회 오류: {str(e)}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error(f"[오류] 설정 초기화 중 오류 발생: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
 @app.route('/api/settings', methods=['POST'])
 def save_settings():
@@ -372,8 +505,11 @@ def save_settings():
             
         # 설정 저장
         try:
+            previous = deepcopy(current_settings)
             config_manager.update_config(new_settings)
-            market_analyzer.update_config(config_manager.get_config())
+            saved_settings = config_manager.get_config()
+            market_analyzer.update_config(saved_settings)
+            broadcast_settings_patch(previous, saved_settings)
             return jsonify({
                 'success': True,
                 'message': '설정이 성공적으로 저장되었습니다.'
@@ -446,11 +582,14 @@ def save_sell_settings():
 def get_holdings():
     """현재 보유 중인 코인 정보 조회"""
     try:
-        holdings = market_analyzer.get_holdings()
-        return jsonify({
-            'status': 'success',
-            'data': holdings
-        })
+        holdings = market_analyzer.get_holdings() or {}
+
+        def generate():
+            yield b'{"status":"success","data":'
+            yield from _iter_json_object(holdings.items())
+            yield b'}'
+
+        return stream_json(generate())
     except Exception as e:
         logger.error(f"보유 코인 조회 중 오류 발생: {str(e)}")
         return jsonify({
@@ -741,8 +880,9 @@ def handle_initial_data():
         monitored_coins = market_analyzer.get_monitored_coins()
         if monitored_coins:
             coin_data = []
+            infos = market_analyzer.get_market_infos([coin['market'] for coin in monitored_coins])
             for coin in monitored_coins:
-                info = market_analyzer.get_market_info(coin['market'])
+                info = infos.get(coin['market'])
                 if info:
                     coin_data.append({
                         'market': coin['market'],
@@ -778,29 +918,40 @@ def send_monitoring_update():
         # 모니터링 중인 코인 정보 조회 (선정된 상위 코인만)
         monitored = market_analyzer.get_monitored_coins()
         markets = [c['market'] for c in monitored]
+        infos = market_analyzer.get_market_infos(markets)
+        rows = [(market, infos[market]) for market in markets if infos.get(market)]
         coin_data = []
-        
-        for market in markets:
-            try:
-                market_info = market_analyzer.get_market_info(market)
-                if market_info:
-                    # 시장 점수 계산
-                    score = market_analyzer.calculate_market_score(
-                        trend_strength=market_info.get('signed_change_rate', 0),
-                        volatility=market_info.get('acc_trade_price_24h', 0) / market_info.get('acc_trade_price', 1),
-                        volume_ratio=market_info.get('acc_trade_volume_24h', 0) / market_info.get('acc_trade_volume', 1),
-                        market_dominance=market_info.get('market_cap', 0) / market_info.get('total_market_cap', 1)
-                    )
-                    
-                    coin_data.append({
-                        'market': market,
-                        'current_price': market_info.get('trade_price', 0),
-                        'change_rate': market_info.get('signed_change_rate', 0) * 100,
-                        'volume': market_info.get('acc_trade_volume_24h', 0),
-                        'market_score': score
-                    })
-            except Exception as e:
-                logger.error(f"{market} 데이터 처리 중 오류: {str(e)}")
+
+        if rows:
+            # 시장 점수는 코인별 값을 배열로 모아 한 번에 계산
+            def column(key, default):
+                return np.array([info.get(key, default) for _, info in rows], dtype=float)
+
+            change_rate = column('signed_change_rate', 0)
+            trade_price = column('acc_trade_price', 1)
+            trade_volume = column('acc_trade_volume', 1)
+            total_market_cap = column('total_market_cap', 1)
+            valid = (trade_price != 0) & (trade_volume != 0) & (total_market_cap != 0)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = market_analyzer.calculate_market_scores(
+                    trend_strength=change_rate,
+                    volatility=column('acc_trade_price_24h', 0) / trade_price,
+                    volume_ratio=column('acc_trade_volume_24h', 0) / trade_volume,
+                    market_dominance=column('market_cap', 0) / total_market_cap
+                )
+
+            for (market, market_info), ok, score in zip(rows, valid, scores):
+                if not ok:
+                    logger.error(f"{market} 데이터 처리 중 오류: 거래대금/거래량 기준값이 0입니다")
+                    continue
+                coin_data.append({
+                    'market': market,
+                    'current_price': market_info.get('trade_price', 0),
+                    'change_rate': market_info.get('signed_change_rate', 0) * 100,
+                    'volume': market_info.get('acc_trade_volume_24h', 0),
+                    'market_score': float(score)
+                })
         
         # 분석 결과 전송
         socketio.emit('market_analysis', {
@@ -926,7 +1077,7 @@ def init_bot_status():
         # 초기 설정 로드 및 검증
         current_settings = market_analyzer.get_settings()
         if not current_settings:
-            current_settings = DEFAULT_SETTINGS.copy()
+            current_settings = get_default_config()
             market_analyzer.save_settings(current_settings)
             logger.info("기본 설정이 적용되었습니다.")
         
@@ -948,8 +1099,8 @@ def init_bot_status():
 def validate_settings_structure(settings):
     """설정 구조의 유효성을 검사하고 누락된 섹션을 보완합니다."""
     try:
-        # 기본 설정 복사
-        validated_settings = DEFAULT_SETTINGS.copy()
+        # 기본 설정 복사 (병합 과정에서 중첩 dict 를 수정하므로 깊은 복사)
+        validated_settings = get_default_config()
         
         # 받은 설정을 재귀적으로 병합
         def merge_settings(default, new):
@@ -983,17 +1134,17 @@ def get_monitored_coins():
     try:
         logger.info("모니터링 코인 목록 조회 API 호출")
         coins = market_analyzer.get_monitored_coins()
-        logger.debug(f"모니터링 코인 데이터: {json.dumps(coins, ensure_ascii=False)}")
-        
-        response = {
-            'status': 'success',
-            'data': {
-                'coins': coins,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"모니터링 코인 데이터: {json.dumps(coins, ensure_ascii=False)}")
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        def generate():
+            yield b'{"status":"success","data":{"coins":'
+            yield from _iter_json_array(coins)
+            yield b',"timestamp":' + _json_bytes(timestamp) + b'}}'
+
         logger.info(f"모니터링 코인 {len(coins)}개 응답")
-        return jsonify(response)
+        return stream_json(generate())
         
     except Exception as e:
         error_msg = f"모니터링 코인 목록 조회 실패: {str(e)}"